@@ -0,0 +1,85 @@
+"""
+Shared fixtures: small synthetic vehicles built in memory.
+
+EN:
+    `make_problem` builds a deterministic random requirement set and module
+    library with every penalty in play (tight zone budgets, latency
+    budgets, redundant modules, optional traffic demands). With
+    `symmetric`, all zones are identical and unpositioned and features may
+    use any zone, so every zone permutation is a symmetry.
+
+TR:
+    `make_problem`, her cezanın devrede olduğu (sıkı zon bütçeleri,
+    gecikme bütçeleri, yedekli modüller, isteğe bağlı trafik talepleri)
+    deterministik rastgele bir gereksinim seti ve modül kütüphanesi kurar.
+    `symmetric` ile tüm zonlar özdeş ve konumsuzdur, özellikler her zonu
+    kullanabilir; böylece her zon permütasyonu bir simetridir.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Tuple
+
+import pytest
+
+from zac.compiler.model import Feature, Module, ModuleLibrary, RequirementSet, TrafficDemand, Zone
+
+
+def _make_problem(
+    features: int = 12,
+    zones: int = 6,
+    modules: int = 6,
+    seed: int = 0,
+    traffic: bool = False,
+    positioned: bool = True,
+    symmetric: bool = False,
+) -> Tuple[RequirementSet, ModuleLibrary]:
+    rng = random.Random(seed)
+    zone_list = [
+        Zone(
+            name=f"Z{z}",
+            max_power_kw=rng.choice([0.8, 1.5, 3.0]),
+            latency_budget_ms=rng.choice([None, 2.5, 10.0]),
+            position=(rng.uniform(0.0, 4.0), rng.uniform(0.0, 2.0)) if positioned and z % 4 else None,
+        )
+        for z in range(zones)
+    ]
+    if positioned:
+        zone_list[0].position = (0.0, 0.0)
+    if symmetric:
+        zone_list = [Zone(name=f"Z{z}", max_power_kw=1.5, latency_budget_ms=10.0) for z in range(zones)]
+    feature_list = [
+        Feature(
+            id=f"F{f}",
+            name=f"Feature {f}",
+            zone_candidates=[] if symmetric else rng.sample([z.name for z in zone_list], k=min(zones, rng.randint(1, 3))),
+        )
+        for f in range(features)
+    ]
+    module_list = [
+        Module(
+            id=f"M{m}",
+            name=f"Module {m}",
+            cost=10.0 + 4 * m,
+            max_power_kw=0.3 + 0.2 * m,
+            supported_features=sorted({f"F{rng.randrange(features)}" for _ in range(features // 2)}),
+            latency_class=rng.choice(["low", "medium"]),
+            redundancy=rng.choice([1, 1, 2]),
+        )
+        for m in range(modules)
+    ]
+    for f in range(features):
+        module_list[f % modules].supported_features.append(f"F{f}")
+    demands = (
+        [TrafficDemand(src=f"F{f}", dst=f"F{(f + 3) % features}", mbps=rng.choice([5.0, 40.0])) for f in range(features)]
+        if traffic
+        else []
+    )
+    requirements = RequirementSet(vehicle_name="test", zones=zone_list, features=feature_list, traffic=demands)
+    return requirements, ModuleLibrary(modules=module_list)
+
+
+@pytest.fixture
+def make_problem() -> Callable[..., Tuple[RequirementSet, ModuleLibrary]]:
+    return _make_problem
@@ -0,0 +1,58 @@
+"""
+Admissibility of the score bounds against the exact scorer.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from zac.compiler.bounds import Bounder
+from zac.compiler.model import Feature, Module, RequirementSet, Zone
+from zac.compiler.search import SearchSpace
+
+
+@pytest.mark.parametrize("traffic", [False, True])
+@pytest.mark.parametrize("positioned", [True, False])
+@pytest.mark.parametrize("seed", range(4))
+def test_bounds_are_admissible(make_problem, seed, traffic, positioned):
+    space = SearchSpace.from_problem(*make_problem(seed=seed, traffic=traffic, positioned=positioned))
+    bounds = space.bounds()
+    root = bounds.root().total
+    rng = random.Random(seed)
+    for _ in range(60):
+        assignment = [rng.randrange(len(domain)) for domain in space.domains]
+        score = space.score(assignment).score
+        assert bounds.score_bound(assignment) >= score - 1e-9
+        assert root <= -score + 1e-9
+
+
+def test_bound_on_a_single_option_space_is_tight_for_cost(make_problem):
+    space = SearchSpace.from_problem(*make_problem(features=1, zones=1, modules=1, seed=0))
+    bounds = space.bounds()
+    candidate = space.score([0])
+    assert bounds.score_bound([0]) >= candidate.score
+    assert bounds.root().total >= candidate.total_cost - 1e-9
+
+
+def test_a_feature_without_options_makes_the_bound_infinite():
+    requirements = RequirementSet(vehicle_name="test", zones=[Zone(name="A", max_power_kw=1.0)], features=[])
+    module = Module(id="M", name="M", cost=10.0, max_power_kw=0.5)
+    bounds = Bounder(requirements, [[(module, requirements.zones[0])], []])
+    assert bounds.root().total == math.inf
+
+
+def test_duplicate_zone_names_resolve_like_the_builder():
+    # The builder links by zone name and takes the first zone of a name
+    zones = [
+        Zone(name="A", max_power_kw=5.0, position=(9.0, 0.0)),
+        Zone(name="B", max_power_kw=5.0, position=(10.0, 0.0)),
+        Zone(name="A", max_power_kw=5.0, position=(0.0, 0.0)),
+    ]
+    features = [Feature(id="F", name="F"), Feature(id="G", name="G")]
+    module = Module(id="M", name="M", cost=10.0, max_power_kw=0.5, supported_features=["F", "G"])
+    requirements = RequirementSet(vehicle_name="test", zones=zones, features=features)
+    space = SearchSpace(requirements, features, [[(module, zones[0])], [(module, zones[1])]])
+    assert space.bounds().score_bound([0, 0]) == pytest.approx(space.score([0, 0]).score)
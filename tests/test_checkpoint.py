@@ -0,0 +1,97 @@
+"""
+Checkpoints: save/load round trip, resumed state and input fingerprints.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from zac.compiler import checkpoint, generator, scorer
+from zac.compiler.search import SearchSpace, run_portfolio
+
+STRATEGIES = ["greedy", "anneal", "ga"]
+
+
+def _baseline(requirements, modules):
+    return scorer.select_best(scorer.score_candidates(generator.generate_candidates(requirements, modules)))
+
+
+def test_resume_restores_the_saved_state(make_problem, tmp_path):
+    requirements, modules = make_problem(features=40, zones=8, seed=6)
+    space = SearchSpace.from_problem(requirements, modules)
+    baseline = _baseline(requirements, modules)
+    path = tmp_path / "search.ckpt"
+    first = run_portfolio(
+        space,
+        baseline,
+        STRATEGIES,
+        time_limit_s=0.4,
+        seed=5,
+        archive_size=8,
+        checkpoint=lambda state: checkpoint.save(path, space, state),
+    )
+    assert not first.exhausted
+
+    # A fresh space for the same problem, as in a new process
+    space = SearchSpace.from_problem(requirements, modules)
+    saved = checkpoint.load(path, space)
+    assert saved.strategies == STRATEGIES and saved.seed == 5
+    assert saved.incumbent["evaluations"] > 0 and len(saved.incumbent["archive"]) == 8
+
+    # With the budget already spent, the resumed run restores the state and stops at once
+    captured = []
+    resumed = run_portfolio(
+        space,
+        baseline,
+        saved.strategies,
+        time_limit_s=saved.elapsed_s,
+        seed=saved.seed,
+        archive_size=saved.archive_size,
+        checkpoint=captured.append,
+        resume=saved,
+    )
+    state = captured[-1]
+    assert state.incumbent == saved.incumbent
+    assert state.initial == saved.initial
+    for restored, original in zip(state.workers, saved.workers):
+        assert restored["rng"] == original["rng"]
+        assert restored["iterations"] == original["iterations"] > 0
+        assert restored.keys() == original.keys()
+    assert list(resumed.assignment) == list(saved.incumbent["assignment"])
+    assert resumed.best.score == pytest.approx(first.best.score)
+    assert resumed.archive == sorted(saved.incumbent["archive"], reverse=True)
+    assert resumed.evaluations == saved.incumbent["evaluations"]
+
+
+def test_fingerprint_tracks_the_problem_not_the_object(make_problem, tmp_path):
+    requirements, modules = make_problem(seed=2)
+    space = SearchSpace.from_problem(requirements, modules)
+    digest = space.fingerprint()
+    assert SearchSpace.from_problem(*make_problem(seed=2)).fingerprint() == digest
+    assert SearchSpace.from_problem(*make_problem(seed=3)).fingerprint() != digest
+
+    space.weights = replace(scorer.DEFAULT_WEIGHTS, power=1.0)
+    assert space.fingerprint() != digest
+    space.weights = None
+    assert space.fingerprint() == digest
+
+    modules.modules[0].cost += 1.0
+    assert SearchSpace.from_problem(requirements, modules).fingerprint() != digest
+
+
+def test_load_rejects_a_checkpoint_of_another_problem(make_problem, tmp_path):
+    requirements, modules = make_problem(seed=1)
+    space = SearchSpace.from_problem(requirements, modules)
+    path = tmp_path / "search.ckpt"
+    run_portfolio(
+        space, _baseline(requirements, modules), ["greedy"], time_limit_s=0.1,
+        checkpoint=lambda state: checkpoint.save(path, space, state),
+    )
+    other = SearchSpace.from_problem(requirements, modules)
+    other.weights = replace(scorer.DEFAULT_WEIGHTS, harness=2.0)
+    with pytest.raises(ValueError, match="different requirements, modules or weights"):
+        checkpoint.load(path, other)
+    with pytest.raises(ValueError, match="does not exist"):
+        checkpoint.load(tmp_path / "missing.ckpt", space)
@@ -0,0 +1,177 @@
+"""
+Compile option validation: search-only flags are rejected instead of dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+from zac import cli
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+def _compile(monkeypatch, tmp_path, *flags):
+    argv = [
+        "zac",
+        "compile",
+        str(EXAMPLES / "sample_requirements.json"),
+        str(EXAMPLES / "sample_modules.json"),
+        "--output",
+        str(tmp_path / "out.json"),
+        *flags,
+    ]
+    monkeypatch.setattr(sys, "argv", argv)
+    cli.main()
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        ["--gap", "0.01"],
+        ["--store", "candidates"],
+        ["--checkpoint", "search.ckpt"],
+        ["--decompose"],
+        ["--surrogate", "0.25"],
+        ["--strategies", "ga"],
+        ["--seed", "3"],
+    ],
+)
+def test_search_options_require_a_search(monkeypatch, tmp_path, capsys, flags):
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, *flags)
+    assert f"{flags[0]} requires --time-limit" in capsys.readouterr().err
+    assert not (tmp_path / "out.json").exists()
+
+
+@pytest.mark.parametrize("flags", [["--workers", "2"], ["--max-cluster-size", "4"]])
+@pytest.mark.parametrize("search", [[], ["--time-limit", "0.2s"]])
+def test_decompose_options_require_decompose(monkeypatch, tmp_path, capsys, flags, search):
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, *search, *flags)
+    assert f"{flags[0]} requires --decompose" in capsys.readouterr().err
+    assert not (tmp_path / "out.json").exists()
+
+
+def test_resume_rejects_other_strategies(monkeypatch, tmp_path, capsys):
+    checkpoint = tmp_path / "search.ckpt"
+    _compile(monkeypatch, tmp_path, "--time-limit", "0.2s", "--strategies", "greedy", "--checkpoint", str(checkpoint))
+    assert checkpoint.exists()
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, "--resume", str(checkpoint), "--strategies", "ga")
+    assert "cannot be combined with --resume" in capsys.readouterr().err
+    _compile(monkeypatch, tmp_path, "--resume", str(checkpoint))
+
+
+@pytest.mark.parametrize("text, seconds", [("500ms", 0.5), ("2", 2.0), ("1m", 60.0), ("0", 0.0)])
+def test_research_time_is_a_duration(text, seconds):
+    args = cli._build_parser().parse_args(["sweep", "r.json", "m.json", "s.json", "--research-time", text])
+    assert args.research_time == seconds
+
+
+def test_inspect_reports_a_missing_store(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(sys, "argv", ["zac", "inspect", str(tmp_path / "missing")])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert "is not a candidate store" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("flags", [[], ["--decompose"]])
+def test_search_reports_the_score_bound(monkeypatch, tmp_path, capsys, flags):
+    _compile(monkeypatch, tmp_path, "--time-limit", "0.2s", *flags)
+    output = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+    metrics = output["metrics"]
+    assert metrics["score_bound"] >= output["score"] - 1e-9
+    assert metrics["optimality_gap"] >= 0.0
+    assert "optimality gap" in capsys.readouterr().err
+
+
+def test_surrogate_reports_its_accuracy(monkeypatch, tmp_path, capsys):
+    _compile(monkeypatch, tmp_path, "--time-limit", "0.2s", "--surrogate", "0.25")
+    assert "Surrogate: " in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "flags, message",
+    [
+        (["--surrogate", "0"], "--surrogate must be a fraction in (0, 1]"),
+        (["--surrogate", "0.5", "--strategies", "greedy"], "--surrogate only screens the ga strategy"),
+        (["--surrogate", "0.5", "--decompose"], "--surrogate cannot be combined with --decompose"),
+    ],
+)
+def test_surrogate_options_are_validated(monkeypatch, tmp_path, capsys, flags, message):
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, "--time-limit", "0.2s", *flags)
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (None, "does not exist"),
+        (b"\x80\x04\x95", "is not a readable checkpoint"),
+        (b"", "is not a readable checkpoint"),
+        (pickle.dumps({"version": 0}), "is not a version"),
+    ],
+)
+def test_resume_reports_unusable_checkpoints(monkeypatch, tmp_path, capsys, content, message):
+    path = tmp_path / "search.ckpt"
+    if content is not None:
+        path.write_bytes(content)
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, "--resume", str(path))
+    assert message in capsys.readouterr().err
+    assert not (tmp_path / "out.json").exists()
+
+
+def test_resume_reports_a_checkpoint_of_another_problem(monkeypatch, tmp_path, capsys):
+    path = tmp_path / "search.ckpt"
+    _compile(monkeypatch, tmp_path, "--time-limit", "0.2s", "--strategies", "greedy", "--checkpoint", str(path))
+    monkeypatch.setattr(sys, "argv", [
+        "zac", "compile", str(EXAMPLES / "sample_requirements.json"), str(EXAMPLES / "sample_modules.json"),
+        "--restrict-zones", "--resume", str(path), "--output", str(tmp_path / "other.json"),
+    ])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert "different requirements, modules or weights" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "strategies, message",
+    [
+        ("foo", "Unknown search strategy: foo"),
+        ("greedy,bar,baz", "Unknown search strategies: bar, baz"),
+        (",", "--strategies needs at least one strategy"),
+    ],
+)
+def test_unknown_strategies_are_rejected(monkeypatch, tmp_path, capsys, strategies, message):
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, "--time-limit", "1s", "--strategies", strategies)
+    err = capsys.readouterr().err
+    assert message in err
+    assert "(available: anneal, ga, greedy, native)" in err
+    assert not (tmp_path / "out.json").exists()
+
+
+@pytest.mark.parametrize("flags", [["--workers", "0"], ["--max-cluster-size", "-1"]])
+def test_decompose_limits_must_be_positive(monkeypatch, tmp_path, capsys, flags):
+    with pytest.raises(SystemExit):
+        _compile(monkeypatch, tmp_path, "--time-limit", "0.2s", "--decompose", *flags)
+    assert f"{flags[0]} must be at least 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("command", ["compile", "coordinate"])
+def test_unknown_safety_levels_are_reported(monkeypatch, tmp_path, capsys, command):
+    requirements = json.loads((EXAMPLES / "sample_requirements.json").read_text(encoding="utf-8"))
+    requirements["features"][0]["safety_level"] = "ASIL-X"
+    (tmp_path / "requirements.json").write_text(json.dumps(requirements), encoding="utf-8")
+    argv = ["zac", command, str(tmp_path / "requirements.json"), str(EXAMPLES / "sample_modules.json")]
+    monkeypatch.setattr(sys, "argv", [*argv, "--output", str(tmp_path / "out.json")])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert f"Feature '{requirements['features'][0]['id']}' has unknown safety_level 'ASIL-X'" in capsys.readouterr().err
@@ -0,0 +1,142 @@
+"""
+Problem decomposition: cluster separation, coupling budgets, size cuts and exact merged scores.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from zac.compiler import generator, loader, scorer
+from zac.compiler.model import Feature, Module, ModuleLibrary, RequirementSet, Zone
+from zac.compiler.propagation import propagate
+from zac.compiler.search import SearchSpace
+from zac.graph.decomposition import boundary_pairs, decompose, polish, repair, solve_decomposed
+
+
+def _space(requirements, modules):
+    return SearchSpace.from_problem(requirements, modules, matrix=propagate(requirements, modules, restrict_zones=True))
+
+
+def _regions(regions: int = 3, per_region: int = 4, seed: int = 0):
+    """
+    Every region has a tight zone of its own; all features may also use one
+    roomy shared zone, which can never be overloaded.
+    """
+    rng = random.Random(seed)
+    zones = [Zone(name=f"R{r}", max_power_kw=1.0) for r in range(regions)]
+    zones.append(Zone(name="Shared", max_power_kw=100.0))
+    features = [
+        Feature(id=f"F{r}_{i}", name=f"F{r}_{i}", zone_candidates=[f"R{r}", "Shared"])
+        for r in range(regions)
+        for i in range(per_region)
+    ]
+    modules = [
+        Module(
+            id=f"M{m}",
+            name=f"M{m}",
+            cost=5.0 + 3 * m,
+            max_power_kw=0.2 + 0.15 * m,
+            supported_features=[f.id for f in features if rng.random() < 0.6],
+        )
+        for m in range(4)
+    ]
+    for f, feature in enumerate(features):
+        modules[f % len(modules)].supported_features.append(feature.id)
+    requirements = RequirementSet(vehicle_name="test", zones=zones, features=features)
+    return requirements, ModuleLibrary(modules=modules)
+
+
+def _cluster_zones(space, cluster):
+    return {zone.name for f in cluster.features for _, zone in space.domains[f]}
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_clusters_only_share_uncontested_zones(seed):
+    space = _space(*_regions(seed=seed))
+    parts = decompose(space)
+    assert "Shared" not in parts.contested_zones
+    assert not parts.coupling_zones
+    assert len(parts.clusters) == 3
+    assert sorted(f for c in parts.clusters for f in c.features) == list(range(len(space.features)))
+    for a, b in zip(parts.clusters, parts.clusters[1:]):
+        assert _cluster_zones(space, a) & _cluster_zones(space, b) == {"Shared"}
+
+
+@pytest.mark.parametrize("max_cluster_size", [2, 4, 8])
+@pytest.mark.parametrize("seed", range(4))
+def test_cuts_respect_max_cluster_size_and_split_budgets(make_problem, seed, max_cluster_size):
+    space = _space(*make_problem(features=24, zones=6, seed=seed))
+    parts = decompose(space, max_cluster_size=max_cluster_size)
+    assert max(len(c.features) for c in parts.clusters) <= max_cluster_size
+    assert parts.coupling_zones
+    caps = {z.name: z.max_power_kw for z in space.requirements.zones}
+    for name in parts.coupling_zones:
+        assert name in parts.contested_zones
+        budgets = [c.zone_budgets[name] for c in parts.clusters if name in c.zone_budgets]
+        assert len(budgets) > 1
+        assert math.fsum(budgets) == pytest.approx(caps[name])
+
+    # Apart from the coupling zones, contested zones are still never shared between clusters
+    for name in set(parts.contested_zones) - set(parts.coupling_zones):
+        users = [c for c in parts.clusters if name in _cluster_zones(space, c)]
+        assert len(users) <= 1
+
+
+def _exact(space, assignment):
+    return scorer.score_candidates([space.build(assignment)], weights=space.weights)[0]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_repair_and_polish_keep_exact_scores(make_problem, seed):
+    space = _space(*make_problem(features=16, zones=6, seed=seed))
+    rng = random.Random(seed)
+    assignment = [rng.randrange(len(d)) for d in space.domains]
+    repaired = repair(space, assignment)
+    assert space.score(repaired).score == _exact(space, repaired).score
+    assert _exact(space, repaired).penalties["power"] < _exact(space, assignment).penalties["power"]
+    polished = polish(space, repaired)
+    assert _exact(space, polished).score >= _exact(space, repaired).score
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_decomposed_scores_the_rebuilt_candidate_exactly(workers):
+    requirements, modules = _regions(regions=3, per_region=5, seed=4)
+    space = _space(requirements, modules)
+    baseline = scorer.select_best(scorer.score_candidates(generator.generate_candidates(requirements, modules)))
+    result, parts = solve_decomposed(space, baseline, time_limit_s=1.0, seed=1, workers=workers, max_cluster_size=4)
+    assert len(parts.clusters) > 1
+    rebuilt = _exact(space, list(result.assignment))
+    assert result.best.score == rebuilt.score
+    assert result.best.penalties == rebuilt.penalties
+    assert result.best.score >= space.score(space.project(baseline)).score
+    assert result.best.penalties["power"] == 0.0
+
+
+def test_boundary_pair_moves_reach_the_sample_optimum():
+    examples = Path(__file__).resolve().parent.parent / "examples"
+    requirements = loader.load_requirements(examples / "sample_requirements.json")
+    modules = loader.load_module_library(examples / "sample_modules.json")
+    space = SearchSpace.from_problem(requirements, modules)
+    parts = decompose(space)
+    assert boundary_pairs(space, parts) == [(0, 1), (1, 2)]
+
+    # Camera and radar share a harness link: only moving both to Rear pays off
+    stuck = polish(space, [0, 0, 0])
+    assert stuck == [0, 0, 0]
+    assert polish(space, stuck, pairs=boundary_pairs(space, parts)) == [2, 2, 0]
+
+    baseline = scorer.select_best(scorer.score_candidates(generator.generate_candidates(requirements, modules)))
+    result, _ = solve_decomposed(space, baseline, time_limit_s=1.0, workers=1)
+    assert result.optimality_gap == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize("options", [{"workers": 0}, {"max_cluster_size": 0}])
+def test_solve_decomposed_rejects_empty_limits(make_problem, options):
+    requirements, modules = make_problem(seed=1)
+    space = _space(requirements, modules)
+    with pytest.raises(ValueError):
+        solve_decomposed(space, space.build([0] * len(space.domains)), time_limit_s=0.1, **options)
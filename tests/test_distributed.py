@@ -0,0 +1,178 @@
+"""
+Distributed search: settled searches stop handing out shards, lost shards are requeued.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from zac.compiler import distributed, generator, loader, scorer
+from zac.compiler.search import SearchSpace, run_portfolio
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES = ROOT / "examples"
+
+
+def _sample():
+    return (
+        json.loads((EXAMPLES / "sample_requirements.json").read_text(encoding="utf-8")),
+        json.loads((EXAMPLES / "sample_modules.json").read_text(encoding="utf-8")),
+    )
+
+
+def _problem_data(features: int = 40, zones: int = 6, modules: int = 6, seed: int = 0):
+    rng = random.Random(seed)
+    zone_names = [f"Z{z}" for z in range(zones)]
+    requirements = {
+        "vehicle": {
+            "name": "test",
+            "zones": [{"name": name, "max_power_kw": rng.choice([1.5, 3.0])} for name in zone_names],
+        },
+        "features": [
+            {"id": f"F{f}", "zone_candidates": rng.sample(zone_names, k=rng.randint(1, 3))}
+            for f in range(features)
+        ],
+    }
+    library = {
+        "modules": [
+            {
+                "id": f"M{m}",
+                "cost": 10.0 + 4 * m,
+                "max_power_kw": 0.3 + 0.2 * m,
+                "supported_features": sorted(
+                    {f"F{rng.randrange(features)}" for _ in range(features // 2)}
+                    | {f"F{f}" for f in range(m, features, modules)}
+                ),
+            }
+            for m in range(modules)
+        ]
+    }
+    return requirements, library
+
+
+def _coordinator(requirements_data, modules_data, **options):
+    space = SearchSpace.from_problem(
+        loader.parse_requirements(requirements_data), loader.parse_module_library(modules_data)
+    )
+    options.setdefault("strategies", ["greedy", "anneal"])
+    return distributed.Coordinator(space, requirements_data, modules_data, **options)
+
+
+def _serve_with_threads(coordinator, workers: int = 2):
+    threads = []
+
+    def _start(address):
+        for i in range(workers):
+            thread = threading.Thread(target=distributed.run_worker, args=(address, f"w{i}"), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+    result = coordinator.serve("tcp://127.0.0.1:0", progress_interval_s=0.1, on_listen=_start)
+    for thread in threads:
+        thread.join(timeout=10.0)
+    return result
+
+
+@pytest.mark.parametrize("shard_by", ["seed", "prefix"])
+def test_exhausted_shards_end_the_search(shard_by):
+    requirements_data, modules_data = _sample()
+    coordinator = _coordinator(
+        requirements_data, modules_data, time_limit_s=60.0, shard_time_s=5.0, shard_by=shard_by, shards=4
+    )
+    result = _serve_with_threads(coordinator)
+    assert result.exhausted
+    assert result.optimality_gap == 0.0
+    assert result.elapsed_s < 10.0
+    # Each prefix is searched once, plus at most one shard per worker cut short by the stop
+    prefixes = distributed.prefix_combinations(coordinator.space, 4) if shard_by == "prefix" else [[]]
+    assert result.iterations["shards"] <= len(prefixes) + 2
+    assert coordinator.next_shard("late") is None
+
+    requirements = loader.parse_requirements(requirements_data)
+    modules = loader.parse_module_library(modules_data)
+    baseline = scorer.select_best(scorer.score_candidates(generator.generate_candidates(requirements, modules)))
+    reference = run_portfolio(coordinator.space, baseline, ["greedy"], time_limit_s=10.0)
+    assert reference.exhausted
+    assert result.best.score == pytest.approx(reference.best.score)
+
+
+def test_gap_target_stops_handing_out_shards():
+    requirements_data, modules_data = _problem_data()
+    coordinator = _coordinator(requirements_data, modules_data, time_limit_s=60.0, shard_time_s=0.5, gap=1.0)
+    result = _serve_with_threads(coordinator)
+    assert not result.exhausted
+    assert result.elapsed_s < 10.0
+    assert result.iterations["shards"] <= 2
+    assert result.optimality_gap <= 1.0
+    assert result.lower_bound >= coordinator.space.bounds().root().total
+
+
+def test_negative_gap_is_rejected():
+    with pytest.raises(ValueError, match="must not be negative"):
+        _coordinator(*_sample(), time_limit_s=1.0, shard_time_s=1.0, gap=-0.1)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_a_killed_worker_has_its_shard_requeued(tmp_path):
+    requirements_data, modules_data = _problem_data(seed=3)
+    coordinator = _coordinator(requirements_data, modules_data, time_limit_s=6.0, shard_time_s=2.0, heartbeat_s=5.0)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    workers = {}
+
+    def _start(address):
+        for name in ("victim", "survivor"):
+            workers[name] = subprocess.Popen(
+                [sys.executable, "-m", "zac", "worker", "--connect", address, "--name", name],
+                cwd=ROOT,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        threading.Thread(target=_kill_mid_shard, daemon=True).start()
+
+    killed = []
+
+    def _kill_mid_shard():
+        # Wait until both workers hold a shard, then kill one without a goodbye
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            with coordinator._lock:
+                owners = {owner for _, owner in coordinator._outstanding.values()}
+            if {"victim", "survivor"} <= owners:
+                workers["victim"].send_signal(signal.SIGKILL)
+                killed.append(True)
+                return
+            time.sleep(0.02)
+
+    try:
+        result = coordinator.serve(f"unix:{tmp_path / 'zac.sock'}", progress_interval_s=0.2, on_listen=_start)
+    finally:
+        for process in workers.values():
+            process.kill()
+            process.wait()
+
+    assert killed
+    assert workers["victim"].returncode == -signal.SIGKILL
+    assert result.iterations["reassigned"] >= 1
+    assert result.iterations["shards"] >= 2  # the requeued shard was completed by the survivor
+
+    # The best candidate is a full-space assignment of the problem the workers rebuilt
+    space = SearchSpace.from_problem(
+        loader.parse_requirements(requirements_data), loader.parse_module_library(modules_data)
+    )
+    assert space.fingerprint() == coordinator.problem["fingerprint"]
+    assert len(result.assignment) == len(space.domains)
+    assert all(0 <= o < len(d) for o, d in zip(result.assignment, space.domains))
+    assert result.best.score == space.score(result.assignment).score
+    assert result.best.penalties == space.score(result.assignment).penalties
@@ -0,0 +1,77 @@
+"""
+Conformance of the native local search with its Python reference.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from zac.compiler.search import Incumbent, SearchSpace
+from zac.optimizer import local_search
+
+
+def _random_assignments(space: SearchSpace, count: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield [rng.randrange(len(domain)) for domain in space.domains]
+
+
+def test_evaluate_matches_scorer_without_traffic(make_problem):
+    space = SearchSpace.from_problem(*make_problem(seed=1))
+    problem = local_search.encode(space)
+    for assignment in _random_assignments(space, 200, seed=1):
+        assert local_search.evaluate(problem, assignment) == space.score(assignment).score
+
+
+def test_reference_is_deterministic(make_problem):
+    space = SearchSpace.from_problem(*make_problem(seed=2))
+    problem = local_search.encode(space)
+    initial = [0] * len(space.domains)
+    first = local_search.local_search_reference(problem, initial, 500, threads=2, seed=7)
+    second = local_search.local_search_reference(problem, initial, 500, threads=2, seed=7)
+    assert first == second
+    assert [score for score, _ in first] == sorted((score for score, _ in first), reverse=True)
+    for score, assignment in first:
+        assert local_search.evaluate(problem, assignment) == score
+
+
+@pytest.mark.skipif(not local_search.native_available(), reason="optimizer_core extension is not built")
+@pytest.mark.parametrize("threads", [1, 4])
+def test_native_matches_reference(make_problem, threads):
+    space = SearchSpace.from_problem(*make_problem(features=20, seed=3))
+    problem = local_search.encode(space)
+    initial = [0] * len(space.domains)
+    native = local_search.local_search(problem, initial, 2000, threads=threads, seed=11, top_k=8)
+    reference = local_search.local_search_reference(problem, initial, 2000, threads=threads, seed=11, top_k=8)
+    assert native == reference
+
+
+def test_native_strategy_registers_lazily():
+    # A fresh interpreter that never imports zac.optimizer, like a spawned worker
+    code = (
+        "from zac.compiler import search\n"
+        "assert 'native' not in search.STRATEGIES\n"
+        "from zac.compiler.loader import load_module_library, load_requirements\n"
+        "from pathlib import Path\n"
+        "space = search.SearchSpace.from_problem(load_requirements(Path('examples/sample_requirements.json')),"
+        " load_module_library(Path('examples/sample_modules.json')))\n"
+        "result = search.run_portfolio(space, space.score([0] * len(space.domains)), ['native'], 0.2)\n"
+        "assert result.best.score is not None\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
+
+
+def test_native_strategy_counts_only_scored_candidates(make_problem):
+    space = SearchSpace.from_problem(*make_problem(seed=4))
+    incumbent = Incumbent()
+    strategy = local_search.NativeStrategy(space, incumbent, seed=1)
+    strategy.start([0] * len(space.domains))
+    for _ in range(3):
+        strategy.step()
+    assert strategy.iterations >= 3 * 256
+    assert incumbent.evaluations + incumbent.duplicates <= 1 + 3 * strategy.top_k
@@ -0,0 +1,82 @@
+"""
+Network synthesis: media selection, overload and symmetry with traffic.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from zac.compiler import network, scorer
+from zac.compiler.model import TrafficDemand
+from zac.compiler.search import SearchSpace
+
+
+@pytest.mark.parametrize(
+    "load, medium, overload",
+    [(0.0, "CAN", 0.0), (0.35, "CAN", 0.0), (0.36, "CAN-FD", 0.0), (3.5, "CAN-FD", 0.0), (70.0, "Ethernet", 0.0), (100.0, "Ethernet", 30.0)],
+)
+def test_choose_medium_picks_cheapest_usable(load, medium, overload):
+    chosen, capacity, excess = network.choose_medium(load)
+    assert chosen == medium
+    assert capacity == dict(network.MEDIA)[medium]
+    assert excess == pytest.approx(overload)
+
+
+def test_overloaded_link_is_reported_and_penalized(make_problem):
+    requirements, modules = make_problem(features=4, zones=3, seed=0)
+    requirements.traffic = [TrafficDemand(src="F0", dst="F1", mbps=90.0), TrafficDemand(src="F2", dst="F3", mbps=0.1)]
+    space = SearchSpace.from_problem(requirements, modules)
+    rng = random.Random(0)
+    for _ in range(20):
+        assignment = [rng.randrange(len(domain)) for domain in space.domains]
+        candidate = space.score(assignment)
+        plan = candidate.network
+        hot = [s for s in plan.segments if s.load_mbps > 70.0]
+        assert hot and all(s.medium == "Ethernet" and s.overload_mbps == pytest.approx(s.load_mbps - 70.0) for s in hot)
+        assert candidate.penalties["bandwidth"] > 0.0
+        for segment in plan.segments:
+            assert segment.medium == network.choose_medium(segment.load_mbps)[0]
+        # Links take the medium of their bottleneck segment
+        access = {id(pm): plan.segments[i] for i, pm in enumerate(candidate.modules)}
+        for link in candidate.links:
+            route = [access[id(link.src)], access[id(link.dst)]] + [
+                s for s in plan.segments
+                if s.kind == "backbone" and {s.src, s.dst} == {link.src.zone.name, link.dst.zone.name}
+            ]
+            assert link.bandwidth_mbps == min(s.capacity_mbps for s in route)
+
+
+def test_light_traffic_has_no_bandwidth_penalty(make_problem):
+    requirements, modules = make_problem(features=4, zones=3, seed=0)
+    requirements.traffic = [TrafficDemand(src="F0", dst="F1", mbps=0.1)]
+    candidate = SearchSpace.from_problem(requirements, modules).score([0] * 4)
+    assert candidate.penalties["bandwidth"] == 0.0
+    assert {s.medium for s in candidate.network.segments} == {"CAN"}
+    assert all(link.medium == "CAN" for link in candidate.links)
+
+
+def test_traffic_disables_zone_symmetry(make_problem):
+    space = SearchSpace.from_problem(*make_problem(features=30, zones=8, seed=1, traffic=True, symmetric=True))
+    assert space.symmetry.order == 1
+    rng = random.Random(3)
+    seen = {}
+    for _ in range(200):
+        assignment = [rng.randrange(len(domain)) for domain in space.domains]
+        perm = list(range(8))
+        rng.shuffle(perm)
+        lookups = [{key: o for o, key in enumerate(keys)} for keys in space.symmetry.option_keys]
+        image = [
+            lookup.get((keys[o][0], perm[keys[o][1]]))
+            for lookup, keys, o in zip(lookups, space.symmetry.option_keys, assignment)
+        ]
+        for candidate in (assignment, image) if None not in image else (assignment,):
+            score = space.score(candidate).score
+            key = space.key(candidate)
+            assert seen.setdefault(key, score) == pytest.approx(score)
+
+
+def test_aggregate_demands_sums_per_pair():
+    traffic = [TrafficDemand(src="A", dst="B", mbps=1.0), TrafficDemand(src="A", dst="B", mbps=2.5), TrafficDemand(src="B", dst="A", mbps=1.0)]
+    assert network.aggregate_demands(traffic) == {("A", "B"): 3.5, ("B", "A"): 1.0}
@@ -0,0 +1,104 @@
+"""
+First-fit-decreasing placement: zone budgets, tie breaks and the capacity index.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from zac.compiler import generator, loader
+from zac.compiler.model import Module, Zone
+from zac.compiler.placement import CapacityIndex, first_fit_decreasing
+
+
+def _module(m: int, power_kw: float) -> Module:
+    return Module(id=f"M{m}", name=f"Module {m}", cost=10.0, max_power_kw=power_kw)
+
+
+def _loads(zones, options, chosen):
+    loads = {zone.name: 0.0 for zone in zones}
+    for feature_options, option in zip(options, chosen):
+        module, zone = feature_options[option]
+        loads[zone.name] += module.max_power_kw
+    return loads
+
+
+def test_ffd_stays_within_zone_budgets():
+    zones = [Zone(name="A", max_power_kw=2.0), Zone(name="B", max_power_kw=1.5), Zone(name="C", max_power_kw=1.5)]
+    powers = [0.4, 1.0, 0.6, 1.2, 0.2, 1.2]  # 4.6 kW into 5.0 kW; worst fit in input order would overrun
+    options = [[(_module(f, p), zone) for zone in zones] for f, p in enumerate(powers)]
+    chosen = first_fit_decreasing(zones, options)
+    loads = _loads(zones, options, chosen)
+    assert all(loads[zone.name] <= zone.max_power_kw + 1e-9 for zone in zones)
+
+
+def test_ffd_prefers_a_module_that_fits_and_minimizes_overrun_otherwise():
+    zones = [Zone(name="A", max_power_kw=1.0)]
+    big, small = _module(0, 1.5), _module(1, 0.5)
+    chosen = first_fit_decreasing(zones, [[(big, zones[0]), (small, zones[0])], [(big, zones[0])]])
+    # The 1.5 kW feature goes first and overruns; the other then falls back to its smallest overrun
+    assert chosen == [1, 0]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_generated_placements_respect_budgets_when_possible(make_problem, seed):
+    requirements, modules = make_problem(features=8, zones=6, seed=seed, symmetric=True)
+    for zone in requirements.zones:
+        zone.max_power_kw = 4.0  # ample: every feature fits, so no zone may overrun
+    placements = generator.power_aware_placements(requirements, modules)
+    loads = {zone.name: 0.0 for zone in requirements.zones}
+    for _, module, zone in placements:
+        loads[zone.name] += module.max_power_kw
+    assert all(load <= 4.0 + 1e-9 for load in loads.values())
+    assert placements == generator.power_aware_placements(requirements, modules)
+
+
+def test_ties_follow_preference_order():
+    zones = [Zone(name=f"Z{z}", max_power_kw=1.0) for z in range(4)]
+    module = _module(0, 0.1)
+    preference = [2, 0, 3, 1]
+    options = [[(module, zones[z]) for z in preference] for _ in range(6)]
+    chosen = first_fit_decreasing(zones, options)
+    assert [preference[c] for c in chosen] == [2, 0, 3, 1, 2, 0]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_capacity_index_matches_brute_force(seed):
+    rng = random.Random(seed)
+    zones = [Zone(name=f"Z{z}", max_power_kw=rng.choice([0.5, 1.0, 2.0])) for z in range(12)]
+    index = CapacityIndex(zones)
+    residual = [zone.max_power_kw for zone in zones]
+    for _ in range(300):
+        allowed_zones = rng.sample(range(12), 12 if rng.random() < 0.5 else rng.randint(1, 11))
+        allowed = {z: rank for rank, z in enumerate(allowed_zones)}
+        expected = max(allowed, key=lambda z: (residual[z], -allowed[z]))
+        assert index.best(allowed) == expected
+        power_kw = rng.choice([0.0, 0.25, 0.5])  # coarse steps keep exact ties around
+        index.take(expected, power_kw)
+        residual[expected] -= power_kw
+    assert index.residual == residual
+
+
+def test_hints_are_kept_while_the_hinted_zone_fits():
+    zones = [Zone(name="A", max_power_kw=1.0), Zone(name="B", max_power_kw=3.0)]
+    options = [[(_module(f, p), zone) for zone in zones] for f, p in enumerate([0.4, 0.5, 0.8, 0.3])]
+    # Without hints every feature goes to the roomier B
+    assert [options[f][c][1].name for f, c in enumerate(first_fit_decreasing(zones, options))] == ["B"] * 4
+    # Hinted features fill A largest first; the ones A can no longer fit move on
+    chosen = first_fit_decreasing(zones, options, hints=["A", "A", "A", None])
+    assert [options[f][c][1].name for f, c in enumerate(chosen)] == ["B", "B", "A", "B"]
+    chosen = first_fit_decreasing(zones, options, hints=["A", "A", None, None])
+    assert [options[f][c][1].name for f, c in enumerate(chosen)] == ["A", "A", "B", "B"]
+
+
+def test_sample_placement_keeps_the_radar_in_its_hinted_zone():
+    examples = Path(__file__).resolve().parent.parent / "examples"
+    requirements = loader.load_requirements(examples / "sample_requirements.json")
+    modules = loader.load_module_library(examples / "sample_modules.json")
+    placed = {f.id: z.name for f, _, z in generator.power_aware_placements(requirements, modules)}
+    hinted = {f.id: f.zone_hint for f in requirements.features if f.zone_hint}
+    assert hinted == {"FEAT_FRONT_CAM": "Front-Left", "FEAT_REAR_RADAR": "Rear"}
+    assert {fid: placed[fid] for fid in hinted} == hinted
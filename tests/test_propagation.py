@@ -0,0 +1,156 @@
+"""
+Constraint propagation: pruned pairs, forced-power fixpoint, reasons and relaxation.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from zac.compiler import loader
+from zac.compiler.model import Feature, Module, ModuleLibrary, RequirementSet, Zone
+from zac.compiler.propagation import propagate, relax
+from zac.compiler.search import SearchSpace
+
+
+def _problem(zones, features, modules):
+    return RequirementSet(vehicle_name="test", zones=zones, features=features), ModuleLibrary(modules=modules)
+
+
+def _module(mid, power_kw, *features):
+    return Module(id=mid, name=mid, cost=10.0, max_power_kw=power_kw, supported_features=list(features))
+
+
+def _options(matrix, feature_idx):
+    return {(matrix.modules[m].id, matrix.zones[z].name) for m, z in matrix.options(feature_idx)}
+
+
+def test_over_budget_and_under_asil_pairs_are_dropped():
+    requirements, modules = _problem(
+        [
+            Zone(name="A", max_power_kw=1.0, safety_level="ASIL-D"),
+            Zone(name="B", max_power_kw=3.0, safety_level="ASIL-A"),
+            Zone(name="C", max_power_kw=3.0),
+        ],
+        [Feature(id="F", name="F", safety_level="ASIL-B"), Feature(id="G", name="G")],
+        [_module("small", 0.5, "F", "G"), _module("big", 2.0, "F", "G")],
+    )
+    matrix = propagate(requirements, modules)
+    # F: B is rated below ASIL-B, big exceeds A; an unrated zone is not ruled out
+    assert _options(matrix, 0) == {("small", "A"), ("small", "C"), ("big", "C")}
+    assert _options(matrix, 1) == {("small", "A"), ("small", "B"), ("small", "C"), ("big", "B"), ("big", "C")}
+    assert matrix.initial_sizes == [6, 6]
+    assert not matrix.unsatisfiable
+
+
+def test_declared_zones_are_preferences_unless_restricted():
+    requirements, modules = _problem(
+        [Zone(name="A", max_power_kw=1.0), Zone(name="B", max_power_kw=1.0)],
+        [Feature(id="F", name="F", zone_hint="A", zone_candidates=["Nowhere"])],
+        [_module("m", 0.5, "F")],
+    )
+    preferred = propagate(requirements, modules)
+    assert _options(preferred, 0) == {("m", "A"), ("m", "B")}
+    assert preferred.warnings == ["Feature 'F' declares unknown zone(s): Nowhere."]
+
+    restricted = propagate(requirements, modules, restrict_zones=True)
+    assert _options(restricted, 0) == {("m", "A")}
+    assert restricted.warnings == preferred.warnings
+
+
+def test_forced_power_propagates_to_a_fixpoint():
+    requirements, modules = _problem(
+        [Zone(name="A", max_power_kw=1.0), Zone(name="B", max_power_kw=1.0), Zone(name="C", max_power_kw=1.0)],
+        [
+            Feature(id="F1", name="F1", zone_candidates=["A"]),  # forced: 0.6 kW in A
+            Feature(id="F2", name="F2", zone_candidates=["A", "B"]),  # A has 0.4 kW left -> forced into B
+            Feature(id="F3", name="F3", zone_candidates=["B", "C"]),  # B has 0.4 kW left -> forced into C
+            Feature(id="F4", name="F4", zone_candidates=["C"]),  # C has 0.4 kW left -> only the small module
+            Feature(id="F5", name="F5", zone_candidates=["B"]),  # B has 0.4 kW left -> nothing fits
+        ],
+        [
+            _module("m6", 0.6, "F1", "F2", "F3"),
+            _module("m5", 0.5, "F4", "F5"),
+            _module("m45", 0.45, "F5"),
+            _module("m3", 0.3, "F4"),
+        ],
+    )
+    matrix = propagate(requirements, modules, restrict_zones=True)
+    assert [_options(matrix, f) for f in range(4)] == [
+        {("m6", "A")},
+        {("m6", "B")},
+        {("m6", "C")},
+        {("m3", "C")},
+    ]
+    assert not any(matrix.rows[4])
+    (reason,) = matrix.unsatisfiable["F5"]
+    assert reason.startswith("power: no zone has enough residual budget after forced placements")
+    assert "from B, 0.40 kW left" in reason
+    assert list(matrix.unsatisfiable) == ["F5"]
+    assert not matrix.warnings  # no zone is overloaded at the fixpoint
+
+
+def test_unsatisfiable_features_get_precise_reasons():
+    requirements, modules = _problem(
+        [Zone(name="A", max_power_kw=1.0, safety_level="ASIL-B"), Zone(name="B", max_power_kw=2.0, safety_level="QM")],
+        [
+            Feature(id="orphan", name="orphan"),
+            Feature(id="lost", name="lost", zone_candidates=["X", "Y"]),
+            Feature(id="critical", name="critical", safety_level="ASIL-D"),
+            Feature(id="hungry", name="hungry"),
+        ],
+        [_module("m", 0.5, "lost", "critical"), _module("heater", 5.0, "hungry")],
+    )
+    matrix = propagate(requirements, modules, restrict_zones=True)
+    assert matrix.unsatisfiable["orphan"] == ["no module in the library supports it"]
+    assert matrix.unsatisfiable["lost"] == ["none of its declared zones exist (X, Y)"]
+    assert matrix.unsatisfiable["critical"] == [
+        "candidate zones A (ASIL-B), B (QM) are rated below ASIL-D"
+    ]
+    assert matrix.unsatisfiable["hungry"] == ["power: heater (5.0 kW) exceed every candidate zone budget"]
+
+
+def test_relax_drops_only_the_failed_constraint():
+    zones = [
+        Zone(name="A", max_power_kw=1.0, safety_level="ASIL-B"),
+        Zone(name="B", max_power_kw=3.0, safety_level="ASIL-B"),
+    ]
+    features = [
+        Feature(id="lost", name="lost", zone_candidates=["X"]),
+        Feature(id="critical", name="critical", zone_candidates=["A"], safety_level="ASIL-D"),
+        Feature(id="hungry", name="hungry", zone_candidates=["A"]),
+    ]
+    requirements, modules = _problem(
+        zones, features, [_module("m", 0.5, "lost", "critical"), _module("heater", 2.0, "hungry")]
+    )
+
+    options, dropped = relax(requirements, modules, features[0], restrict_zones=True)
+    assert dropped == ["zones"]
+    assert {(m.id, z.name) for m, z in options} == {("m", "A"), ("m", "B")}
+
+    options, dropped = relax(requirements, modules, features[1], restrict_zones=True)
+    assert dropped == ["asil"]
+    assert {(m.id, z.name) for m, z in options} == {("m", "A")}  # the declared zone is kept
+
+    options, dropped = relax(requirements, modules, features[2], restrict_zones=True)
+    assert dropped == ["power"]
+    assert {(m.id, z.name) for m, z in options} == {("heater", "A")}  # not moved to B, where it fits
+
+    space = SearchSpace.from_problem(requirements, modules, matrix=propagate(requirements, modules, restrict_zones=True))
+    assert space.relaxed == {"lost": ["zones"], "critical": ["asil"], "hungry": ["power"]}
+    # As preferences, the declared zones do not empty any domain in the first place
+    assert SearchSpace.from_problem(requirements, modules).relaxed == {"critical": ["asil"]}
+
+
+def test_unknown_safety_levels_are_rejected_on_load():
+    data = {
+        "vehicle": {"zones": [{"name": "A", "max_power_kw": 1.0, "safety_level": "asil-c"}]},
+        "features": [{"id": "F", "zone_candidates": ["A"], "safety_level": "ASIL-E"}],
+    }
+    with pytest.raises(ValueError, match="Feature 'F' has unknown safety_level 'ASIL-E'"):
+        loader.parse_requirements(data)
+    data["features"][0]["safety_level"] = "B"
+    data["vehicle"]["zones"][0]["safety_level"] = "SIL-2"
+    with pytest.raises(ValueError, match="Zone 'A' has unknown safety_level 'SIL-2'"):
+        loader.parse_requirements(data)
+    data["vehicle"]["zones"][0]["safety_level"] = "asil-c"
+    assert loader.parse_requirements(data).features[0].safety_level == "B"
@@ -0,0 +1,57 @@
+"""
+Portfolio runner: deadline, baseline, exhaustion and idle strategies.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+
+import pytest
+
+from zac.compiler import generator, scorer
+from zac.compiler.propagation import propagate
+from zac.compiler.search import SearchSpace, run_portfolio
+
+
+def _baseline(requirements, modules):
+    return scorer.select_best(scorer.score_candidates(generator.generate_candidates(requirements, modules)))
+
+
+@pytest.mark.parametrize("strategies", [["greedy"], ["anneal"], ["ga"], ["greedy", "anneal", "ga"]])
+def test_portfolio_meets_deadline_and_beats_baseline(make_problem, strategies):
+    requirements, modules = make_problem(features=40, zones=8, seed=6)
+    space = SearchSpace.from_problem(requirements, modules)
+    baseline = _baseline(requirements, modules)
+    started = time.monotonic()
+    result = run_portfolio(space, baseline, strategies, time_limit_s=0.5, seed=3)
+    assert time.monotonic() - started < 0.5 + 0.5
+    assert not result.exhausted
+    assert result.best.score >= space.score(space.project(baseline)).score
+    assert result.best.score == pytest.approx(space.score(result.assignment).score)
+
+
+@pytest.mark.parametrize("gap", [None, 0.0])
+def test_small_space_is_exhausted_and_optimal(make_problem, gap):
+    requirements, modules = make_problem(features=5, zones=4, modules=3, seed=1)
+    space = SearchSpace.from_problem(requirements, modules, matrix=propagate(requirements, modules, restrict_zones=True))
+    optimum = max(
+        space.score(list(a)).score for a in itertools.product(*(range(len(d)) for d in space.domains))
+    )
+    started = time.monotonic()
+    result = run_portfolio(space, _baseline(requirements, modules), ["greedy", "anneal", "ga"], time_limit_s=20, seed=1, gap=gap)
+    assert time.monotonic() - started < 5.0
+    assert result.exhausted
+    assert result.best.score == pytest.approx(optimum)
+    assert result.optimality_gap == pytest.approx(0.0)
+
+
+def test_single_assignment_space_does_not_spin(make_problem):
+    requirements, modules = make_problem(features=3, zones=1, modules=1, seed=0)
+    space = SearchSpace.from_problem(requirements, modules)
+    assert space.size() == 1
+    started = time.monotonic()
+    result = run_portfolio(space, _baseline(requirements, modules), ["greedy", "anneal", "ga"], time_limit_s=10, seed=0)
+    assert time.monotonic() - started < 1.0
+    assert result.exhausted
+    assert result.evaluations == 1
@@ -0,0 +1,63 @@
+"""
+KD-tree zone index against a brute-force scan.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from zac.compiler.model import Zone
+from zac.compiler.spatial import ZoneIndex
+
+
+def _zones(count: int, seed: int):
+    rng = random.Random(seed)
+    return [
+        Zone(
+            name=f"Z{z}",
+            max_power_kw=rng.choice([0.5, 1.0, 2.0, 4.0]),
+            # A coarse grid produces equal distances, exercising the zone-index tie break
+            position=(float(rng.randrange(8)), float(rng.randrange(8))) if z % 7 else None,
+        )
+        for z in range(count)
+    ]
+
+
+def _brute(zones, residual, point, k, min_power_kw, allowed):
+    hits = [
+        ((point[0] - zone.position[0]) ** 2 + (point[1] - zone.position[1]) ** 2, z)
+        for z, zone in enumerate(zones)
+        if zone.position is not None
+        and residual[z] >= min_power_kw - 1e-9
+        and (allowed is None or z in allowed)
+    ]
+    return [z for _, z in sorted(hits)[:k]]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_and_take_match_brute_force(seed):
+    zones = _zones(60, seed)
+    index = ZoneIndex(zones)
+    residual = [zone.max_power_kw for zone in zones]
+    rng = random.Random(seed)
+    assert len(index) == sum(1 for zone in zones if zone.position is not None)
+    for _ in range(300):
+        point = (rng.uniform(-1.0, 8.0), rng.uniform(-1.0, 8.0))
+        k = rng.choice([1, 3, 10, len(zones)])
+        min_power_kw = rng.choice([0.0, 0.4, 1.5])
+        allowed = set(rng.sample(range(len(zones)), 20)) if rng.random() < 0.3 else None
+        expected = _brute(zones, residual, point, k, min_power_kw, allowed)
+        assert index.nearest(point, k=k, min_power_kw=min_power_kw, allowed=allowed) == expected
+        if expected and rng.random() < 0.5:
+            power_kw = rng.uniform(0.1, 1.0)
+            index.take(expected[0], power_kw)
+            residual[expected[0]] -= power_kw
+    assert index.residual == pytest.approx(residual)
+
+
+def test_nearest_without_positions_is_empty():
+    index = ZoneIndex([Zone(name="A", max_power_kw=1.0), Zone(name="B", max_power_kw=1.0)])
+    assert len(index) == 0
+    assert index.nearest((0.0, 0.0), k=2) == []
@@ -0,0 +1,126 @@
+"""
+Columnar candidate store: round trips, queries and column mappings.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from zac.compiler.search import SearchSpace
+from zac.compiler.store import CandidateStore
+
+
+def _candidates(make_problem, count, seed=0):
+    requirements, modules = make_problem(seed=seed)
+    space = SearchSpace.from_problem(requirements, modules)
+    rng = random.Random(seed)
+    candidates = [space.score([rng.randrange(len(d)) for d in space.domains]) for _ in range(count)]
+    return requirements, modules, space, candidates
+
+
+def _create(path, requirements, modules, space):
+    return CandidateStore.create(
+        path,
+        feature_ids=[f.id for f in space.features],
+        module_ids=[m.id for m in modules.modules],
+        zone_names=[z.name for z in requirements.zones],
+    )
+
+
+def _placements(candidate):
+    return sorted((fid, pm.module.id, pm.zone.name) for pm in candidate.modules for fid in pm.provided_features)
+
+
+def test_append_flush_and_reopen_round_trip(make_problem, tmp_path):
+    requirements, modules, space, candidates = _candidates(make_problem, 30)
+    writer = _create(tmp_path, requirements, modules, space)
+    writer.flush_every = 8
+    for candidate in candidates[:20]:
+        writer.append(candidate)
+    assert len(writer) == 16  # two automatic flushes, four rows still buffered
+    writer.flush()
+    assert len(writer) == 20
+
+    with _create(tmp_path, requirements, modules, space) as appender:  # same layout: reopened for appending
+        for candidate in candidates[20:]:
+            appender.append(candidate)
+    with CandidateStore.open(tmp_path) as reader:
+        assert len(reader) == 30
+        for row, candidate in enumerate(candidates):
+            assert sorted(reader.placements(row)) == _placements(candidate)
+            metrics = reader.row_metrics(row)
+            assert metrics["score"] == candidate.score
+            assert metrics["cost"] == candidate.total_cost
+            assert metrics["harness_length_m"] == sum(link.length_m or 0.0 for link in candidate.links)
+            for key in ("power", "harness", "latency", "redundancy", "bandwidth"):
+                assert metrics[key] == candidate.penalties.get(key, 0.0)
+
+
+def test_layout_mismatch_and_missing_store_are_rejected(make_problem, tmp_path):
+    requirements, modules, space, _ = _candidates(make_problem, 1)
+    _create(tmp_path, requirements, modules, space).close()
+    with pytest.raises(ValueError, match="different layout"):
+        CandidateStore.create(tmp_path, ["F0"], ["M0"], ["Z0"])
+    with pytest.raises(ValueError, match="not a candidate store"):
+        CandidateStore.open(tmp_path / "missing")
+
+
+def test_top_k_filters_and_histogram(make_problem, tmp_path):
+    requirements, modules, space, candidates = _candidates(make_problem, 200, seed=3)
+    with _create(tmp_path, requirements, modules, space) as writer:
+        for candidate in candidates:
+            writer.append(candidate)
+
+    with CandidateStore.open(tmp_path) as reader:
+        scores = [c.score for c in candidates]
+        best = sorted(range(len(scores)), key=lambda r: -scores[r])[:5]
+        assert [value for _, value in reader.top_k(5)] == [scores[r] for r in best]
+        cheapest = reader.top_k(3, by="cost", descending=False)
+        assert [value for _, value in cheapest] == sorted(c.total_cost for c in candidates)[:3]
+
+        limit = sorted(c.total_cost for c in candidates)[100]
+        expected = [r for r, c in enumerate(candidates) if c.penalties["power"] == 0 and c.total_cost < limit]
+        assert expected
+        assert list(reader.matching_rows(["power==0", f"cost<{limit}"])) == expected
+        filtered = reader.top_k(len(candidates), by="cost", filters=["power==0", f"cost<{limit}"])
+        assert sorted(row for row, _ in filtered) == expected
+
+        histogram = reader.histogram("cost", bins=4)
+        assert len(histogram) == 4
+        assert sum(count for _, _, count in histogram) == len(candidates)
+        assert histogram[0][0] == min(c.total_cost for c in candidates)
+        assert histogram[-1][1] == pytest.approx(max(c.total_cost for c in candidates))
+        filtered_hist = reader.histogram("score", bins=3, filters=["power==0"])
+        assert sum(count for _, _, count in filtered_hist) == sum(c.penalties["power"] == 0 for c in candidates)
+        assert reader.histogram("cost", filters=["cost<0"]) == []
+
+        with pytest.raises(ValueError, match="Invalid filter"):
+            list(reader.matching_rows(["cost<<3"]))
+        with pytest.raises(ValueError, match="Unknown metric"):
+            list(reader.matching_rows(["weight>1"]))
+
+
+def test_columns_are_mapped_once_and_remapped_after_growth(make_problem, tmp_path):
+    requirements, modules, space, candidates = _candidates(make_problem, 10)
+    store = _create(tmp_path, requirements, modules, space)
+    for candidate in candidates[:5]:
+        store.append(candidate)
+    store.flush()
+    for row in range(5):
+        store.placements(row)
+        store.row_metrics(row)
+    maps = {name: entry[1] for name, entry in store._maps.items()}
+    assert set(maps) == set(store.columns)
+    store.top_k(3)
+    assert {name: entry[1] for name, entry in store._maps.items()} == maps
+
+    for candidate in candidates[5:]:
+        store.append(candidate)
+    store.flush()
+    assert store.row_metrics(9)["score"] == candidates[9].score
+    assert store._maps["score"][1] is not maps["score"]
+    store.close()
+    assert not store._maps
+    assert maps["module_ids"].closed  # still current when closed; the grown columns' old maps died with their views
@@ -0,0 +1,67 @@
+"""
+Training, attachment and GA screening of the learned surrogate scorer.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from zac.compiler import generator
+from zac.compiler.search import GAStrategy, Incumbent, SearchSpace, run_portfolio
+from zac.compiler.surrogate import Surrogate
+
+
+def test_distance_rows_match_link_estimate(make_problem):
+    space = SearchSpace.from_problem(*make_problem(seed=3, traffic=True))
+    learned = Surrogate(space)
+    zones = space.requirements.zones
+    for a, zone in enumerate(zones):
+        assert learned._row(a) == [generator._estimate_link_length(zone, other) for other in zones]
+
+
+def test_learn_samples_once_trusted(make_problem):
+    space = SearchSpace.from_problem(*make_problem(seed=4))
+    learned = Surrogate(space, train_rate=0.25, seed=1)
+    rng = random.Random(4)
+    assignment = [rng.randrange(len(domain)) for domain in space.domains]
+    learned.learn(assignment, space.score(assignment).score)
+    assert learned.samples == 1
+
+    learned.trusted = True
+    for _ in range(400):
+        learned.learn(assignment, -1.0, x=learned.features(assignment))
+    assert 50 < learned.samples - 1 < 150
+
+
+@pytest.mark.parametrize("strategy, trains", [("greedy", False), ("anneal", False), ("ga", True)])
+def test_only_screening_strategies_train(make_problem, strategy, trains):
+    space = SearchSpace.from_problem(*make_problem(seed=5))
+    learned = Surrogate(space)
+    baseline = space.build([0] * len(space.domains))
+    run_portfolio(space, baseline, [strategy], time_limit_s=0.3, seed=1, surrogate=learned)
+    assert (learned.samples > 0) == trains
+
+
+def test_trusted_screening_skips_exact_evaluations(make_problem):
+    space = SearchSpace.from_problem(*make_problem(features=30, seed=6))
+    learned = Surrogate(
+        space, fraction=0.25, warmup=16, refit_every=16, min_rank_corr=0.0, audit_rate=0.0, seed=2
+    )
+    rng = random.Random(6)
+    for _ in range(64):
+        assignment = [rng.randrange(len(domain)) for domain in space.domains]
+        learned.learn(assignment, space.score(assignment).score)
+    assert learned.trusted
+
+    ga = GAStrategy(space, Incumbent(), seed=3)
+    ga.surrogate = ga.evaluator.surrogate = learned
+    ga.start([0] * len(space.domains))
+    before = ga.incumbent.evaluations
+    for _ in range(5):
+        ga.step()
+    # Every child the bound lets through is screened; only the kept ones are scored exactly
+    assert learned.skipped > 0
+    assert ga.incumbent.evaluations - before <= learned.screened - learned.skipped
+    assert learned.report().skipped == learned.skipped
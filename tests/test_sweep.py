@@ -0,0 +1,95 @@
+"""
+Sweep engine: cached re-scoring and which scenarios are searched again.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from zac.compiler import generator, scorer, search, sweep
+from zac.compiler.model import Feature, Module, ModuleLibrary, RequirementSet, Scenario, Zone
+
+
+def _population(requirements, modules, size, seed):
+    space = search.SearchSpace.from_problem(requirements, modules)
+    rng = random.Random(seed)
+    return [space.build([rng.randrange(len(d)) for d in space.domains]) for _ in range(size)]
+
+
+SCENARIOS = [
+    Scenario(name="base"),
+    Scenario(name="cheap", overrides={"module.M1.cost_scale": 0.5, "module.M3.cost": 1.0}),
+    Scenario(name="tight", overrides={"zone.Z0.max_power_kw": 0.2, "zone.Z2.max_power_kw": 0.5}),
+    Scenario(name="strict", overrides={"zone.Z1.latency_budget_ms": 0.01, "zone.Z3.latency_budget_ms": 0.5}),
+    Scenario(name="weights", overrides={"weights.power": 3.0, "weights.harness": 0.2, "weights.bandwidth": 7.0}),
+]
+
+
+@pytest.mark.parametrize("traffic", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_rescore_matches_full_scoring(make_problem, seed, traffic):
+    requirements, modules = make_problem(seed=seed, traffic=traffic)
+    cache = sweep.CandidateCache(requirements, modules, _population(requirements, modules, 12, seed))
+    for scenario in SCENARIOS:
+        params = cache.params(scenario)
+        scores, feasible = cache.rescore(params)
+        scenario_requirements, scenario_modules, weights = cache.apply(scenario)
+        for candidate, score, ok in zip(cache.candidates, scores, feasible):
+            full = scorer.score_candidates(
+                [sweep._rebind(candidate, scenario_requirements, scenario_modules)], weights=weights
+            )[0]
+            assert score == pytest.approx(full.score)
+            assert ok == (full.penalties["power"] <= 0.0)
+
+
+def test_only_scenarios_that_change_feasibility_are_researched(make_problem, monkeypatch):
+    requirements, modules = make_problem(seed=2)
+    cache = sweep.CandidateCache(requirements, modules, _population(requirements, modules, 24, 2))
+    scenarios = SCENARIOS + [
+        Scenario(name="roomy", overrides={f"zone.{z.name}.max_power_kw": 100.0 for z in requirements.zones}),
+    ]
+    _, base_feasible = cache.rescore(cache.params(Scenario(name="base")))
+    expected = [cache.rescore(cache.params(s))[1] != base_feasible for s in scenarios]
+    assert any(expected) and not all(expected)
+
+    calls = []
+    run_portfolio = search.run_portfolio
+
+    def _counting(space, baseline, **kwargs):
+        calls.append(space)
+        return run_portfolio(space, baseline, **kwargs)
+
+    monkeypatch.setattr(search, "run_portfolio", _counting)
+    results = sweep.run_sweep(cache, scenarios, research_time_s=0.05, strategies=["greedy"])
+    assert [r.researched for r in results] == expected
+    assert len(calls) == sum(expected)
+
+    results = sweep.run_sweep(cache, scenarios, research_time_s=0.0)
+    assert not any(r.researched for r in results)
+
+
+def test_pricing_apart_identical_modules_finds_the_cheaper_twin():
+    zones = [Zone(name="A", max_power_kw=5.0), Zone(name="B", max_power_kw=5.0)]
+    features = [Feature(id=f"F{f}", name=f"F{f}", zone_hint="A") for f in range(3)]
+    twins = [
+        Module(id=mid, name=mid, cost=100.0, max_power_kw=0.5, supported_features=[f.id for f in features])
+        for mid in ("X", "Y")
+    ]
+    requirements = RequirementSet(vehicle_name="test", zones=zones, features=features)
+    modules = ModuleLibrary(modules=twins)
+    baseline = scorer.select_best(scorer.score_candidates(generator.generate_candidates(requirements, modules)))
+    population = sweep.build_population(
+        requirements, modules, baseline, size=16, time_limit_s=0.2, strategies=["greedy"]
+    )
+    cache = sweep.CandidateCache(requirements, modules, population)
+    assert cache.module_classes == [[0, 1]]
+
+    pricier = Scenario(name="pricier", overrides={"module.X.cost_scale": 1.2})
+    assert cache.splits_symmetry(cache.params(pricier))
+    (result,) = sweep.run_sweep(cache, [pricier], research_time_s=0.5, strategies=["greedy", "anneal"])
+    assert result.researched
+    assert {module for _, module, _ in result.placements} == {"Y"}
+    both = Scenario(name="both", overrides={"module.X.cost_scale": 1.2, "module.Y.cost": 120.0})
+    assert not cache.splits_symmetry(cache.params(both))
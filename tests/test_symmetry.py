@@ -0,0 +1,74 @@
+"""
+Zone symmetry detection, canonical keys and symmetric deduplication.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import time
+
+import pytest
+
+from zac.compiler.search import Evaluator, Incumbent, SearchSpace
+
+
+def _image(space: SearchSpace, assignment, perm):
+    """Option indices of the zone-permuted image, or None if it left the (reduced) domains."""
+    image = []
+    for keys, option in zip(space.symmetry.option_keys, assignment):
+        module_class, zone = keys[option]
+        lookup = {key: o for o, key in enumerate(keys)}
+        image.append(lookup.get((module_class, perm[zone])))
+    return None if None in image else image
+
+
+def _random_images(space: SearchSpace, rng: random.Random, count: int):
+    zones = len(space.requirements.zones)
+    while count:
+        assignment = [rng.randrange(len(domain)) for domain in space.domains]
+        perm = list(range(zones))
+        rng.shuffle(perm)
+        image = _image(space, assignment, perm)
+        if image is not None:
+            count -= 1
+            yield assignment, image
+
+
+def test_many_identical_zones_stay_fast(make_problem):
+    started = time.perf_counter()
+    space = SearchSpace.from_problem(*make_problem(features=30, zones=12, symmetric=True))
+    info = space.symmetry
+    assert info.zone_classes == [list(range(12))]
+    assert info.order == 479001600  # 12!
+    rng = random.Random(0)
+    pairs = list(_random_images(space, rng, 200))
+    for assignment, image in pairs:
+        assert space.key(assignment) == space.key(image)
+    assert time.perf_counter() - started < 2.0
+
+
+def test_canonical_key_matches_brute_force_orbits(make_problem):
+    space = SearchSpace.from_problem(*make_problem(features=5, zones=4, modules=2, symmetric=True))
+    rng = random.Random(1)
+    samples = [[rng.randrange(len(domain)) for domain in space.domains] for _ in range(40)]
+    perms = list(itertools.permutations(range(4)))
+    for a in samples:
+        orbit = {tuple(image) for image in (_image(space, a, p) for p in perms) if image is not None}
+        for b in samples:
+            assert (space.key(a) == space.key(b)) == (tuple(b) in orbit)
+
+
+def test_symmetric_images_score_equal_and_are_evaluated_once(make_problem):
+    space = SearchSpace.from_problem(*make_problem(features=10, zones=6, seed=2, symmetric=True))
+    incumbent = Incumbent()
+    evaluator = Evaluator(space, incumbent, owner="test")
+    rng = random.Random(2)
+    pairs = [(a, b) for a, b in _random_images(space, rng, 30) if a != b]
+    for assignment, image in pairs:
+        assert space.score(assignment).score == pytest.approx(space.score(image).score)
+        evaluator.evaluate(assignment)
+        evaluations = incumbent.evaluations
+        assert evaluator.evaluate(image) == evaluator.evaluate(assignment)
+        assert incumbent.evaluations == evaluations
+    assert incumbent.duplicates >= 2 * len(pairs)
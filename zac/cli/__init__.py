@@ -19,12 +19,17 @@ TR:
 from __future__ import annotations
 
 import argparse
+import json
+import sys
 from pathlib import Path
 
-from zac.compiler import loader, generator, scorer
+from zac.compiler import checkpoint, distributed, loader, generator, model, propagation, scorer, search, store, surrogate, sweep
+from zac.graph import decomposition
 
+DEFAULT_STRATEGIES = "greedy,anneal,ga"
 
-def _add_compile_args(parser: argparse.ArgumentParser) -> None:
+
+def _add_input_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "requirements",
         type=Path,
@@ -41,6 +46,29 @@ def _add_compile_args(parser: argparse.ArgumentParser) -> None:
             "TR: Modül kütüphanesi JSON dosyasının yolu."
         ),
     )
+
+
+def _add_strategy_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--strategies",
+        default=None,
+        help=(
+            "EN: Comma-separated search strategies run concurrently (default: greedy,anneal,ga; "
+            "'native' uses the optimizer_core engine). "
+            "TR: Eşzamanlı çalışacak, virgülle ayrılmış arama stratejileri (varsayılan: greedy,anneal,ga; "
+            "'native' optimizer_core motorunu kullanır)."
+        ),
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="EN: Random seed for the search (default: 0). TR: Arama için rastgele tohum (varsayılan: 0).",
+    )
+
+
+def _add_compile_args(parser: argparse.ArgumentParser) -> None:
+    _add_input_args(parser)
     parser.add_argument(
         "-o",
         "--output",
@@ -51,6 +79,349 @@ def _add_compile_args(parser: argparse.ArgumentParser) -> None:
             "TR: Seçilen mimarinin yazılacağı çıktı JSON yolu (varsayılan: out.json)."
         ),
     )
+    parser.add_argument(
+        "--time-limit",
+        type=search.parse_duration,
+        default=None,
+        help=(
+            "EN: Run the anytime search portfolio for this wall-clock budget (e.g. 30s, 2m). "
+            "TR: Anytime arama portföyünü bu süre boyunca çalıştır (örn. 30s, 2m)."
+        ),
+    )
+    _add_strategy_args(parser)
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help=(
+            "EN: Fail when constraint propagation finds unsatisfiable features. "
+            "TR: Kısıt yayılımı karşılanamayan özellik bulursa hata ver."
+        ),
+    )
+    parser.add_argument(
+        "--restrict-zones",
+        action="store_true",
+        help=(
+            "EN: Treat each feature's zone_hint/zone_candidates as the only zones it may use "
+            "(default: they are preferences). "
+            "TR: Her özelliğin zone_hint/zone_candidates zonlarını kullanabileceği tek zonlar say "
+            "(varsayılan: tercihtirler)."
+        ),
+    )
+    parser.add_argument(
+        "--decompose",
+        action="store_true",
+        help=(
+            "EN: Split the problem into independent feature clusters and solve them in parallel (with --time-limit). "
+            "TR: Problemi bağımsız özellik kümelerine ayır ve paralel çöz (--time-limit ile)."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "EN: Worker processes for --decompose (default: CPU count). "
+            "TR: --decompose için işçi süreç sayısı (varsayılan: CPU sayısı)."
+        ),
+    )
+    parser.add_argument(
+        "--max-cluster-size",
+        type=int,
+        default=None,
+        help=(
+            "EN: Cut clusters larger than this many features at their busiest shared zone. "
+            "TR: Bu sayıdan fazla özellik içeren kümeleri en yoğun paylaşılan zonlarından böl."
+        ),
+    )
+    parser.add_argument(
+        "--surrogate",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help=(
+            "EN: Opt-in: train a surrogate scorer online and let the GA exactly score only this top "
+            "fraction of each batch once the surrogate is accurate (e.g. 0.25); its accuracy is "
+            "printed after the search. "
+            "TR: İsteğe bağlı: çevrimiçi bir vekil skorlayıcı eğit; vekil yeterince doğru olduğunda GA "
+            "her yığının yalnızca bu en iyi kısmını tam skorlasın (örn. 0.25); doğruluğu aramadan "
+            "sonra yazdırılır."
+        ),
+    )
+    parser.add_argument(
+        "--gap",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help=(
+            "EN: Stop the search once the best score is within this relative gap of the "
+            "lower bound (e.g. 0.01 for 1%%). "
+            "TR: En iyi skor alt sınıra bu göreli açık kadar yaklaşınca aramayı durdur "
+            "(örn. %%1 için 0.01)."
+        ),
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help=(
+            "EN: Spill every scored search candidate into this columnar store directory (with --time-limit). "
+            "TR: Skorlanan her arama adayını bu sütunlu depo dizinine yaz (--time-limit ile)."
+        ),
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=search.parse_duration,
+        default=1.0,
+        help=(
+            "EN: Seconds between progress reports and best-so-far dumps (default: 1s). "
+            "TR: İlerleme raporları ve ara çıktı yazımları arasındaki süre (varsayılan: 1s)."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help=(
+            "EN: Periodically save the search state to this file (with --time-limit). "
+            "TR: Arama durumunu düzenli olarak bu dosyaya kaydet (--time-limit ile)."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=search.parse_duration,
+        default=5.0,
+        help=(
+            "EN: Seconds between checkpoints (default: 5s). "
+            "TR: Kontrol noktaları arasındaki süre (varsayılan: 5s)."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        help=(
+            "EN: Continue a search from this checkpoint and keep checkpointing to it; "
+            "--time-limit defaults to the original total budget, and the strategies and seed "
+            "are those of the checkpoint. "
+            "TR: Aramaya bu kontrol noktasından devam et ve ona kaydetmeyi sürdür; "
+            "--time-limit varsayılan olarak özgün toplam bütçedir, stratejiler ve tohum "
+            "kontrol noktasından alınır."
+        ),
+    )
+
+
+def _duration_or_zero(text: str) -> float:
+    return 0.0 if text.strip() == "0" else search.parse_duration(text)
+
+
+def _add_sweep_args(parser: argparse.ArgumentParser) -> None:
+    _add_input_args(parser)
+    parser.add_argument(
+        "scenarios",
+        type=Path,
+        help=(
+            "EN: Scenario JSON (explicit 'scenarios' and/or a 'grid' of override values). "
+            "TR: Senaryo JSON dosyası (açık 'scenarios' ve/veya geçersiz kılma değerleri 'grid'i)."
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("sweep.json"),
+        help=(
+            "EN: Output JSON path for the sweep report (default: sweep.json). "
+            "TR: Tarama raporunun yazılacağı JSON yolu (varsayılan: sweep.json)."
+        ),
+    )
+    parser.add_argument(
+        "--population",
+        type=int,
+        default=256,
+        help=(
+            "EN: Number of distinct candidates cached for re-scoring (default: 256). "
+            "TR: Yeniden skorlama için önbelleğe alınan farklı aday sayısı (varsayılan: 256)."
+        ),
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=search.parse_duration,
+        default=2.0,
+        help=(
+            "EN: Search budget used once to build the population (default: 2s). "
+            "TR: Popülasyonu bir kez oluşturmak için arama süresi (varsayılan: 2s)."
+        ),
+    )
+    parser.add_argument(
+        "--research-time",
+        type=_duration_or_zero,
+        default=1.0,
+        help=(
+            "EN: Re-search budget for scenarios whose feasibility changes (e.g. 500ms, 2s); 0 disables (default: 1s). "
+            "TR: Uygulanabilirliği değişen senaryolar için yeniden arama süresi (örn. 500ms, 2s); 0 kapatır (varsayılan: 1s)."
+        ),
+    )
+    _add_strategy_args(parser)
+
+
+def _add_inspect_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "store",
+        type=Path,
+        help="EN: Candidate store directory. TR: Aday deposu dizini.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="EN: Number of rows to list (default: 10). TR: Listelenecek satır sayısı (varsayılan: 10).",
+    )
+    parser.add_argument(
+        "--by",
+        default="score",
+        choices=store.SCALAR_METRICS,
+        help="EN: Metric to rank by (default: score). TR: Sıralama metriği (varsayılan: score).",
+    )
+    parser.add_argument(
+        "--ascending",
+        action="store_true",
+        help="EN: Rank smallest first. TR: En küçükten başlayarak sırala.",
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        help=(
+            "EN: Filter such as 'power==0' or 'cost<300' (repeatable). "
+            "TR: 'power==0' veya 'cost<300' gibi filtre (tekrarlanabilir)."
+        ),
+    )
+    parser.add_argument(
+        "--hist",
+        choices=store.SCALAR_METRICS,
+        default=None,
+        help="EN: Print a histogram of this metric. TR: Bu metriğin histogramını yazdır.",
+    )
+    parser.add_argument(
+        "--bins",
+        type=int,
+        default=10,
+        help="EN: Histogram bins (default: 10). TR: Histogram aralık sayısı (varsayılan: 10).",
+    )
+
+
+def _add_coordinate_args(parser: argparse.ArgumentParser) -> None:
+    _add_input_args(parser)
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("out.json"),
+        help=(
+            "EN: Output JSON path for the best architecture (default: out.json). "
+            "TR: En iyi mimarinin yazılacağı çıktı JSON yolu (varsayılan: out.json)."
+        ),
+    )
+    parser.add_argument(
+        "--listen",
+        default="tcp://127.0.0.1:7070",
+        help=(
+            "EN: Address to listen on: tcp://host:port (port 0 picks one) or unix:/path (default: tcp://127.0.0.1:7070). "
+            "TR: Dinlenecek adres: tcp://host:port (port 0 otomatik seçer) veya unix:/path (varsayılan: tcp://127.0.0.1:7070)."
+        ),
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=search.parse_duration,
+        default=60.0,
+        help=(
+            "EN: Total wall-clock budget of the distributed search (default: 60s). "
+            "TR: Dağıtık aramanın toplam süre bütçesi (varsayılan: 60s)."
+        ),
+    )
+    parser.add_argument(
+        "--shard-time",
+        type=search.parse_duration,
+        default=10.0,
+        help=(
+            "EN: Search budget of one shard (default: 10s). "
+            "TR: Tek bir parçanın arama süresi (varsayılan: 10s)."
+        ),
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=distributed.SHARD_MODES,
+        default="seed",
+        help=(
+            "EN: Shard by strategy seed or by feature-domain prefix (default: seed). "
+            "TR: Parçaları strateji tohumuna veya özellik alanı önekine göre böl (varsayılan: seed)."
+        ),
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=16,
+        help=(
+            "EN: Minimum number of prefix shards per round (default: 16). "
+            "TR: Tur başına en az önek parçası sayısı (varsayılan: 16)."
+        ),
+    )
+    parser.add_argument(
+        "--gap",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help=(
+            "EN: Stop handing out shards once the best score is within this relative gap of the "
+            "combined lower bound (e.g. 0.01 for 1%%). "
+            "TR: En iyi skor birleşik alt sınıra bu göreli açık kadar yaklaşınca yeni parça "
+            "dağıtmayı durdur (örn. %%1 için 0.01)."
+        ),
+    )
+    _add_strategy_args(parser)
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=16,
+        help=(
+            "EN: Candidates streamed back per shard and kept globally (default: 16). "
+            "TR: Parça başına geri gönderilen ve küresel olarak tutulan aday sayısı (varsayılan: 16)."
+        ),
+    )
+    parser.add_argument(
+        "--spawn",
+        type=int,
+        default=0,
+        help=(
+            "EN: Also start this many local worker processes. "
+            "TR: Ayrıca bu sayıda yerel işçi süreci başlat."
+        ),
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=search.parse_duration,
+        default=1.0,
+        help=(
+            "EN: Seconds between progress reports and best-so-far dumps (default: 1s). "
+            "TR: İlerleme raporları ve ara çıktı yazımları arasındaki süre (varsayılan: 1s)."
+        ),
+    )
+
+
+def _add_worker_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--connect",
+        required=True,
+        help=(
+            "EN: Coordinator address (tcp://host:port or unix:/path). "
+            "TR: Koordinatör adresi (tcp://host:port veya unix:/path)."
+        ),
+    )
+    parser.add_argument(
+        "--name",
+        default=None,
+        help="EN: Worker name shown by the coordinator. TR: Koordinatörün göstereceği işçi adı.",
+    )
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -69,6 +440,26 @@ def _build_parser() -> argparse.ArgumentParser:
         help="EN: Compile requirements and modules. TR: Gereksinim ve modülleri derle.",
     )
     _add_compile_args(compile_parser)
+    sweep_parser = subparsers.add_parser(
+        "sweep",
+        help="EN: Re-score cached candidates across what-if scenarios. TR: Önbellekteki adayları what-if senaryolarında yeniden skorla.",
+    )
+    _add_sweep_args(sweep_parser)
+    inspect_parser = subparsers.add_parser(
+        "inspect",
+        help="EN: Query a candidate store. TR: Aday deposunu sorgula.",
+    )
+    _add_inspect_args(inspect_parser)
+    coordinate_parser = subparsers.add_parser(
+        "coordinate",
+        help="EN: Serve shards of the search to workers. TR: Arama parçalarını işçilere dağıt.",
+    )
+    _add_coordinate_args(coordinate_parser)
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="EN: Process search shards from a coordinator. TR: Koordinatörden gelen arama parçalarını işle.",
+    )
+    _add_worker_args(worker_parser)
 
     # Legacy flags (kept for contract compatibility)
     parser.add_argument(
@@ -109,6 +500,329 @@ def _resolve_paths(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
     parser.error("Provide 'zac compile <requirements> <modules> [--output]' or legacy --requirements/--modules flags.")
 
 
+def _report_propagation(domains: propagation.DomainMatrix, strict: bool) -> None:
+    """
+    EN:
+        Print propagation warnings and unsatisfiable features to stderr;
+        in strict mode unsatisfiable features abort the compile.
+
+    TR:
+        Yayılım uyarılarını ve karşılanamayan özellikleri stderr'e yazar;
+        katı modda karşılanamayan özellikler derlemeyi durdurur.
+    """
+    for warning in domains.warnings:
+        print(f"⚠ {warning}", file=sys.stderr)
+    for feature_id, reasons in domains.unsatisfiable.items():
+        print(f"⚠ Unsatisfiable feature '{feature_id}': {'; '.join(reasons)}", file=sys.stderr)
+    if strict and domains.unsatisfiable:
+        raise SystemExit(
+            f"Error: {len(domains.unsatisfiable)} unsatisfiable feature(s): "
+            f"{', '.join(domains.unsatisfiable)}"
+        )
+
+
+def _run_search(
+    args: argparse.Namespace,
+    req_set: model.RequirementSet,
+    module_lib: model.ModuleLibrary,
+    domains: propagation.DomainMatrix,
+    baseline: model.ArchitectureCandidate,
+    output_path: Path,
+    parser: argparse.ArgumentParser,
+) -> model.ArchitectureCandidate:
+    """
+    EN:
+        Run the time-budgeted strategy portfolio from the baseline and keep
+        the best-so-far architecture on disk while it runs.
+
+    TR:
+        Süre sınırlı strateji portföyünü başlangıç çözümünden çalıştırır ve
+        çalışırken o ana kadarki en iyi mimariyi diskte tutar.
+    """
+    strategies = _split_strategies(args.strategies)
+    space = search.SearchSpace.from_problem(req_set, module_lib, matrix=domains)
+    resume = None
+    if args.resume is not None:
+        try:
+            resume = checkpoint.load(args.resume, space)
+        except ValueError as exc:
+            parser.error(str(exc))
+        strategies = resume.strategies
+        print(
+            f"Resuming {','.join(strategies)} from {args.resume} at {resume.elapsed_s:.1f}s "
+            f"(best={resume.incumbent['score']:.2f}).",
+            file=sys.stderr,
+        )
+    time_limit = args.time_limit or resume.time_limit_s
+    checkpoint_path = args.checkpoint or args.resume
+    print(domains.summary(), file=sys.stderr)
+    if space.symmetry is not None:
+        print(space.symmetry.summary(), file=sys.stderr)
+    if space.relaxed:
+        print(
+            "Searching relaxed domains for unsatisfiable feature(s): "
+            + ", ".join(f"{fid} (dropped {'/'.join(dropped)})" for fid, dropped in space.relaxed.items()),
+            file=sys.stderr,
+        )
+
+    def _progress(p: search.SearchProgress) -> None:
+        gap = f" gap={p.optimality_gap:.2%}" if p.optimality_gap is not None else ""
+        print(
+            f"[{p.elapsed_s:7.1f}s] best={p.best_score:.2f}{gap} "
+            f"{p.candidates_per_s:.0f} cand/s evals={p.evaluations} "
+            f"pruned={p.pruned} dup={p.duplicates} ({p.owner or '-'})",
+            file=sys.stderr,
+        )
+
+    def _save(candidate: model.ArchitectureCandidate) -> None:
+        loader.dump_architecture(candidate, output_path)
+
+    spill_store = None
+    if args.store is not None:
+        spill_store = store.CandidateStore.create(
+            args.store,
+            feature_ids=[f.id for f in space.features],
+            module_ids=[m.id for m in module_lib.modules],
+            zone_names=[z.name for z in req_set.zones],
+        )
+
+    if args.decompose:
+        result, parts = decomposition.solve_decomposed(
+            space,
+            baseline=baseline,
+            time_limit_s=time_limit,
+            strategies=strategies,
+            seed=_seed(args),
+            workers=args.workers,
+            max_cluster_size=args.max_cluster_size,
+            progress=_progress,
+            on_improve=_save,
+        )
+        print(parts.summary(space), file=sys.stderr)
+        print(
+            f"Decomposed search finished in {result.elapsed_s:.1f}s: best={result.best.score:.2f}.",
+            file=sys.stderr,
+        )
+        _report_bound(result)
+        return result.best
+
+    def _checkpoint(state: search.PortfolioState) -> None:
+        checkpoint.save(checkpoint_path, space, state)
+
+    learned = None
+    if args.surrogate is not None:
+        learned = surrogate.Surrogate(space, fraction=args.surrogate, seed=_seed(args))
+
+    result = search.run_portfolio(
+        space,
+        baseline=baseline,
+        strategies=strategies,
+        time_limit_s=time_limit,
+        seed=resume.seed if resume is not None else _seed(args),
+        progress=_progress,
+        progress_interval_s=args.progress_interval,
+        on_improve=_save,
+        spill=spill_store.append if spill_store is not None else None,
+        checkpoint=_checkpoint if checkpoint_path is not None else None,
+        checkpoint_interval_s=args.checkpoint_interval,
+        resume=resume,
+        surrogate=learned,
+        gap=args.gap,
+    )
+    if learned is not None:
+        print(learned.report().summary(), file=sys.stderr)
+    if spill_store is not None:
+        spill_store.close()
+        print(f"Candidate store {args.store}: {len(spill_store)} rows.", file=sys.stderr)
+    print(
+        f"Search finished in {result.elapsed_s:.1f}s: best={result.best.score:.2f} "
+        f"({result.owner or 'baseline'}), {result.evaluations} candidates evaluated, "
+        f"{result.duplicates} duplicate(s) skipped.",
+        file=sys.stderr,
+    )
+    if result.exhausted:
+        print("Search space exhausted: the best architecture is optimal.", file=sys.stderr)
+    _report_bound(result)
+    return result.best
+
+
+def _report_bound(result: search.SearchResult) -> None:
+    """
+    EN:
+        Print the score bound and optimality gap and record them in the
+        best architecture's metrics.
+
+    TR:
+        Skor sınırını ve optimallik açığını yazdırır ve en iyi mimarinin
+        metriklerine kaydeder.
+    """
+    if result.lower_bound is None:
+        return
+    print(
+        f"Score bound {-result.lower_bound:.2f}, optimality gap {result.optimality_gap:.2%}.",
+        file=sys.stderr,
+    )
+    result.best.metrics["score_bound"] = -result.lower_bound
+    result.best.metrics["optimality_gap"] = result.optimality_gap
+
+
+def _split_strategies(text: str | None) -> list[str]:
+    return [s.strip() for s in (text or DEFAULT_STRATEGIES).split(",") if s.strip()]
+
+
+def _seed(args: argparse.Namespace) -> int:
+    return args.seed if args.seed is not None else 0
+
+
+def _sweep(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """
+    EN:
+        `zac sweep`: build and cache a candidate population once, then
+        re-score it for every scenario and write the report.
+
+    TR:
+        `zac sweep`: aday popülasyonunu bir kez oluşturup önbelleğe alır,
+        ardından her senaryo için yeniden skorlar ve raporu yazar.
+    """
+    try:
+        req_set = loader.load_requirements(args.requirements)
+        module_lib = loader.load_module_library(args.modules)
+        scenarios = loader.load_scenarios(args.scenarios)
+    except ValueError as exc:
+        parser.error(str(exc))
+    strategies = _split_strategies(args.strategies)
+
+    baseline = scorer.select_best(
+        scorer.score_candidates(generator.generate_candidates(req_set, module_lib))
+    )
+    population = sweep.build_population(
+        req_set,
+        module_lib,
+        baseline,
+        size=args.population,
+        time_limit_s=args.time_limit,
+        strategies=strategies,
+        seed=_seed(args),
+    )
+    cache = sweep.CandidateCache(req_set, module_lib, population)
+    results = sweep.run_sweep(
+        cache,
+        scenarios,
+        research_time_s=args.research_time,
+        strategies=strategies,
+        seed=_seed(args),
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(sweep.results_to_json(results, len(cache)), indent=2),
+        encoding="utf-8",
+    )
+    researched = sum(r.researched for r in results)
+    print(
+        f"✔ Sweep of {len(results)} scenario(s) over {len(cache)} cached candidates "
+        f"({researched} re-searched) saved to: {args.output}"
+    )
+
+
+def _inspect(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """
+    EN:
+        `zac inspect`: top-k, filtering and histograms over a candidate
+        store without loading it into memory.
+
+    TR:
+        `zac inspect`: aday deposunu belleğe yüklemeden top-k, filtreleme
+        ve histogram sorguları.
+    """
+    try:
+        candidates = store.CandidateStore.open(args.store)
+    except ValueError as exc:
+        parser.error(str(exc))
+    with candidates:
+        print(f"{args.store}: {len(candidates)} candidates")
+        try:
+            if args.hist:
+                for low, high, count in candidates.histogram(args.hist, bins=args.bins, filters=args.where):
+                    print(f"  [{low:12.3f}, {high:12.3f})  {count}")
+                return
+            rows = candidates.top_k(args.top, by=args.by, descending=not args.ascending, filters=args.where)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+        for rank, (row, _) in enumerate(rows, start=1):
+            metrics = candidates.row_metrics(row)
+            summary = " ".join(f"{k}={v:.2f}" for k, v in metrics.items())
+            print(f"#{rank} row={row} {summary}")
+            for feature_id, module_id, zone_name in candidates.placements(row):
+                print(f"    {feature_id}: {module_id} @ {zone_name}")
+
+
+def _coordinate(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """
+    EN:
+        `zac coordinate`: shard the search over connected workers and
+        write the best architecture found.
+
+    TR:
+        `zac coordinate`: aramayı bağlı işçilere parçalar halinde dağıtır
+        ve bulunan en iyi mimariyi yazar.
+    """
+    requirements_data = json.loads(args.requirements.read_text(encoding="utf-8"))
+    modules_data = json.loads(args.modules.read_text(encoding="utf-8"))
+    try:
+        req_set = loader.parse_requirements(requirements_data)
+        module_lib = loader.parse_module_library(modules_data)
+    except ValueError as exc:
+        parser.error(str(exc))
+    domains = propagation.propagate(req_set, module_lib)
+    _report_propagation(domains, strict=False)
+    space = search.SearchSpace.from_problem(req_set, module_lib, matrix=domains)
+
+    coordinator = distributed.Coordinator(
+        space,
+        requirements_data,
+        modules_data,
+        strategies=_split_strategies(args.strategies),
+        time_limit_s=args.time_limit,
+        shard_time_s=args.shard_time,
+        shard_by=args.shard_by,
+        shards=args.shards,
+        seed=_seed(args),
+        top_k=args.top_k,
+        gap=args.gap,
+    )
+
+    def _progress(p: search.SearchProgress) -> None:
+        print(
+            f"[{p.elapsed_s:7.1f}s] best={p.best_score:.2f} {p.candidates_per_s:.0f} cand/s "
+            f"evals={p.evaluations} shards={coordinator.completed} "
+            f"workers={len(coordinator.workers)} ({p.owner or '-'})",
+            file=sys.stderr,
+        )
+
+    def _save(candidate: model.ArchitectureCandidate) -> None:
+        loader.dump_architecture(candidate, args.output)
+
+    result = coordinator.serve(
+        args.listen,
+        spawn=args.spawn,
+        progress=_progress,
+        progress_interval_s=args.progress_interval,
+        on_improve=_save,
+        on_listen=lambda address: print(f"Coordinator listening on {address}", file=sys.stderr),
+    )
+    if result.exhausted:
+        print("Search space exhausted: the best architecture is optimal.", file=sys.stderr)
+    _report_bound(result)
+    loader.dump_architecture(result.best, args.output)
+    print(
+        f"✔ Distributed search: best={result.best.score:.2f} ({result.owner}), "
+        f"{result.iterations['shards']} shard(s), {result.iterations['reassigned']} reassigned, "
+        f"{result.evaluations} candidates evaluated. Saved to: {args.output}"
+    )
+
+
 def main() -> None:
     """
     EN:
@@ -120,23 +834,113 @@ def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
 
+    if getattr(args, "strategies", None) is not None:
+        available = sorted(set(search.STRATEGIES) | set(search.LAZY_STRATEGIES))
+        names = _split_strategies(args.strategies)
+        unknown = [name for name in names if name not in available]
+        if not names:
+            parser.error(f"--strategies needs at least one strategy (available: {', '.join(available)}).")
+        if unknown:
+            parser.error(
+                f"Unknown search strateg{'ies' if len(unknown) > 1 else 'y'}: {', '.join(unknown)} "
+                f"(available: {', '.join(available)})."
+            )
+
+    if args.command == "sweep":
+        _sweep(args, parser)
+        return
+    if args.command == "inspect":
+        _inspect(args, parser)
+        return
+    if args.command == "coordinate":
+        if args.gap is not None and args.gap < 0.0:
+            parser.error("--gap must not be negative.")
+        _coordinate(args, parser)
+        return
+    if args.command == "worker":
+        distributed.run_worker(args.connect, name=args.name)
+        return
+
     requirements_path, modules_path, output_path = _resolve_paths(args, parser)
+    searching = bool(getattr(args, "time_limit", None) or getattr(args, "resume", None))
+    if not searching:
+        # EN: These options only configure the search; without it they would be silently dropped.
+        # TR: Bu seçenekler yalnızca aramayı ayarlar; arama olmadan sessizce yok sayılırlardı.
+        ignored = [
+            flag
+            for flag, dest in (
+                ("--gap", "gap"),
+                ("--store", "store"),
+                ("--checkpoint", "checkpoint"),
+                ("--decompose", "decompose"),
+                ("--surrogate", "surrogate"),
+                ("--strategies", "strategies"),
+                ("--seed", "seed"),
+            )
+            if getattr(args, dest, None) not in (None, False)
+        ]
+        if ignored:
+            verb = "requires" if len(ignored) == 1 else "require"
+            parser.error(f"{', '.join(ignored)} {verb} --time-limit or --resume.")
+    if not getattr(args, "decompose", False):
+        # EN: Decomposition-only options would be silently dropped as well.
+        # TR: Yalnızca ayrıştırmaya ait seçenekler de sessizce yok sayılırdı.
+        unused = [
+            flag
+            for flag, dest in (("--workers", "workers"), ("--max-cluster-size", "max_cluster_size"))
+            if getattr(args, dest, None) is not None
+        ]
+        if unused:
+            verb = "requires" if len(unused) == 1 else "require"
+            parser.error(f"{', '.join(unused)} {verb} --decompose.")
+    for flag, dest in (("--workers", "workers"), ("--max-cluster-size", "max_cluster_size")):
+        if getattr(args, dest, None) is not None and getattr(args, dest) < 1:
+            parser.error(f"{flag} must be at least 1.")
+    if getattr(args, "resume", None) is not None and (args.strategies is not None or args.seed is not None):
+        parser.error("--strategies/--seed cannot be combined with --resume; the checkpoint's are used.")
+    if getattr(args, "decompose", False) and (args.checkpoint or args.resume):
+        parser.error("--checkpoint/--resume cannot be combined with --decompose.")
+    if getattr(args, "decompose", False) and getattr(args, "store", None) is not None:
+        parser.error("--store cannot be combined with --decompose.")
+    if getattr(args, "decompose", False) and getattr(args, "gap", None) is not None:
+        parser.error("--gap cannot be combined with --decompose.")
+    if getattr(args, "gap", None) is not None and args.gap < 0.0:
+        parser.error("--gap must not be negative.")
+    if getattr(args, "surrogate", None) is not None:
+        if args.decompose:
+            parser.error("--surrogate cannot be combined with --decompose.")
+        if not 0.0 < args.surrogate <= 1.0:
+            parser.error("--surrogate must be a fraction in (0, 1].")
+        if args.strategies is not None and "ga" not in _split_strategies(args.strategies):
+            parser.error("--surrogate only screens the ga strategy; add it to --strategies.")
 
     # === Load inputs ===
-    req_set = loader.load_requirements(requirements_path)
-    module_lib = loader.load_module_library(modules_path)
+    try:
+        req_set = loader.load_requirements(requirements_path)
+        module_lib = loader.load_module_library(modules_path)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    # === Propagate constraints ===
+    domains = propagation.propagate(req_set, module_lib, restrict_zones=getattr(args, "restrict_zones", False))
+    _report_propagation(domains, strict=getattr(args, "strict", False))
 
     # === Generate candidates ===
     candidates = generator.generate_candidates(
         requirements=req_set,
         modules=module_lib,
         max_candidates=10,
+        matrix=domains,
     )
 
     # === Score ===
     scored = scorer.score_candidates(candidates)
     best = scorer.select_best(scored)
 
+    # === Search (optional) ===
+    if getattr(args, "time_limit", None) or getattr(args, "resume", None):
+        best = _run_search(args, req_set, module_lib, domains, best, output_path, parser)
+
     # === Dump output ===
     loader.dump_architecture(best, output_path)
 
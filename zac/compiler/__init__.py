@@ -10,4 +10,4 @@ TR:
   ve optimize edici ile konuşan derleyici alt sistemini içerir.
 """
 
-from . import loader, model, generator, scorer  # noqa: F401
\ No newline at end of file
+from . import bounds, checkpoint, distributed, loader, model, generator, network, placement, propagation, scorer, search, spatial, store, surrogate, sweep, symmetry  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,263 @@
+"""
+Admissible bounds on the objective.
+
+EN:
+    The search maximizes `score = -(total cost + penalties)`; its objective
+    is therefore `-score`. `Bounder` computes a lower bound on that
+    objective over a whole search space, so the distance of any incumbent
+    from the optimum is known (the optimality gap), and a cheap upper
+    bound on the score of a single assignment, used to prune candidates
+    before they are built and scored.
+
+    The space-wide bound is the sum of:
+
+        * cost: the cheapest option of every feature,
+        * redundancy: the smallest redundancy shortfall of every feature,
+        * power: the overrun that is unavoidable even if every feature
+          takes its least power-hungry option — zones overloaded by
+          forced (single-zone) features, plus free demand beyond the
+          remaining slack of the zones it can use,
+        * harness: the larger of a per-link bound over the sequential
+          links (intra-zone or the shortest inter-zone link) and a minimum
+          spanning tree over the metric closure of the required zones
+          (those some feature is forced into).
+
+    Latency and bandwidth penalties are bounded by zero.
+
+TR:
+    Arama `skor = -(toplam maliyet + cezalar)` değerini en büyükler; amaç
+    fonksiyonu bu yüzden `-skor`dur. `Bounder`, tüm arama uzayı üzerinde
+    bu amaç için bir alt sınır hesaplar; böylece herhangi bir en iyi
+    çözümün optimuma uzaklığı (optimallik açığı) bilinir. Ayrıca tek bir
+    atamanın skoru için ucuz bir üst sınır verir; adaylar kurulup
+    skorlanmadan önce budanmak için kullanılır.
+
+    Uzay genelindeki sınır şunların toplamıdır:
+
+        * maliyet: her özelliğin en ucuz seçeneği,
+        * yedeklilik: her özelliğin en küçük yedeklilik eksiği,
+        * güç: her özellik en az güç tüketen seçeneğini alsa bile
+          kaçınılmaz aşım — zorunlu (tek zonlu) özelliklerin aşırı
+          yüklediği zonlar ve serbest talebin kullanabileceği zonların
+          kalan payını aşan kısmı,
+        * kablo: sıralı bağlantılar üzerinden bağlantı başına sınır (zon
+          içi veya en kısa zonlar arası bağlantı) ile gerekli zonların
+          (bir özelliğin zorunlu olduğu zonlar) metrik kapanışı üzerindeki
+          minimum yayılan ağacın büyüğü.
+
+    Gecikme ve bant genişliği cezaları sıfırla sınırlanır.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from . import generator
+from .model import Module, RequirementSet, Zone
+from .scorer import DEFAULT_WEIGHTS, PenaltyWeights
+from .spatial import ZoneIndex
+
+_ROUNDING_M = 0.005  # `_estimate_link_length` rounds to centimeters
+
+
+@dataclass
+class LowerBound:
+    """
+    EN:
+        Lower bound on `-score`, per component.
+
+    TR:
+        `-skor` için bileşen bazında alt sınır.
+    """
+
+    cost: float
+    power: float
+    harness: float
+    redundancy: float
+
+    @property
+    def total(self) -> float:
+        return self.cost + self.power + self.harness + self.redundancy
+
+
+def optimality_gap(score: float, lower_bound: float) -> float:
+    """
+    EN:
+        Relative gap `(objective - bound) / objective` of a score, where
+        `objective = -score`; 0 when the objective is not positive.
+
+    TR:
+        Bir skorun göreli açığı `(amaç - sınır) / amaç`; burada
+        `amaç = -skor`dur. Amaç pozitif değilse 0'dır.
+    """
+    objective = -score
+    if objective <= 0:
+        return 0.0
+    return max(0.0, (objective - lower_bound) / objective)
+
+
+class Bounder:
+    """
+    EN:
+        Bounds for one search space (requirements, domains and weights).
+
+    TR:
+        Tek bir arama uzayı (gereksinimler, alanlar ve ağırlıklar) için
+        sınırlar.
+    """
+
+    def __init__(
+        self,
+        requirements: RequirementSet,
+        domains: Sequence[Sequence[Tuple[Module, Zone]]],
+        weights: Optional[PenaltyWeights] = None,
+    ) -> None:
+        self.weights = weights
+        self._w = weights or DEFAULT_WEIGHTS
+        self.zones = list(requirements.zones)
+        zone_idx = generator._zone_positions(self.zones)
+        self._budget = [z.max_power_kw for z in self.zones]
+        # Per feature and option: (cost, power, zone, redundancy shortfall)
+        self._options: List[List[Tuple[float, float, int, int]]] = [
+            [
+                (module.cost, module.max_power_kw, zone_idx[zone.name], max(0, module.redundancy - 1))
+                for module, zone in domain
+            ]
+            for domain in domains
+        ]
+        self._zone_sets: List[Set[int]] = [{o[2] for o in options} for options in self._options]
+        self._lengths: Dict[Tuple[int, int], float] = {}
+        # Length of a link between two zones when one has no position
+        self._fallback = generator._FALLBACK_LINK_M
+        self._root: Optional[LowerBound] = None
+
+    def _length(self, a: int, b: int) -> float:
+        key = (a, b)
+        length = self._lengths.get(key)
+        if length is None:
+            length = self._lengths[key] = generator._estimate_link_length(self.zones[a], self.zones[b])
+        return length
+
+    def score_bound(self, assignment: Sequence[int]) -> float:
+        """
+        EN:
+            Upper bound on the score of a complete assignment: exact cost,
+            power, harness and redundancy terms, without building it.
+
+        TR:
+            Tam bir atamanın skoru için üst sınır: atama kurulmadan tam
+            maliyet, güç, kablo ve yedeklilik terimleri.
+        """
+        cost = 0.0
+        redundancy = 0
+        load = [0.0] * len(self._budget)
+        zones: List[int] = []
+        for options, option in zip(self._options, assignment):
+            c, p, z, r = options[option]
+            cost += c
+            load[z] += p
+            redundancy += r
+            zones.append(z)
+        power = sum(l - b for l, b in zip(load, self._budget) if l > b) * self._w.power
+        length = sum(self._length(a, b) for a, b in zip(zones, zones[1:]))
+        return -(cost + power + length * self._w.harness + redundancy * self._w.redundancy)
+
+    def root(self) -> LowerBound:
+        """
+        EN:
+            Lower bound on `-score` over the whole space (cached); infinite
+            when a feature has no option, since no assignment exists.
+
+        TR:
+            Tüm uzay üzerinde `-skor` için alt sınır (önbelleğe alınır);
+            seçeneği olmayan bir özellik varsa hiçbir atama olmadığından
+            sonsuzdur.
+        """
+        if self._root is None:
+            self._root = LowerBound(
+                cost=sum(min((o[0] for o in options), default=math.inf) for options in self._options),
+                power=self._power_bound() * self._w.power,
+                harness=self._harness_bound() * self._w.harness,
+                redundancy=sum(min((o[3] for o in options), default=0) for options in self._options)
+                * self._w.redundancy,
+            )
+        return self._root
+
+    def _power_bound(self) -> float:
+        forced = [0.0] * len(self._budget)
+        free_demand = 0.0
+        free_zones: Set[int] = set()
+        for options, zones in zip(self._options, self._zone_sets):
+            if not options:
+                continue
+            least = min(o[1] for o in options)
+            if len(zones) == 1:
+                forced[next(iter(zones))] += least
+            else:
+                free_demand += least
+                free_zones |= zones
+        overrun = sum(f - b for f, b in zip(forced, self._budget) if f > b)
+        slack = sum(max(0.0, self._budget[z] - forced[z]) for z in free_zones)
+        return overrun + max(0.0, free_demand - slack)
+
+    def _harness_bound(self) -> float:
+        features = [zones for zones in self._zone_sets if zones]
+        if len(features) < 2:
+            return 0.0
+        used = sorted(set().union(*features))
+        shortest = self._shortest_hop(used)
+
+        chain = 0.0
+        for a, b in zip(features, features[1:]):
+            if len(a) == 1 and len(b) == 1:
+                chain += self._length(next(iter(a)), next(iter(b)))
+            elif a & b:
+                chain += min(self._length(next(iter(a & b)), next(iter(a & b))), shortest)
+            else:
+                chain += shortest
+
+        required = sorted({next(iter(zones)) for zones in features if len(zones) == 1})
+        tree = self._closure_mst(required, any(self.zones[z].position is None for z in used))
+        tree -= _ROUNDING_M * (len(features) - 1)
+        return max(chain, tree)
+
+    def _shortest_hop(self, used: Sequence[int]) -> float:
+        # Shortest link between two different zones, via the KD-tree for positioned zones.
+        if len(used) < 2:
+            return math.inf
+        positioned = [z for z in used if self.zones[z].position is not None]
+        shortest = math.inf if len(positioned) == len(used) else self._fallback
+        if len(positioned) >= 2:
+            index = ZoneIndex([self.zones[z] for z in positioned])
+            for i, z in enumerate(positioned):
+                for j in index.nearest(self.zones[z].position, k=2):
+                    if j != i:
+                        shortest = min(shortest, self._length(z, positioned[j]))
+        return shortest
+
+    def _closure_mst(self, required: Sequence[int], via_unpositioned: bool) -> float:
+        # Prim over the metric closure: positioned pairs may detour through an
+        # unpositioned zone (two fallback links), every other pair is one fallback link.
+        if len(required) < 2:
+            return 0.0
+        fallback = self._fallback
+
+        def _distance(a: int, b: int) -> float:
+            pa, pb = self.zones[a].position, self.zones[b].position
+            if pa is None or pb is None:
+                return fallback
+            direct = math.hypot(pa[0] - pb[0], pa[1] - pb[1])
+            return min(direct, 2 * fallback) if via_unpositioned else direct
+
+        best = {z: _distance(required[0], z) for z in required[1:]}
+        total = 0.0
+        while best:
+            z = min(best, key=best.get)
+            total += best.pop(z)
+            for other in best:
+                d = _distance(z, other)
+                if d < best[other]:
+                    best[other] = d
+        return total
@@ -0,0 +1,82 @@
+"""
+Search checkpoints.
+
+EN:
+    Saves a running portfolio's `PortfolioState` (incumbent, archive,
+    populations, RNG states, iteration counters and recent memo entries)
+    to a single pickle file, so a pre-empted search can be resumed with
+    `zac compile --resume`. Writes go to a temporary file that atomically
+    replaces the previous checkpoint, so a crash mid-write never leaves a
+    truncated file. A fingerprint of the inputs guards against resuming
+    with different requirements, modules or weights.
+
+    Checkpoints are pickles: only load files you wrote yourself.
+
+TR:
+    Çalışan bir portföyün `PortfolioState` durumunu (en iyi çözüm, arşiv,
+    popülasyonlar, RNG durumları, iterasyon sayaçları ve son memo
+    girdileri) tek bir pickle dosyasına kaydeder; böylece kesintiye
+    uğrayan bir arama `zac compile --resume` ile sürdürülebilir. Yazma
+    işlemi, önceki kontrol noktasının yerine atomik olarak geçen geçici
+    bir dosyaya yapılır; yazma sırasında çökme asla yarım dosya bırakmaz.
+    Alanın parmak izi (`SearchSpace.fingerprint`), farklı gereksinim,
+    modül veya ağırlıklarla devam edilmesini engeller.
+
+    Kontrol noktaları pickle dosyasıdır: yalnızca kendi yazdığınız
+    dosyaları yükleyin.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+
+from .search import PortfolioState, SearchSpace
+
+CHECKPOINT_VERSION = 2
+
+
+def save(path: Path, space: SearchSpace, state: PortfolioState) -> None:
+    """
+    EN:
+        Atomically write `state` to `path`.
+
+    TR:
+        `state` durumunu `path` dosyasına atomik olarak yazar.
+    """
+    payload = {"version": CHECKPOINT_VERSION, "fingerprint": space.fingerprint(), "state": state}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def load(path: Path, space: SearchSpace) -> PortfolioState:
+    """
+    EN:
+        Read a checkpoint and check that it belongs to `space`. A missing,
+        truncated or foreign file raises ValueError.
+
+    TR:
+        Bir kontrol noktasını okur ve `space` alanına ait olduğunu
+        doğrular. Eksik, yarım kalmış veya yabancı bir dosya ValueError
+        fırlatır.
+    """
+    if not path.exists():
+        raise ValueError(f"Checkpoint '{path}' does not exist.")
+    try:
+        with path.open("rb") as fh:
+            payload = pickle.load(fh)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError) as exc:
+        raise ValueError(f"'{path}' is not a readable checkpoint ({exc or type(exc).__name__}).") from exc
+    if not isinstance(payload, dict) or payload.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"'{path}' is not a version {CHECKPOINT_VERSION} checkpoint.")
+    if payload.get("fingerprint") != space.fingerprint():
+        raise ValueError(
+            f"Checkpoint '{path}' was taken for different requirements, modules or weights."
+        )
+    return payload["state"]
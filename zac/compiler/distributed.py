@@ -0,0 +1,796 @@
+"""
+Coordinator/worker distributed search.
+
+EN:
+    Spreads the anytime search over several processes or machines. A
+    coordinator (`zac coordinate`) owns the problem and a queue of shards;
+    workers (`zac worker`) connect over TCP or a Unix socket, receive the
+    problem once, then repeatedly pull a shard, run the regular strategy
+    portfolio on it and stream back progress and their top-k candidates.
+
+    Shards are either
+        * "seed": the full space with a distinct strategy seed, or
+        * "prefix": the space with the first features fixed to one
+          combination of options (a feature-domain prefix),
+    and new rounds (with fresh seeds) are queued until the time limit.
+    Workers report whether their shard was exhausted and its score bound.
+    Exhausted prefixes are not queued again, and no further shards are
+    handed out once every prefix (or the full space) is exhausted or the
+    incumbent is within the optional `gap` of the combined bound.
+
+    Every progress message is answered with the global incumbent, which
+    the worker injects into its own incumbent when it lies in its shard,
+    so strategies migrate towards the best known solution; once the
+    search is settled the reply also asks the worker to stop. A worker that
+    disconnects or stays silent longer than the heartbeat timeout has its
+    shard put back at the front of the queue.
+
+    Protocol: one JSON object per line.
+        worker -> hello {worker}           coordinator -> problem {...}
+        worker -> ready {fingerprint}
+        worker -> next                     coordinator -> shard {...} | done
+        worker -> progress {shard, score, assignment, evaluations}
+                                           coordinator -> bound {score, assignment, stop}
+        worker -> result {shard, top, evaluations, exhausted, lower_bound}
+    Assignments always use the full space's option indices. The
+    coordinator checks every assignment against the domains and rescores
+    it itself; invalid ones are logged and dropped.
+
+TR:
+    Anytime aramayı birden çok süreç veya makineye yayar. Koordinatör
+    (`zac coordinate`) problemi ve bir parça (shard) kuyruğunu yönetir;
+    işçiler (`zac worker`) TCP veya Unix soketiyle bağlanır, problemi bir
+    kez alır, ardından sürekli bir parça çekip üzerinde normal strateji
+    portföyünü çalıştırır ve ilerlemeyi ve en iyi k adayını geri akıtır.
+
+    Parçalar şunlardan biridir:
+        * "seed": farklı strateji tohumuyla tüm uzay,
+        * "prefix": ilk özellikleri tek bir seçenek kombinasyonuna
+          sabitlenmiş uzay (özellik alanı öneki);
+    süre dolana kadar (yeni tohumlarla) yeni turlar kuyruğa eklenir.
+    İşçiler parçalarının tükenip tükenmediğini ve skor sınırını bildirir.
+    Tükenmiş önekler yeniden kuyruğa konmaz; her önek (veya tüm uzay)
+    tükendiğinde ya da en iyi çözüm birleşik sınıra isteğe bağlı `gap`
+    kadar yaklaştığında yeni parça dağıtılmaz.
+
+    Her ilerleme mesajı küresel en iyi çözümle yanıtlanır; işçi bu çözüm
+    kendi parçasındaysa onu kendi en iyi çözümüne ekler, böylece
+    stratejiler bilinen en iyi çözüme yönelir; arama sonuçlandığında
+    yanıt işçiden durmasını da ister. Bağlantısı kopan veya
+    kalp atışı süresinden uzun sessiz kalan bir işçinin parçası kuyruğun
+    başına geri konur.
+
+    Protokol: satır başına bir JSON nesnesi (yukarıdaki tablo). Atamalar
+    her zaman tüm uzayın seçenek indekslerini kullanır. Koordinatör her
+    atamayı alanlara göre denetler ve kendisi yeniden skorlar; geçersiz
+    olanlar kaydedilip atılır.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import math
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from . import generator, loader, scorer
+from .bounds import optimality_gap
+from .model import ArchitectureCandidate
+from .search import Assignment, Incumbent, SearchProgress, SearchResult, SearchSpace, run_portfolio
+
+SHARD_MODES = ("seed", "prefix")
+HEARTBEAT_TIMEOUT_S = 15.0
+
+
+# ---------- Addresses and wire format / Adresler ve mesaj biçimi ----------
+
+
+def parse_address(text: str) -> Tuple[str, Any]:
+    """
+    EN:
+        "tcp://host:port", "host:port" or "unix:/path/to.sock" ->
+        (socket family name, address).
+
+    TR:
+        "tcp://host:port", "host:port" veya "unix:/path/to.sock" ->
+        (soket ailesi adı, adres).
+    """
+    if text.startswith("unix:"):
+        path = text[len("unix:"):]
+        if not path:
+            raise ValueError("Unix socket address needs a path (unix:/path/to.sock).")
+        return "unix", path
+    rest = text[len("tcp://"):] if text.startswith("tcp://") else text
+    host, sep, port = rest.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Invalid address '{text}' (expected tcp://host:port or unix:/path).")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def format_address(family: str, address: Any) -> str:
+    if family == "unix":
+        return f"unix:{address}"
+    return f"tcp://{address[0]}:{address[1]}"
+
+
+def _send(wfile, message: Dict[str, Any]) -> None:
+    wfile.write((json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8"))
+    wfile.flush()
+
+
+def _receive(rfile) -> Optional[Dict[str, Any]]:
+    line = rfile.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+# ---------- Shards / Parçalar ----------
+
+
+@dataclass
+class Shard:
+    """
+    EN:
+        One unit of work: a strategy seed and optional fixed
+        (feature index, option) prefix.
+
+    TR:
+        Bir iş birimi: strateji tohumu ve isteğe bağlı sabit
+        (özellik indeksi, seçenek) öneki.
+    """
+
+    id: int
+    seed: int
+    prefix: List[Tuple[int, int]] = field(default_factory=list)
+    attempts: int = 0
+
+
+def prefix_combinations(space: SearchSpace, shards: int) -> List[List[Tuple[int, int]]]:
+    """
+    EN:
+        Option combinations of the first movable features, taking as many
+        features as needed to reach at least `shards` combinations.
+
+    TR:
+        İlk hareket ettirilebilir özelliklerin seçenek kombinasyonları;
+        en az `shards` kombinasyona ulaşacak kadar özellik alınır.
+    """
+    chosen: List[int] = []
+    count = 1
+    for f, domain in enumerate(space.domains):
+        if count >= shards:
+            break
+        if len(domain) > 1:
+            chosen.append(f)
+            count *= len(domain)
+    if not chosen:
+        return [[]]
+    return [
+        list(zip(chosen, options))
+        for options in itertools.product(*(range(len(space.domains[f])) for f in chosen))
+    ]
+
+
+def restrict(space: SearchSpace, prefix: Sequence[Tuple[int, int]]) -> SearchSpace:
+    """
+    EN:
+        Sub-space with each prefix feature fixed to one option. Option
+        indices of the other features are unchanged; fixed features have
+        the single option 0.
+
+    TR:
+        Her önek özelliği tek bir seçeneğe sabitlenmiş alt uzay. Diğer
+        özelliklerin seçenek indeksleri değişmez; sabit özelliklerin tek
+        seçeneği 0'dır.
+    """
+    if not prefix:
+        return space
+    fixed = dict(prefix)
+    domains = [
+        [domain[fixed[f]]] if f in fixed else domain for f, domain in enumerate(space.domains)
+    ]
+    symmetry = space.symmetry
+    if symmetry is not None:
+        symmetry = replace(
+            symmetry,
+            option_keys=[
+                [keys[fixed[f]]] if f in fixed else keys for f, keys in enumerate(symmetry.option_keys)
+            ],
+        )
+    return replace(space, domains=domains, symmetry=symmetry)
+
+
+def _prefix_key(prefix: Sequence[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    return tuple((int(f), int(o)) for f, o in prefix)
+
+
+def _to_full(assignment: Sequence[int], prefix: Sequence[Tuple[int, int]]) -> Assignment:
+    full = list(assignment)
+    for f, option in prefix:
+        full[f] = option
+    return full
+
+
+def _to_shard(assignment: Sequence[int], prefix: Sequence[Tuple[int, int]]) -> Optional[Assignment]:
+    sub = list(assignment)
+    for f, option in prefix:
+        if sub[f] != option:
+            return None
+        sub[f] = 0
+    return sub
+
+
+# ---------- Coordinator / Koordinatör ----------
+
+
+class Coordinator:
+    """
+    EN:
+        Shard queue, global incumbent and top-k archive shared by all
+        worker connections. Methods are thread-safe; `serve` runs the
+        socket server until the time limit, or until the search is settled
+        (every prefix exhausted or the incumbent within `gap` of the
+        bound), and returns the merged result.
+
+    TR:
+        Tüm işçi bağlantılarının paylaştığı parça kuyruğu, küresel en iyi
+        çözüm ve en iyi k arşivi. Metotlar thread-safe'tir; `serve`, soket
+        sunucusunu süre dolana veya arama sonuçlanana kadar (her önek
+        tükendiğinde ya da en iyi çözüm sınıra `gap` kadar yaklaştığında)
+        çalıştırır ve birleşik sonucu döndürür.
+    """
+
+    def __init__(
+        self,
+        space: SearchSpace,
+        requirements_data: Dict[str, Any],
+        modules_data: Dict[str, Any],
+        strategies: Sequence[str],
+        time_limit_s: float,
+        shard_time_s: float,
+        shard_by: str = "seed",
+        shards: int = 16,
+        seed: int = 0,
+        top_k: int = 16,
+        gap: Optional[float] = None,
+        heartbeat_s: float = HEARTBEAT_TIMEOUT_S,
+    ) -> None:
+        if shard_by not in SHARD_MODES:
+            raise ValueError(f"Unknown shard mode '{shard_by}' (available: {', '.join(SHARD_MODES)}).")
+        if shard_time_s <= 0:
+            raise ValueError("Shard time must be positive.")
+        if gap is not None and gap < 0:
+            raise ValueError("Optimality gap must not be negative.")
+        self.space = space
+        self.problem = {
+            "type": "problem",
+            "requirements": requirements_data,
+            "modules": modules_data,
+            "fingerprint": space.fingerprint(),
+            "strategies": list(strategies),
+            "top_k": top_k,
+        }
+        self.time_limit_s = time_limit_s
+        self.shard_time_s = shard_time_s
+        self.shard_by = shard_by
+        self.shards = max(1, shards)
+        self.seed = seed
+        self.top_k = top_k
+        self.gap = gap
+        self.heartbeat_s = heartbeat_s
+
+        self._lock = threading.Lock()
+        self._queue: Deque[Shard] = deque()
+        self._outstanding: Dict[int, Tuple[Shard, str]] = {}
+        self._next_id = 0
+        self._prefixes = prefix_combinations(space, self.shards) if shard_by == "prefix" else [[]]
+        self._root_bound = space.bounds().root().total
+        self._bounds: Dict[Tuple[Tuple[int, int], ...], float] = {}  # prefix -> best reported bound
+        self._exhausted: set = set()  # prefixes a worker searched exhaustively
+        self.settled = threading.Event()  # set once no further shard can pay off
+        self._top: List[Tuple[float, Tuple[int, ...]]] = []  # min-heap
+        self._top_keys: set = set()
+        self.started = time.monotonic()
+        self.deadline = self.started + time_limit_s
+        self.score = -math.inf
+        self.assignment: Optional[Tuple[int, ...]] = None
+        self.owner: Optional[str] = None
+        self.version = 0
+        self.evaluations = 0
+        self.completed = 0
+        self.reassigned = 0
+        self.workers: Dict[str, float] = {}  # name -> last heard (monotonic)
+
+    # ----- shard bookkeeping -----
+
+    def _refill(self) -> None:
+        for prefix in self._prefixes:
+            if _prefix_key(prefix) in self._exhausted:
+                continue
+            self._queue.append(Shard(id=self._next_id, seed=self.seed + self._next_id, prefix=list(prefix)))
+            self._next_id += 1
+
+    def next_shard(self, worker: str) -> Optional[Dict[str, Any]]:
+        """
+        EN:
+            Next shard message for `worker`, or None once the search is
+            settled or the time limit leaves no room for another shard.
+            Shards of exhausted prefixes are skipped.
+
+        TR:
+            `worker` için sonraki parça mesajı; arama sonuçlanmışsa veya
+            süre sınırı başka bir parçaya yer bırakmıyorsa None. Tükenmiş
+            öneklerin parçaları atlanır.
+        """
+        with self._lock:
+            remaining = self.deadline - time.monotonic()
+            if self.settled.is_set() or remaining < min(1.0, self.shard_time_s):
+                return None
+            while True:
+                if not self._queue:
+                    self._refill()
+                shard = self._queue.popleft()
+                if _prefix_key(shard.prefix) not in self._exhausted:
+                    break
+            shard.attempts += 1
+            self._outstanding[shard.id] = (shard, worker)
+            return {
+                "type": "shard",
+                "id": shard.id,
+                "seed": shard.seed,
+                "prefix": shard.prefix,
+                "time_s": min(self.shard_time_s, remaining),
+                "start": list(self.assignment) if self.assignment is not None else None,
+            }
+
+    def fail(self, worker: str) -> List[int]:
+        """
+        EN:
+            Requeue every shard held by a dead worker (front of the queue).
+
+        TR:
+            Ölen bir işçinin elindeki tüm parçaları kuyruğun başına geri
+            koyar.
+        """
+        with self._lock:
+            lost = [sid for sid, (_, owner) in self._outstanding.items() if owner == worker]
+            for sid in lost:
+                shard, _ = self._outstanding.pop(sid)
+                self._queue.appendleft(shard)
+                self.reassigned += 1
+            self.workers.pop(worker, None)
+            return lost
+
+    def offer(self, assignment: Any, worker: str) -> bool:
+        """
+        EN:
+            Record a worker's candidate. The assignment must have one
+            in-range option index per feature; its score is recomputed with
+            `space.score`, never taken from the message. Returns False for
+            an invalid assignment.
+
+        TR:
+            Bir işçinin adayını kaydeder. Atama her özellik için geçerli
+            aralıkta bir seçenek indeksi içermelidir; skoru mesajdan
+            alınmaz, `space.score` ile yeniden hesaplanır. Geçersiz atama
+            için False döndürür.
+        """
+        key = self._validate(assignment)
+        if key is None:
+            return False
+        with self._lock:
+            if key in self._top_keys or key == self.assignment:
+                return True
+        score = self.space.score(key).score
+        if score is None:
+            return False
+        with self._lock:
+            if key not in self._top_keys:
+                if len(self._top) < self.top_k:
+                    heapq.heappush(self._top, (score, key))
+                    self._top_keys.add(key)
+                elif score > self._top[0][0]:
+                    _, dropped = heapq.heapreplace(self._top, (score, key))
+                    self._top_keys.discard(dropped)
+                    self._top_keys.add(key)
+            if score > self.score:
+                self.score, self.assignment, self.owner = score, key, worker
+                self.version += 1
+                self._check_settled()
+        return True
+
+    def _bound(self) -> float:
+        # A bound on the full space is the weakest bound over the prefixes covering it
+        return min(
+            max(self._root_bound, self._bounds.get(_prefix_key(prefix), -math.inf))
+            for prefix in self._prefixes
+        )
+
+    def _check_settled(self) -> None:
+        if all(_prefix_key(prefix) in self._exhausted for prefix in self._prefixes):
+            self.settled.set()
+        elif (
+            self.gap is not None
+            and self.assignment is not None
+            and optimality_gap(self.score, self._bound()) <= self.gap
+        ):
+            self.settled.set()
+
+    def bound(self) -> Tuple[float, bool]:
+        """
+        EN:
+            Current lower bound on -score over the full space, and whether
+            every prefix has been exhausted (the incumbent is optimal).
+
+        TR:
+            Tüm uzayda -skor için güncel alt sınır ve her önekin tükenip
+            tükenmediği (tükendiyse en iyi çözüm optimaldir).
+        """
+        with self._lock:
+            exhausted = all(_prefix_key(prefix) in self._exhausted for prefix in self._prefixes)
+            return self._bound(), exhausted
+
+    def _validate(self, assignment: Any) -> Optional[Tuple[int, ...]]:
+        domains = self.space.domains
+        if not isinstance(assignment, (list, tuple)) or len(assignment) != len(domains):
+            return None
+        if not all(type(o) is int and 0 <= o < len(d) for o, d in zip(assignment, domains)):
+            return None
+        return tuple(assignment)
+
+    def progress(self, message: Dict[str, Any], worker: str) -> Dict[str, Any]:
+        if message.get("assignment") is not None and not self.offer(message["assignment"], worker):
+            print(f"Ignoring invalid progress assignment from {worker}.", file=sys.stderr)
+        with self._lock:
+            return {
+                "type": "bound",
+                "score": self.score if self.assignment is not None else None,
+                "assignment": list(self.assignment) if self.assignment is not None else None,
+                "stop": self.settled.is_set(),
+            }
+
+    def finish(self, message: Dict[str, Any], worker: str) -> None:
+        top = message.get("top")
+        rejected = 0
+        for entry in top if isinstance(top, list) else []:
+            if not (isinstance(entry, (list, tuple)) and len(entry) == 2 and self.offer(entry[1], worker)):
+                rejected += 1
+        if rejected:
+            print(f"Ignoring {rejected} invalid result candidate(s) from {worker}.", file=sys.stderr)
+        shard, evaluations = message.get("shard"), message.get("evaluations", 0)
+        bound = message.get("lower_bound")
+        with self._lock:
+            done = self._outstanding.pop(shard, None) if type(shard) is int else None
+            if done is not None:
+                self.completed += 1
+                key = _prefix_key(done[0].prefix)
+                if type(bound) in (int, float) and math.isfinite(bound):
+                    self._bounds[key] = max(self._bounds.get(key, -math.inf), float(bound))
+                if message.get("exhausted") is True:
+                    self._exhausted.add(key)
+                self._check_settled()
+            if type(evaluations) is int and evaluations > 0:
+                self.evaluations += evaluations
+
+    def outstanding(self) -> int:
+        with self._lock:
+            return len(self._outstanding)
+
+    def snapshot(self) -> Tuple[float, Optional[Tuple[int, ...]], Optional[str], int]:
+        with self._lock:
+            return self.score, self.assignment, self.owner, self.version
+
+    def top(self) -> List[Tuple[float, Tuple[int, ...]]]:
+        with self._lock:
+            return sorted(self._top, reverse=True)
+
+    # ----- serving -----
+
+    def serve(
+        self,
+        address: str,
+        spawn: int = 0,
+        progress: Optional[Callable[[SearchProgress], None]] = None,
+        progress_interval_s: float = 1.0,
+        on_improve: Optional[Callable[[ArchitectureCandidate], None]] = None,
+        on_listen: Optional[Callable[[str], None]] = None,
+    ) -> SearchResult:
+        """
+        EN:
+            Listen on `address`, optionally start `spawn` local worker
+            processes, hand out shards until the time limit or until the
+            search is settled, then wait for outstanding shards (up to one
+            heartbeat) and return the best candidate with the merged top-k
+            in `archive` and the combined bound and exhaustion.
+
+        TR:
+            `address` üzerinde dinler, isteğe bağlı olarak `spawn` yerel
+            işçi süreci başlatır, süre dolana veya arama sonuçlanana kadar
+            parça dağıtır, ardından bekleyen parçaları (en fazla bir kalp
+            atışı) bekler ve en iyi adayı, birleşik en iyi k (`archive`),
+            birleşik sınır ve tükenme bilgisiyle döndürür.
+        """
+        family, addr = parse_address(address)
+        server = _make_server(family, addr, self)
+        bound = format_address(family, server.server_address if family == "tcp" else addr)
+        if on_listen is not None:
+            on_listen(bound)
+        serving = threading.Thread(target=server.serve_forever, name="zac-coordinator", daemon=True)
+        serving.start()
+        self.started = time.monotonic()
+        self.deadline = self.started + self.time_limit_s
+
+        children = [
+            subprocess.Popen([sys.executable, "-m", "zac", "worker", "--connect", bound, "--name", f"local-{i}"])
+            for i in range(spawn)
+        ]
+        reported = -1
+        try:
+            while True:
+                now = time.monotonic()
+                if now >= self.deadline + self.heartbeat_s:
+                    break
+                if (now >= self.deadline or self.settled.is_set()) and not self.outstanding():
+                    break
+                self.settled.wait(min(progress_interval_s, max(0.05, self.deadline - now)))
+                if self.settled.is_set():
+                    time.sleep(0.05)  # let running shards stop and report
+                score, assignment, owner, version = self.snapshot()
+                elapsed = time.monotonic() - self.started
+                lower_bound, _ = self.bound()
+                if progress is not None:
+                    progress(
+                        SearchProgress(
+                            elapsed_s=elapsed,
+                            best_score=score,
+                            evaluations=self.evaluations,
+                            pruned=0,
+                            duplicates=0,
+                            candidates_per_s=self.evaluations / elapsed if elapsed > 0 else 0.0,
+                            owner=owner,
+                            optimality_gap=optimality_gap(score, lower_bound) if assignment is not None else None,
+                        )
+                    )
+                if on_improve is not None and assignment is not None and version != reported:
+                    on_improve(self.space.score(assignment))
+                    reported = version
+        finally:
+            server.shutdown()
+            server.server_close()
+            if family == "unix" and os.path.exists(addr):
+                os.unlink(addr)
+            for child in children:
+                try:
+                    child.wait(timeout=self.heartbeat_s)
+                except subprocess.TimeoutExpired:
+                    child.kill()
+
+        score, assignment, owner, _ = self.snapshot()
+        if assignment is None:
+            raise ValueError("No worker returned a candidate before the time limit.")
+        best = self.space.score(assignment)
+        lower_bound, exhausted = self.bound()
+        return SearchResult(
+            best=best,
+            assignment=assignment,
+            owner=owner,
+            evaluations=self.evaluations,
+            pruned=0,
+            elapsed_s=time.monotonic() - self.started,
+            iterations={"shards": self.completed, "reassigned": self.reassigned},
+            archive=self.top(),
+            lower_bound=lower_bound,
+            optimality_gap=optimality_gap(best.score, lower_bound) if best.score is not None else None,
+            exhausted=exhausted,
+        )
+
+    def handle(self, rfile, wfile, connection: socket.socket) -> None:
+        """
+        EN:
+            Serve one worker connection; requeue its shards if it dies.
+
+        TR:
+            Tek bir işçi bağlantısına hizmet eder; ölürse parçalarını
+            yeniden kuyruğa koyar.
+        """
+        hello = _receive(rfile)
+        if hello is None or hello.get("type") != "hello":
+            return
+        worker = str(hello.get("worker") or "worker")
+        with self._lock:
+            if worker in self.workers:
+                worker = f"{worker}#{id(connection):x}"
+        _send(wfile, self.problem)
+        ready = _receive(rfile)
+        if ready is None or ready.get("type") != "ready":
+            return
+        with self._lock:
+            self.workers[worker] = time.monotonic()
+        connection.settimeout(self.heartbeat_s)
+        try:
+            while True:
+                message = _receive(rfile)
+                if message is None:
+                    break
+                with self._lock:
+                    self.workers[worker] = time.monotonic()
+                kind = message.get("type")
+                if kind == "next":
+                    shard = self.next_shard(worker)
+                    if shard is None:
+                        _send(wfile, {"type": "done"})
+                        break
+                    _send(wfile, shard)
+                elif kind == "progress":
+                    _send(wfile, self.progress(message, worker))
+                elif kind == "result":
+                    self.finish(message, worker)
+                else:
+                    raise ValueError(f"Unexpected message '{kind}' from {worker}.")
+        except (OSError, ValueError) as exc:
+            print(f"Worker {worker} lost: {exc}", file=sys.stderr)
+        finally:
+            lost = self.fail(worker)
+            if lost:
+                print(f"Reassigning shard(s) {', '.join(map(str, lost))} of {worker}.", file=sys.stderr)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        self.server.coordinator.handle(self.rfile, self.wfile, self.connection)
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+def _make_server(family: str, address: Any, coordinator: Coordinator) -> socketserver.BaseServer:
+    if family == "unix":
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise ValueError("Unix sockets are not supported on this platform.")
+        if os.path.exists(address):
+            os.unlink(address)
+        server = _UnixServer(address, _Handler)
+    else:
+        server = _TCPServer(address, _Handler)
+    server.coordinator = coordinator
+    return server
+
+
+# ---------- Worker / İşçi ----------
+
+
+def _connect(address: str, retry_s: float) -> socket.socket:
+    family, addr = parse_address(address)
+    deadline = time.monotonic() + retry_s
+    while True:
+        try:
+            if family == "unix":
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(addr)
+                return sock
+            return socket.create_connection(addr)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+
+
+def run_worker(
+    address: str,
+    name: Optional[str] = None,
+    progress_interval_s: float = 1.0,
+    retry_s: float = 10.0,
+) -> int:
+    """
+    EN:
+        Connect to a coordinator and process shards until it says done.
+        Returns the number of completed shards.
+
+    TR:
+        Bir koordinatöre bağlanır ve o bitti diyene kadar parçaları işler.
+        Tamamlanan parça sayısını döndürür.
+    """
+    sock = _connect(address, retry_s)
+    rfile, wfile = sock.makefile("rb"), sock.makefile("wb")
+    try:
+        _send(wfile, {"type": "hello", "worker": name or f"{socket.gethostname()}-{os.getpid()}"})
+        problem = _receive(rfile)
+        if problem is None or problem.get("type") != "problem":
+            raise ValueError("Coordinator did not send a problem.")
+        requirements = loader.parse_requirements(problem["requirements"])
+        modules = loader.parse_module_library(problem["modules"])
+        space = SearchSpace.from_problem(requirements, modules)
+        if space.fingerprint() != problem["fingerprint"]:
+            raise ValueError("Worker built a different search space than the coordinator.")
+        baseline = scorer.select_best(
+            scorer.score_candidates(generator.generate_candidates(requirements, modules))
+        )
+        _send(wfile, {"type": "ready"})
+
+        completed = 0
+        while True:
+            _send(wfile, {"type": "next"})
+            message = _receive(rfile)
+            if message is None or message.get("type") == "done":
+                return completed
+            _run_shard(space, baseline, problem, message, rfile, wfile, progress_interval_s)
+            completed += 1
+    finally:
+        sock.close()
+
+
+def _run_shard(
+    space: SearchSpace,
+    baseline: ArchitectureCandidate,
+    problem: Dict[str, Any],
+    shard: Dict[str, Any],
+    rfile,
+    wfile,
+    progress_interval_s: float,
+) -> None:
+    prefix = [(int(f), int(o)) for f, o in shard["prefix"]]
+    sub = restrict(space, prefix)
+    start = _to_shard(shard["start"], prefix) if shard.get("start") is not None else None
+    if start is not None:
+        baseline = sub.score(start)
+    else:
+        baseline = sub.score(_to_shard(_to_full(space.project(baseline), prefix), prefix))
+    incumbent = Incumbent(archive_size=int(problem["top_k"]))
+
+    def _exchange(p: SearchProgress) -> None:
+        score, assignment, _, _ = incumbent.snapshot()
+        _send(wfile, {
+            "type": "progress",
+            "shard": shard["id"],
+            "score": score if assignment is not None else None,
+            "assignment": _to_full(assignment, prefix) if assignment is not None else None,
+            "evaluations": p.evaluations,
+        })
+        bound = _receive(rfile)
+        if bound is None:
+            raise ConnectionError("Coordinator closed the connection.")
+        if bound.get("stop"):
+            incumbent.aim(-math.inf)  # the search is settled: end the shard now
+        if bound.get("assignment") is not None and bound["score"] > incumbent.score:
+            local = _to_shard(bound["assignment"], prefix)
+            if local is not None:
+                incumbent.offer(float(bound["score"]), local, "coordinator")
+
+    result = run_portfolio(
+        sub,
+        baseline=baseline,
+        strategies=problem["strategies"],
+        time_limit_s=float(shard["time_s"]),
+        seed=int(shard["seed"]),
+        progress=_exchange,
+        progress_interval_s=progress_interval_s,
+        incumbent=incumbent,
+    )
+    top = result.archive or [(result.best.score, result.assignment)]
+    _send(wfile, {
+        "type": "result",
+        "shard": shard["id"],
+        "top": [[score, _to_full(assignment, prefix)] for score, assignment in top],
+        "evaluations": result.evaluations,
+        "exhausted": result.exhausted,
+        "lower_bound": result.lower_bound,
+    })
@@ -13,8 +13,10 @@ TR:
 from __future__ import annotations
 
 import math
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from . import network, placement, propagation
+from .spatial import ZoneIndex
 from .model import (
     RequirementSet,
     ModuleLibrary,
@@ -25,60 +27,163 @@ from .model import (
     Module,
     Feature,
 )
+from .propagation import DomainMatrix
 
+_FALLBACK_LINK_M = 2.5  # rough link length when a zone has no position
 
-def _find_zone_by_name(zones: List[Zone], name: str | None) -> Zone | None:
+
+def _zone_positions(zones: List[Zone]) -> Dict[str, int]:
     """
     EN:
-        Helper to find a zone by name.
+        Zone name -> index in `zones`, built once so lookups by name do not
+        scan every zone (the first zone wins on duplicate names).
 
     TR:
-        İsme göre zon bulmak için yardımcı fonksiyon.
+        Zon adı -> `zones` içindeki indeks; ada göre aramalar her zonu
+        taramasın diye bir kez kurulur (yinelenen adlarda ilk zon
+        geçerlidir).
     """
-    if name is None:
-        return None
-    for z in zones:
-        if z.name == name:
-            return z
-    return None
+    return {z.name: i for i, z in reversed(list(enumerate(zones)))}
 
 
 def _choose_zone(
     feature: Feature,
     module: Module,
     zones: List[Zone],
+    index: Optional[ZoneIndex] = None,
+    zone_idx: Optional[Dict[str, int]] = None,
 ) -> Zone:
     """
     EN:
         Pick the first matching zone according to hint/candidates.
+        Without a hint, a feature with a mounting `position` goes to the
+        nearest zone (among its candidates, if any) that still has power
+        for the module according to `index`. Pass `zone_idx`
+        (`_zone_positions`) to reuse the name lookup across features.
 
     TR:
         İpucu veya aday listesine göre ilk eşleşen zonu seçer.
+        İpucu yoksa, montaj konumu (`position`) verilen bir özellik,
+        `index`e göre modül için hâlâ gücü olan en yakın zona (varsa
+        adayları arasından) yerleştirilir. Ad aramasını özellikler arasında
+        yeniden kullanmak için `zone_idx` (`_zone_positions`) verilebilir.
     """
     if not zones:
         raise ValueError("At least one zone is required.")
+    if zone_idx is None:
+        zone_idx = _zone_positions(zones)
 
     # Exact hint wins
-    zone = _find_zone_by_name(zones, feature.zone_hint)
-    if zone:
-        return zone
-
-    # Feature preferred zones
-    for candidate in feature.zone_candidates:
-        zone = _find_zone_by_name(zones, candidate)
-        if zone:
-            return zone
-
-    # Module preferred zones
-    for candidate in module.zone_candidates:
-        zone = _find_zone_by_name(zones, candidate)
-        if zone:
-            return zone
+    if feature.zone_hint in zone_idx:
+        return zones[zone_idx[feature.zone_hint]]
+
+    # Nearest zone with enough remaining power
+    if index is not None and feature.position is not None:
+        allowed = None
+        if feature.zone_candidates:
+            allowed = {zone_idx[name] for name in feature.zone_candidates if name in zone_idx}
+        nearest = index.nearest(feature.position, k=1, min_power_kw=module.max_power_kw, allowed=allowed)
+        if nearest:
+            return zones[nearest[0]]
+
+    # Feature preferred zones, then module preferred zones
+    for candidate in feature.zone_candidates + module.zone_candidates:
+        if candidate in zone_idx:
+            return zones[zone_idx[candidate]]
 
     # Fallback to first zone
     return zones[0]
 
 
+def _distance_order(feature: Feature, zones: List[Zone], index: Optional[ZoneIndex]) -> List[int]:
+    """
+    EN:
+        Every zone index, nearest to the feature's mounting `position`
+        first (`ZoneIndex.nearest`), then the unpositioned zones in list
+        order. Without a position (or index) the list order is kept.
+
+    TR:
+        Tüm zon indeksleri; özelliğin montaj konumuna (`position`) en yakın
+        olandan başlayarak (`ZoneIndex.nearest`), ardından konumsuz zonlar
+        liste sırasıyla. Konum (veya indeks) yoksa liste sırası korunur.
+    """
+    if index is None or feature.position is None:
+        return list(range(len(zones)))
+    return index.nearest(feature.position, k=len(index)) + [
+        z for z, zone in enumerate(zones) if zone.position is None
+    ]
+
+
+def _preferred_zones(feature: Feature, module: Module, zone_idx: Dict[str, int], order: List[int]) -> List[int]:
+    """
+    EN:
+        All zone indices in the order `_choose_zone` considers them: hint,
+        feature candidates, module candidates, then the remaining zones in
+        `order` (`_distance_order`, computed once per feature).
+
+    TR:
+        Tüm zon indeksleri, `_choose_zone` ile aynı öncelik sırasında:
+        ipucu, özellik adayları, modül adayları, ardından kalan zonlar
+        `order` sırasıyla (`_distance_order`, özellik başına bir kez
+        hesaplanır).
+    """
+    names = ([feature.zone_hint] if feature.zone_hint else []) + feature.zone_candidates + module.zone_candidates
+    ordered = [zone_idx[name] for name in dict.fromkeys(names) if name in zone_idx]
+    seen = set(ordered)
+    return ordered + [z for z in order if z not in seen]
+
+
+def power_aware_placements(
+    requirements: RequirementSet,
+    modules: ModuleLibrary,
+    matrix: Optional[DomainMatrix] = None,
+) -> List[Tuple[Feature, Module, Zone]]:
+    """
+    EN:
+        Place every supported feature with `placement.first_fit_decreasing`
+        over its propagated (module, zone) domain, modules in library order
+        and zones in `_preferred_zones` order. A feature stays in its
+        `zone_hint` zone unless that zone cannot fit it. Features whose
+        domain is empty keep the `_choose_zone` placement. Pass `matrix` to
+        reuse an existing propagation result.
+
+    TR:
+        Desteklenen her özelliği, yayılım sonrası (modül, zon) alanı
+        üzerinde `placement.first_fit_decreasing` ile yerleştirir; modüller
+        kütüphane sırasıyla, zonlar `_preferred_zones` sırasıyla denenir.
+        Bir özellik, `zone_hint` zonu onu sığdıramadıkça o zonda kalır.
+        Alanı boş olan özellikler `_choose_zone` yerleşimini korur. Mevcut
+        bir yayılım sonucunu kullanmak için `matrix` verilebilir.
+    """
+    if matrix is None:
+        matrix = propagation.propagate(requirements, modules)
+    zones = requirements.zones
+    module_idx = {m.id: i for i, m in enumerate(matrix.modules)}
+    zone_idx = _zone_positions(zones)
+    index = ZoneIndex(zones) if any(f.position is not None for f in matrix.features) else None
+
+    features: List[Feature] = []
+    options: List[List[Tuple[Module, Zone]]] = []
+    for f, feature in enumerate(matrix.features):
+        supporting = modules.find_supporting_modules(feature.id)
+        if not supporting:
+            continue
+        order = _distance_order(feature, zones, index)
+        feasible = [
+            (m, zones[z])
+            for m in supporting
+            for z in _preferred_zones(feature, m, zone_idx, order)
+            if matrix.is_feasible(f, module_idx[m.id], z)
+        ]
+        if not feasible:
+            feasible = [(supporting[0], _choose_zone(feature, supporting[0], zones, zone_idx=zone_idx))]
+        features.append(feature)
+        options.append(feasible)
+
+    chosen = placement.first_fit_decreasing(zones, options, hints=[f.zone_hint for f in features])
+    return [(feature, *opts[c]) for feature, opts, c in zip(features, options, chosen)]
+
+
 def _estimate_link_length(src: Zone, dst: Zone) -> float:
     """
     EN:
@@ -95,50 +200,39 @@ def _estimate_link_length(src: Zone, dst: Zone) -> float:
         dy = src.position[1] - dst.position[1]
         return round(math.hypot(dx, dy), 2)
 
-    # Fallback rough estimate
-    return 2.5
+    return _FALLBACK_LINK_M
 
 
-def generate_candidates(
+def build_candidate(
     requirements: RequirementSet,
-    modules: ModuleLibrary,
-    max_candidates: int = 10,
-) -> List[ArchitectureCandidate]:
+    placements: List[Tuple[Feature, Module, Zone]],
+    demands: Optional[Dict[Tuple[str, str], float]] = None,
+) -> ArchitectureCandidate:
     """
     EN:
-        Generate candidate zonal architectures.
-
-        Current simple strategy:
-            * For each feature, pick the first module that supports it.
-            * Place that module into the hinted zone (if any), otherwise
-              into the first available candidate zone.
-            * Create simple point-to-point links in the order modules are added.
+        Build a candidate from explicit (feature, module, zone) placements.
+        Modules are instantiated in the given order and chained with the
+        same sequential links used by `generate_candidates`. When the
+        requirements declare traffic demands, the network is synthesized
+        over those links (`network.synthesize`) and each link takes the
+        medium and bandwidth of its bottleneck segment; otherwise both
+        follow the module's `latency_class`. `demands` is passed on to
+        `network.synthesize`.
 
     TR:
-        Aday zonal mimariler üretir.
-
-        Şu anki basit strateji:
-            * Her özellik için onu destekleyen ilk modülü seçer.
-            * Modülü, varsa zone_hint ile belirtilen zona, yoksa ilk uygun
-              aday zona yerleştirir.
-            * Modüller eklenirken sıralı basit bağlantılar kurar.
+        Açık (özellik, modül, zon) yerleşimlerinden bir aday oluşturur.
+        Modüller verilen sırayla örneklenir ve `generate_candidates` ile
+        aynı sıralı bağlantılarla birbirine bağlanır. Gereksinimler trafik
+        talebi içeriyorsa ağ bu bağlantılar üzerinden sentezlenir
+        (`network.synthesize`) ve her bağlantı darboğaz segmentinin ortamını
+        ve bant genişliğini alır; aksi halde ikisi de modülün
+        `latency_class` değerini izler. `demands`, `network.synthesize`a
+        iletilir.
     """
-    if not requirements.zones:
-        raise ValueError("At least one zone is required.")
-
     placed_modules: List[PlacedModule] = []
     links: List[Link] = []
 
-    for feature in requirements.features:
-        supporting = modules.find_supporting_modules(feature.id)
-        if not supporting:
-            # If a feature cannot be satisfied, skip it for now.
-            # Gelecekte burada hata veya ceza puanı üretilebilir.
-            continue
-
-        mod_type = supporting[0]  # very naive choice
-        zone = _choose_zone(feature, mod_type, requirements.zones)
-
+    for feature, mod_type, zone in placements:
         placed = PlacedModule(
             module=mod_type,
             zone=zone,
@@ -166,6 +260,78 @@ def generate_candidates(
         modules=placed_modules,
         links=links,
     )
+    if requirements.traffic:
+        candidate.network = network.synthesize(requirements, candidate, demands=demands)
+        network.assign_link_media(candidate, candidate.network)
+    return candidate
+
+
+def generate_candidates(
+    requirements: RequirementSet,
+    modules: ModuleLibrary,
+    max_candidates: int = 10,
+    matrix: Optional[DomainMatrix] = None,
+) -> List[ArchitectureCandidate]:
+    """
+    EN:
+        Generate candidate zonal architectures.
+
+        Current simple strategy:
+            * For each feature, pick the first module that supports it.
+            * Place that module into the hinted zone (if any), otherwise
+              into the nearest zone with enough remaining power when the
+              feature has a `position` (`spatial.ZoneIndex`), otherwise
+              into the first available candidate zone.
+            * Create simple point-to-point links in the order modules are added.
+
+        A second, power-aware candidate packs the modules into zones
+        first-fit-decreasing by remaining power budget
+        (`power_aware_placements`); it is added when it differs from the
+        first one. `matrix` reuses an existing propagation result.
+
+    TR:
+        Aday zonal mimariler üretir.
+
+        Şu anki basit strateji:
+            * Her özellik için onu destekleyen ilk modülü seçer.
+            * Modülü, varsa zone_hint ile belirtilen zona, yoksa özelliğin
+              `position` değeri varsa yeterli gücü kalan en yakın zona
+              (`spatial.ZoneIndex`), o da yoksa ilk uygun aday zona
+              yerleştirir.
+            * Modüller eklenirken sıralı basit bağlantılar kurar.
+
+        İkinci, güç farkındalıklı aday modülleri kalan güç bütçesine göre
+        azalan sırada ilk-uyan yöntemiyle zonlara yerleştirir
+        (`power_aware_placements`); ilkinden farklıysa eklenir. `matrix`
+        mevcut bir yayılım sonucunu yeniden kullanır.
+    """
+    if not requirements.zones:
+        raise ValueError("At least one zone is required.")
+
+    placements: List[Tuple[Feature, Module, Zone]] = []
+    index = None
+    zone_idx = _zone_positions(requirements.zones)
+    if any(f.position is not None for f in requirements.features):
+        index = ZoneIndex(requirements.zones)
+
+    for feature in requirements.features:
+        supporting = modules.find_supporting_modules(feature.id)
+        if not supporting:
+            # If a feature cannot be satisfied, skip it for now.
+            # Gelecekte burada hata veya ceza puanı üretilebilir.
+            continue
+
+        mod_type = supporting[0]  # very naive choice
+        zone = _choose_zone(feature, mod_type, requirements.zones, index, zone_idx)
+        if index is not None:
+            index.take(zone_idx[zone.name], mod_type.max_power_kw)
+        placements.append((feature, mod_type, zone))
+
+    demands = network.aggregate_demands(requirements.traffic)
+    candidates = [build_candidate(requirements, placements, demands)]
+
+    packed = power_aware_placements(requirements, modules, matrix)
+    if [(f.id, m.id, z.name) for f, m, z in packed] != [(f.id, m.id, z.name) for f, m, z in placements]:
+        candidates.append(build_candidate(requirements, packed, demands))
 
-    # Only one candidate for now; later we can extend to multiple.
-    return [candidate][:max_candidates]
+    return candidates[:max_candidates]
@@ -11,11 +11,13 @@ TR:
 
 from __future__ import annotations
 
+import itertools
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from . import model
+from .propagation import asil_rank
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
@@ -29,24 +31,36 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _parse_position(data: Dict[str, Any], where: str) -> Optional[Tuple[float, float]]:
+    if not isinstance(data.get("position"), dict):
+        return None
+    pos_data = data["position"]
+    if "x" in pos_data and "y" in pos_data:
+        return (float(pos_data["x"]), float(pos_data["y"]))
+    raise ValueError(f"{where} position must include x and y.")
+
+
+def _parse_safety_level(data: Dict[str, Any], where: str) -> Optional[str]:
+    level = data.get("safety_level")
+    try:
+        asil_rank(level)
+    except ValueError as exc:
+        raise ValueError(f"{where} has unknown safety_level '{level}' (expected QM or ASIL-A..ASIL-D).") from exc
+    return level
+
+
 def _parse_zone(zone_data: Dict[str, Any]) -> model.Zone:
     if "name" not in zone_data:
         raise ValueError("Zone is missing required field 'name'.")
     if "max_power_kw" not in zone_data:
         raise ValueError(f"Zone '{zone_data.get('name', 'unknown')}' is missing 'max_power_kw'.")
 
-    position = None
-    if isinstance(zone_data.get("position"), dict):
-        pos_data = zone_data["position"]
-        if "x" in pos_data and "y" in pos_data:
-            position = (float(pos_data["x"]), float(pos_data["y"]))
-        else:
-            raise ValueError(f"Zone '{zone_data['name']}' position must include x and y.")
+    position = _parse_position(zone_data, f"Zone '{zone_data['name']}'")
 
     return model.Zone(
         name=str(zone_data["name"]),
         max_power_kw=float(zone_data["max_power_kw"]),
-        safety_level=zone_data.get("safety_level"),
+        safety_level=_parse_safety_level(zone_data, f"Zone '{zone_data['name']}'"),
         latency_budget_ms=(
             float(zone_data["latency_budget_ms"])
             if "latency_budget_ms" in zone_data else None
@@ -75,12 +89,13 @@ def _parse_feature(feature_data: Dict[str, Any]) -> model.Feature:
         description=feature_data.get("description"),
         zone_hint=feature_data.get("zone_hint"),
         zone_candidates=[str(z) for z in zone_candidates],
-        safety_level=feature_data.get("safety_level"),
+        safety_level=_parse_safety_level(feature_data, f"Feature '{feature_data['id']}'"),
         latency_budget_ms=(
             float(feature_data["latency_budget_ms"])
             if "latency_budget_ms" in feature_data else None
         ),
         redundancy=redundancy_val,
+        position=_parse_position(feature_data, f"Feature '{feature_data['id']}'"),
     )
 
 
@@ -119,6 +134,59 @@ def _parse_module(module_data: Dict[str, Any]) -> model.Module:
     )
 
 
+def _parse_traffic(entry: Dict[str, Any], feature_ids: set, where: str) -> model.TrafficDemand:
+    for key in ("src", "dst", "mbps"):
+        if key not in entry:
+            raise ValueError(f"Traffic demand in {where} is missing '{key}'.")
+    for key in ("src", "dst"):
+        if str(entry[key]) not in feature_ids:
+            raise ValueError(f"Traffic demand in {where} references unknown feature '{entry[key]}'.")
+    try:
+        mbps = float(entry["mbps"])
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Traffic demand in {where} must have a numeric 'mbps'.") from exc
+    if mbps < 0:
+        raise ValueError(f"Traffic demand in {where} must have a non-negative 'mbps'.")
+    return model.TrafficDemand(src=str(entry["src"]), dst=str(entry["dst"]), mbps=mbps)
+
+
+def _load_traffic(
+    data: Dict[str, Any],
+    features_data: List[Dict[str, Any]],
+    features: List[model.Feature],
+) -> List[model.TrafficDemand]:
+    """
+    EN:
+        Collect traffic demands from per-feature `traffic` objects
+        (destination feature id -> Mbps) and a top-level `traffic` list of
+        {src, dst, mbps} flows.
+
+    TR:
+        Trafik taleplerini özellik bazlı `traffic` nesnelerinden (hedef
+        özellik kimliği -> Mbps) ve üst seviye {src, dst, mbps} akış
+        listesinden (`traffic`) toplar.
+    """
+    feature_ids = {f.id for f in features}
+    demands: List[model.TrafficDemand] = []
+    for feature, feature_data in zip(features, features_data):
+        traffic = feature_data.get("traffic") or {}
+        if not isinstance(traffic, dict):
+            raise ValueError(f"Feature '{feature.id}' traffic must be an object of destination -> Mbps.")
+        for dst, mbps in traffic.items():
+            demands.append(
+                _parse_traffic({"src": feature.id, "dst": dst, "mbps": mbps}, feature_ids, f"feature '{feature.id}'")
+            )
+
+    flows = data.get("traffic") or []
+    if not isinstance(flows, list):
+        raise ValueError("Top-level 'traffic' must be a list of {src, dst, mbps} flows.")
+    for idx, entry in enumerate(flows):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Traffic flow #{idx} must be an object.")
+        demands.append(_parse_traffic(entry, feature_ids, f"flow #{idx}"))
+    return demands
+
+
 # ---------- Requirements ----------
 
 
@@ -130,8 +198,17 @@ def load_requirements(path: Path) -> model.RequirementSet:
     TR:
         Gereksinimleri JSON dosyasından okuyup dahili yapılara çevirir.
     """
-    data = _read_json(path)
+    return parse_requirements(_read_json(path))
 
+
+def parse_requirements(data: Dict[str, Any]) -> model.RequirementSet:
+    """
+    EN:
+        Convert an already parsed requirements JSON object.
+
+    TR:
+        Önceden parse edilmiş gereksinim JSON nesnesini dönüştürür.
+    """
     vehicle = data.get("vehicle", {})
     zones_data = data.get("zones") or vehicle.get("zones") or []
     if not zones_data:
@@ -151,6 +228,7 @@ def load_requirements(path: Path) -> model.RequirementSet:
         vehicle_name=vehicle_name,
         zones=zones,
         features=features,
+        traffic=_load_traffic(data, features_data, features),
     )
 
 
@@ -165,7 +243,17 @@ def load_module_library(path: Path) -> model.ModuleLibrary:
     TR:
         Modül kütüphanesini JSON dosyasından yükler.
     """
-    data = _read_json(path)
+    return parse_module_library(_read_json(path))
+
+
+def parse_module_library(data: Dict[str, Any]) -> model.ModuleLibrary:
+    """
+    EN:
+        Convert an already parsed module library JSON object.
+
+    TR:
+        Önceden parse edilmiş modül kütüphanesi JSON nesnesini dönüştürür.
+    """
     modules_data = data.get("modules", [])
 
     if not modules_data:
@@ -176,6 +264,53 @@ def load_module_library(path: Path) -> model.ModuleLibrary:
     return model.ModuleLibrary(modules=modules)
 
 
+# ---------- What-if scenarios ----------
+
+
+def load_scenarios(path: Path) -> List[model.Scenario]:
+    """
+    EN:
+        Load a scenario file. Explicit `scenarios[]` entries
+        (`name`, `overrides`) are kept as-is and a `grid` object
+        (override key -> list of values) is expanded as a cartesian product.
+
+    TR:
+        Senaryo dosyasını yükler. Açık `scenarios[]` girdileri
+        (`name`, `overrides`) olduğu gibi alınır; `grid` nesnesi
+        (anahtar -> değer listesi) kartezyen çarpım olarak açılır.
+    """
+    data = _read_json(path)
+    scenarios: List[model.Scenario] = []
+
+    for idx, entry in enumerate(data.get("scenarios") or []):
+        overrides = entry.get("overrides") or {}
+        if not isinstance(overrides, dict):
+            raise ValueError(f"Scenario #{idx} overrides must be an object.")
+        scenarios.append(
+            model.Scenario(
+                name=str(entry.get("name", f"scenario-{idx}")),
+                overrides={str(k): float(v) for k, v in overrides.items()},
+            )
+        )
+
+    grid = data.get("grid") or {}
+    if not isinstance(grid, dict):
+        raise ValueError("Scenario 'grid' must be an object of value lists.")
+    if grid:
+        keys = list(grid)
+        for key in keys:
+            if not isinstance(grid[key], list) or not grid[key]:
+                raise ValueError(f"Scenario grid entry '{key}' must be a non-empty list.")
+        for values in itertools.product(*(grid[k] for k in keys)):
+            overrides = {k: float(v) for k, v in zip(keys, values)}
+            name = ",".join(f"{k}={v:g}" for k, v in overrides.items())
+            scenarios.append(model.Scenario(name=name, overrides=overrides))
+
+    if not scenarios:
+        raise ValueError("Scenario JSON must include 'scenarios' or a non-empty 'grid'.")
+    return scenarios
+
+
 # ---------- Output architecture JSON ----------
 
 
@@ -234,6 +369,30 @@ def dump_architecture(candidate: model.ArchitectureCandidate, path: Path) -> Non
             "harness_length_m": candidate.harness_length_m,
         },
     }
+    # Reported by time-budgeted searches only; `score_bound` >= `score`
+    for key in ("score_bound", "optimality_gap"):
+        if key in candidate.metrics:
+            payload["metrics"][key] = candidate.metrics[key]
+    if candidate.network is not None:
+        plan = candidate.network
+        payload["architecture"]["network"] = {
+            "segments": [
+                {
+                    "kind": seg.kind,
+                    "src": seg.src,
+                    "dst": seg.dst,
+                    "length_m": seg.length_m,
+                    "medium": seg.medium,
+                    "capacity_mbps": seg.capacity_mbps,
+                    "load_mbps": seg.load_mbps,
+                    "overload_mbps": seg.overload_mbps,
+                }
+                for seg in plan.segments
+            ],
+            "routed_mbps": plan.routed_mbps,
+            "unrouted_mbps": plan.unrouted_mbps,
+        }
+        payload["metrics"]["network_overload_mbps"] = plan.overload_mbps
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -61,6 +61,7 @@ class Feature:
     safety_level: Optional[str] = None  # e.g. "ASIL-B"
     latency_budget_ms: Optional[float] = None
     redundancy: int = 1  # desired instance count
+    position: Optional[Tuple[float, float]] = None  # (x, y) mounting point, same plane as zones
 
 
 @dataclass
@@ -76,6 +77,7 @@ class RequirementSet:
     vehicle_name: str
     zones: List["Zone"]
     features: List[Feature]
+    traffic: List["TrafficDemand"] = field(default_factory=list)
 
 
 # ---------- Module library / Modül kütüphanesi ----------
@@ -131,6 +133,74 @@ class ModuleLibrary:
         ]
 
 
+# ---------- Network / Ağ ----------
+
+
+@dataclass
+class TrafficDemand:
+    """
+    EN:
+        Communication demand between two features, in Mbps.
+
+    TR:
+        İki özellik arasındaki iletişim talebi (Mbps).
+    """
+
+    src: str  # feature id
+    dst: str  # feature id
+    mbps: float
+
+
+@dataclass
+class NetworkSegment:
+    """
+    EN:
+        One physical bus segment of the synthesized network: an "access"
+        segment between a placed module and its zonal gateway, or a
+        "backbone" segment between two zonal gateways.
+
+    TR:
+        Sentezlenen ağın tek bir fiziksel bus segmenti: yerleştirilmiş bir
+        modül ile zon geçidi arasındaki "access" segmenti veya iki zon
+        geçidi arasındaki "backbone" segmenti.
+    """
+
+    kind: str  # "access" or "backbone"
+    src: str  # module id (access) or zone name (backbone)
+    dst: str  # zone name
+    length_m: float
+    load_mbps: float = 0.0
+    medium: str = "CAN"
+    capacity_mbps: float = 0.0
+    overload_mbps: float = 0.0
+
+
+@dataclass
+class NetworkPlan:
+    """
+    EN:
+        Routed traffic and per-segment medium choice of one candidate.
+
+    TR:
+        Bir adayın yönlendirilmiş trafiği ve segment başına ortam seçimi.
+    """
+
+    segments: List[NetworkSegment] = field(default_factory=list)
+    routed_mbps: float = 0.0
+    unrouted_mbps: float = 0.0
+
+    @property
+    def overload_mbps(self) -> float:
+        """
+        EN:
+            Total traffic exceeding the usable capacity of its segments.
+
+        TR:
+            Segmentlerin kullanılabilir kapasitesini aşan toplam trafik.
+        """
+        return sum(s.overload_mbps for s in self.segments)
+
+
 # ---------- Concrete architecture / Somut mimari ----------
 
 
@@ -184,6 +254,7 @@ class ArchitectureCandidate:
     score: Optional[float] = None
     penalties: Dict[str, float] = field(default_factory=dict)
     metrics: Dict[str, float] = field(default_factory=dict)
+    network: Optional[NetworkPlan] = None
 
     @property
     def total_cost(self) -> float:
@@ -218,3 +289,26 @@ class ArchitectureCandidate:
         """
         lengths = [l.length_m for l in self.links if l.length_m is not None]
         return sum(lengths)
+
+
+# ---------- What-if scenarios / Senaryolar ----------
+
+
+@dataclass
+class Scenario:
+    """
+    EN:
+        Named set of parameter overrides for a what-if sweep. Keys are
+        "module.<id>.cost", "module.<id>.cost_scale",
+        "zone.<name>.max_power_kw", "zone.<name>.latency_budget_ms" and
+        "weights.<power|harness|latency|redundancy|bandwidth>".
+
+    TR:
+        What-if taraması için isimlendirilmiş parametre geçersiz kılma
+        kümesi. Anahtarlar "module.<id>.cost", "module.<id>.cost_scale",
+        "zone.<name>.max_power_kw", "zone.<name>.latency_budget_ms" ve
+        "weights.<power|harness|latency|redundancy|bandwidth>" şeklindedir.
+    """
+
+    name: str
+    overrides: Dict[str, float] = field(default_factory=dict)
@@ -0,0 +1,309 @@
+"""
+Capacity-constrained network synthesis.
+
+EN:
+    Routes per-feature traffic demands over a candidate's harness and
+    picks a bus medium (CAN, CAN-FD or Ethernet) for every segment by load.
+
+    Topology: every zone has a gateway; each placed module hangs off its
+    zone gateway through an "access" segment, and every harness link that
+    crosses zones becomes a "backbone" segment between the two gateways.
+
+    Routing is a min-cost multi-commodity flow heuristic: demands are
+    aggregated per (source, destination) module pair, access loads follow
+    directly, and the remaining gateway-to-gateway commodities are routed
+    largest first on congestion-priced shortest paths, followed by
+    rip-up-and-reroute passes over overloaded segments. Work per candidate
+    depends on the number of zone pairs, not on the number of flows, so it
+    is cheap enough to run for every candidate during search. Segments
+    whose load exceeds even Ethernet are reported as overload to the
+    scorer.
+
+TR:
+    Özellik bazlı trafik taleplerini bir adayın kablo demeti üzerinden
+    yönlendirir ve her segment için yüke göre bir bus ortamı (CAN, CAN-FD
+    veya Ethernet) seçer.
+
+    Topoloji: her zonun bir geçidi vardır; yerleştirilen her modül zon
+    geçidine bir "access" segmentiyle bağlanır ve zonlar arası her kablo
+    bağlantısı iki geçit arasında bir "backbone" segmentine dönüşür.
+
+    Yönlendirme, minimum maliyetli çok-mallı akış sezgiselidir: talepler
+    (kaynak, hedef) modül çifti başına toplanır, access yükleri doğrudan
+    hesaplanır, kalan geçitten geçide talepler büyükten küçüğe tıkanıklık
+    fiyatlı en kısa yollarla yönlendirilir, ardından aşırı yüklü
+    segmentler için sök-ve-yeniden-yönlendir geçişleri yapılır. Aday
+    başına iş, akış sayısına değil zon çifti sayısına bağlıdır; bu yüzden
+    arama sırasında her aday için çalıştırılabilecek kadar ucuzdur.
+    Ethernet'i bile aşan segmentler skorlayıcıya aşırı yük olarak
+    bildirilir.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import generator
+from .model import (
+    ArchitectureCandidate,
+    NetworkPlan,
+    NetworkSegment,
+    RequirementSet,
+    TrafficDemand,
+)
+
+# Bus media, cheapest first: (name, nominal capacity in Mbps)
+MEDIA: Tuple[Tuple[str, float], ...] = (
+    ("CAN", 0.5),
+    ("CAN-FD", 5.0),
+    ("Ethernet", 100.0),
+)
+DEFAULT_UTILIZATION = 0.7  # usable share of a medium's nominal capacity
+REROUTE_PASSES = 2
+
+
+def aggregate_demands(traffic: Sequence[TrafficDemand]) -> Dict[Tuple[str, str], float]:
+    """
+    EN:
+        Demands summed per (src, dst) feature pair. `SearchSpace` computes
+        this once and passes it to `synthesize`, so thousands of flows are
+        aggregated once per problem, not per candidate.
+
+    TR:
+        (kaynak, hedef) özellik çifti başına toplanan talepler.
+        `SearchSpace` bunu bir kez hesaplayıp `synthesize`a iletir; böylece
+        binlerce akış aday başına değil problem başına bir kez toplanır.
+    """
+    totals: Dict[Tuple[str, str], float] = {}
+    for demand in traffic:
+        key = (demand.src, demand.dst)
+        totals[key] = totals.get(key, 0.0) + demand.mbps
+    return totals
+
+
+def choose_medium(load_mbps: float, utilization: float = DEFAULT_UTILIZATION) -> Tuple[str, float, float]:
+    """
+    EN:
+        Cheapest medium whose usable capacity carries `load_mbps`, as
+        (medium, nominal capacity, overload). Loads beyond Ethernet keep
+        Ethernet and report the excess as overload.
+
+    TR:
+        `load_mbps` yükünü taşıyabilen en ucuz ortam; (ortam, nominal
+        kapasite, aşırı yük) olarak. Ethernet'i aşan yüklerde Ethernet
+        korunur ve fazlası aşırı yük olarak bildirilir.
+    """
+    for medium, capacity in MEDIA:
+        if load_mbps <= capacity * utilization:
+            return medium, capacity, 0.0
+    medium, capacity = MEDIA[-1]
+    return medium, capacity, load_mbps - capacity * utilization
+
+
+def _congestion_cost(length_m: float, load: float, demand: float, usable: float) -> float:
+    # BPR-style price: nearly the harness length while lightly loaded, steep past capacity.
+    ratio = (load + demand) / usable
+    return length_m * (1.0 + 0.15 * ratio ** 4)
+
+
+def _shortest_path(
+    adjacency: List[List[Tuple[int, int]]],
+    segments: List[NetworkSegment],
+    src: int,
+    dst: int,
+    demand: float,
+    usable: float,
+) -> Optional[List[int]]:
+    """
+    EN:
+        Dijkstra over the gateway graph; returns backbone segment indices.
+
+    TR:
+        Geçit grafiği üzerinde Dijkstra; backbone segment indekslerini
+        döndürür.
+    """
+    dist = {src: 0.0}
+    via: Dict[int, Tuple[int, int]] = {}
+    heap = [(0.0, src)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if node == dst:
+            break
+        if d > dist[node]:
+            continue
+        for neighbor, seg in adjacency[node]:
+            segment = segments[seg]
+            nd = d + _congestion_cost(segment.length_m, segment.load_mbps, demand, usable)
+            if nd < dist.get(neighbor, float("inf")):
+                dist[neighbor] = nd
+                via[neighbor] = (node, seg)
+                heapq.heappush(heap, (nd, neighbor))
+    if dst not in dist:
+        return None
+    path: List[int] = []
+    node = dst
+    while node != src:
+        node, seg = via[node]
+        path.append(seg)
+    return path
+
+
+def synthesize(
+    requirements: RequirementSet,
+    candidate: ArchitectureCandidate,
+    utilization: float = DEFAULT_UTILIZATION,
+    passes: int = REROUTE_PASSES,
+    demands: Optional[Dict[Tuple[str, str], float]] = None,
+) -> NetworkPlan:
+    """
+    EN:
+        Route `requirements.traffic` over the candidate and choose a medium
+        per segment. Demands involving a feature the candidate does not
+        place are counted as unrouted. `demands` reuses an
+        `aggregate_demands` result of the same traffic.
+
+    TR:
+        `requirements.traffic` taleplerini aday üzerinde yönlendirir ve
+        segment başına ortam seçer. Adayın yerleştirmediği bir özelliği
+        içeren talepler yönlendirilmemiş sayılır. `demands`, aynı trafiğin
+        bir `aggregate_demands` sonucunu yeniden kullanır.
+    """
+    if not 0.0 < utilization <= 1.0:
+        raise ValueError("Network utilization must be in (0, 1].")
+
+    zone_idx = {z.name: i for i, z in enumerate(candidate.zones)}
+    segments: List[NetworkSegment] = []
+    module_of: Dict[str, int] = {}
+    for i, pm in enumerate(candidate.modules):
+        segments.append(
+            NetworkSegment(
+                kind="access",
+                src=pm.module.id,
+                dst=pm.zone.name,
+                length_m=generator._estimate_link_length(pm.zone, pm.zone),
+            )
+        )
+        for fid in pm.provided_features:
+            module_of.setdefault(fid, i)
+
+    adjacency: List[List[Tuple[int, int]]] = [[] for _ in candidate.zones]
+    backbone: Dict[Tuple[int, int], int] = {}
+    for link in candidate.links:
+        a, b = zone_idx[link.src.zone.name], zone_idx[link.dst.zone.name]
+        if a == b:
+            continue
+        key = (min(a, b), max(a, b))
+        length = link.length_m if link.length_m is not None else generator._estimate_link_length(
+            link.src.zone, link.dst.zone
+        )
+        if key in backbone:
+            seg = segments[backbone[key]]
+            seg.length_m = min(seg.length_m, length)
+            continue
+        backbone[key] = len(segments)
+        adjacency[key[0]].append((key[1], len(segments)))
+        adjacency[key[1]].append((key[0], len(segments)))
+        segments.append(
+            NetworkSegment(
+                kind="backbone",
+                src=candidate.zones[key[0]].name,
+                dst=candidate.zones[key[1]].name,
+                length_m=length,
+            )
+        )
+
+    plan = NetworkPlan(segments=segments)
+    commodities: Dict[Tuple[int, int], float] = {}
+    if demands is None:
+        demands = aggregate_demands(requirements.traffic)
+    for (src_f, dst_f), mbps in demands.items():
+        src, dst = module_of.get(src_f), module_of.get(dst_f)
+        if src is None or dst is None:
+            plan.unrouted_mbps += mbps
+            continue
+        if src == dst:
+            plan.routed_mbps += mbps
+            continue
+        segments[src].load_mbps += mbps
+        segments[dst].load_mbps += mbps
+        a = zone_idx[candidate.modules[src].zone.name]
+        b = zone_idx[candidate.modules[dst].zone.name]
+        if a != b:
+            commodities[(a, b)] = commodities.get((a, b), 0.0) + mbps
+        plan.routed_mbps += mbps
+
+    usable = MEDIA[-1][1] * utilization
+    paths: Dict[Tuple[int, int], List[int]] = {}
+    for (a, b), mbps in sorted(commodities.items(), key=lambda item: (-item[1], item[0])):
+        path = _shortest_path(adjacency, segments, a, b, mbps, usable)
+        if path is None:
+            plan.routed_mbps -= mbps
+            plan.unrouted_mbps += mbps
+            continue
+        paths[(a, b)] = path
+        for seg in path:
+            segments[seg].load_mbps += mbps
+
+    for _ in range(passes):
+        hot = {i for i, s in enumerate(segments) if s.kind == "backbone" and s.load_mbps > usable}
+        if not hot:
+            break
+        for pair in sorted(paths, key=lambda p: -commodities[p]):
+            if hot.isdisjoint(paths[pair]):
+                continue
+            mbps = commodities[pair]
+            for seg in paths[pair]:
+                segments[seg].load_mbps -= mbps
+            path = _shortest_path(adjacency, segments, pair[0], pair[1], mbps, usable) or paths[pair]
+            paths[pair] = path
+            for seg in path:
+                segments[seg].load_mbps += mbps
+
+    for segment in segments:
+        segment.medium, segment.capacity_mbps, segment.overload_mbps = choose_medium(
+            segment.load_mbps, utilization
+        )
+    return plan
+
+
+def assign_link_media(candidate: ArchitectureCandidate, plan: NetworkPlan) -> None:
+    """
+    EN:
+        Set every harness link's `medium` and `bandwidth_mbps` from the
+        synthesized segments it runs over (both access segments, plus the
+        backbone segment when it crosses zones): the bottleneck segment,
+        i.e. the one with the smallest capacity, wins. Latency scoring then
+        sees the same buses as `architecture.network`.
+
+    TR:
+        Her kablo bağlantısının `medium` ve `bandwidth_mbps` değerlerini
+        üzerinden geçtiği sentezlenmiş segmentlerden (iki access segmenti,
+        zonlar arasıysa ayrıca backbone segmenti) belirler: en küçük
+        kapasiteli darboğaz segment kazanır. Böylece gecikme skorlaması
+        `architecture.network` ile aynı busları görür.
+    """
+    # `synthesize` creates one access segment per placed module, in order
+    access = {id(pm): plan.segments[i] for i, pm in enumerate(candidate.modules)}
+    backbone: Dict[Tuple[str, str], NetworkSegment] = {}
+    for segment in plan.segments:
+        if segment.kind == "backbone":
+            backbone[(segment.src, segment.dst)] = backbone[(segment.dst, segment.src)] = segment
+    for link in candidate.links:
+        route = [access[id(link.src)], access[id(link.dst)]]
+        if link.src.zone.name != link.dst.zone.name:
+            route.append(backbone[(link.src.zone.name, link.dst.zone.name)])
+        bottleneck = min(route, key=lambda segment: segment.capacity_mbps)
+        link.medium, link.bandwidth_mbps = bottleneck.medium, bottleneck.capacity_mbps
+
+
+def demands_for(requirements: RequirementSet, feature_ids: Sequence[str]) -> List[TrafficDemand]:
+    """
+    EN:
+        Demands whose two endpoints are both in `feature_ids`.
+
+    TR:
+        Her iki ucu da `feature_ids` içinde olan talepler.
+    """
+    wanted = set(feature_ids)
+    return [d for d in requirements.traffic if d.src in wanted and d.dst in wanted]
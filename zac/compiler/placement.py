@@ -0,0 +1,184 @@
+"""
+Power-aware zone placement.
+
+EN:
+    Treats zones as bins whose capacity is their `max_power_kw` budget and
+    packs modules first-fit-decreasing: features are placed in decreasing
+    order of module power, each into the feasible zone with the most
+    remaining power. A feature's modules are tried in preference order and
+    the first one that fits is used; when none fits, the option with the
+    smallest overrun is taken and the scorer charges it as a power penalty.
+    An explicit zone hint is kept whenever the hinted zone still fits the
+    feature; hinted features are packed before the others, so only other
+    hinted features can crowd them out.
+
+    Remaining capacities are kept in a max-heap (`heapq`) with lazy
+    deletion: consuming power pushes the zone's new entry in O(log Z) and
+    outdated entries are dropped when they reach the top. A feature that
+    may use any zone reads the emptiest one off the top, in O(log Z) per
+    zone tied with it; a feature restricted to k candidate zones scans
+    those k residuals, O(k). Ties between equally loaded zones go to the
+    zone that comes first in the feature's preference order (hint, feature
+    candidates, module candidates). The result is a balanced, usually
+    power-feasible start point for every search strategy in
+    O(F log F + Σk + F log Z) time.
+
+TR:
+    Zonları kapasitesi `max_power_kw` bütçesi olan kutular olarak ele alır
+    ve modülleri azalan sırada ilk-uyan yöntemiyle yerleştirir: özellikler
+    modül gücüne göre azalan sırada, her biri en çok gücü kalan uygun zona
+    yerleştirilir. Bir özelliğin modülleri tercih sırasıyla denenir ve
+    sığan ilk modül kullanılır; hiçbiri sığmazsa en az aşan seçenek alınır
+    ve skorlayıcı bunu güç cezası olarak yansıtır. Açık bir zon ipucu,
+    ipucu verilen zon özelliği hâlâ sığdırabildiği sürece korunur; ipuçlu
+    özellikler diğerlerinden önce yerleştirilir, böylece onları yalnızca
+    başka ipuçlu özellikler dışarıda bırakabilir.
+
+    Kalan kapasiteler tembel silmeli bir maksimum yığında (`heapq`)
+    tutulur: güç tüketmek zonun yeni girdisini O(log Z) sürede ekler,
+    eskimiş girdiler tepeye ulaştıklarında atılır. Her zonu
+    kullanabilen bir özellik en boş zonu tepeden okur (onunla eşit her
+    zon için O(log Z)); k aday zonla sınırlı bir özellik bu k kalan
+    kapasiteyi tarar, O(k). Eşit yüklü zonlar arasındaki eşitlik,
+    özelliğin tercih sırasında (ipucu, özellik adayları, modül adayları)
+    önce gelen zon lehine bozulur. Sonuç, her arama stratejisi için
+    O(F log F + Σk + F log Z) sürede elde edilen dengeli ve genellikle
+    güç açısından uygulanabilir bir başlangıç noktasıdır.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .model import Module, Zone
+
+Option = Tuple[Module, Zone]
+
+
+class CapacityIndex:
+    """
+    EN:
+        Remaining power per zone, with a lazy max-heap over it. A heap
+        entry is current while its key still equals the zone's residual.
+
+    TR:
+        Zon başına kalan güç ve bunun üzerinde tembel bir maksimum yığın.
+        Bir yığın girdisi, anahtarı zonun kalan gücüne eşit olduğu sürece
+        günceldir.
+    """
+
+    def __init__(self, zones: Sequence[Zone]) -> None:
+        self.residual = [zone.max_power_kw for zone in zones]
+        self._heap = [(-r, z) for z, r in enumerate(self.residual)]
+        heapq.heapify(self._heap)
+
+    def _current(self, entry: Tuple[float, int]) -> bool:
+        return -entry[0] == self.residual[entry[1]]
+
+    def _pop_stale(self) -> None:
+        while not self._current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def best(self, allowed: Dict[int, int]) -> int:
+        """
+        EN:
+            Zone with the most remaining power among `allowed` (zone index
+            -> preference rank); ties go to the lowest rank. O(k) for k
+            allowed zones, O(t log Z) for all Z zones with t tied at the
+            top.
+
+        TR:
+            `allowed` (zon indeksi -> tercih sırası) içinde en çok gücü
+            kalan zon; eşitlikte en düşük sıra kazanır. k izinli zon için
+            O(k); tepede t zonun eşit olduğu tüm Z zon için O(t log Z).
+        """
+        if len(allowed) < len(self.residual):
+            return max(allowed, key=lambda z: (self.residual[z], -allowed[z]))
+        self._pop_stale()
+        top = self._heap[0][0]
+        tied = []
+        while self._heap and self._heap[0][0] == top:
+            entry = heapq.heappop(self._heap)
+            if self._current(entry):
+                tied.append(entry)
+        for entry in tied:
+            heapq.heappush(self._heap, entry)
+        return min((z for _, z in tied), key=allowed.__getitem__)
+
+    def take(self, zone: int, power_kw: float) -> None:
+        """
+        EN:
+            Consume `power_kw` of a zone's remaining budget in O(log Z); the
+            zone's old heap entry goes stale.
+
+        TR:
+            Bir zonun kalan bütçesinden `power_kw` kadar O(log Z) sürede
+            tüketir; zonun eski yığın girdisi eskir.
+        """
+        self.residual[zone] -= power_kw
+        heapq.heappush(self._heap, (-self.residual[zone], zone))
+
+
+def first_fit_decreasing(
+    zones: Sequence[Zone],
+    options: Sequence[Sequence[Option]],
+    hints: Optional[Sequence[Optional[str]]] = None,
+) -> List[Optional[int]]:
+    """
+    EN:
+        Pick one option per feature. `options[f]` lists the feasible
+        (module, zone) pairs of feature `f` in preference order; the
+        result holds the chosen option index per feature (None for an
+        empty option list). `hints[f]` names a zone that feature `f` keeps
+        with its first module that still fits there.
+
+    TR:
+        Her özellik için bir seçenek belirler. `options[f]`, `f`
+        özelliğinin uygulanabilir (modül, zon) çiftlerini tercih sırasıyla
+        listeler; sonuç özellik başına seçilen seçenek indeksini içerir
+        (boş seçenek listesi için None). `hints[f]`, `f` özelliğinin orada
+        hâlâ sığan ilk modülüyle koruduğu zonun adıdır.
+    """
+    zone_idx = {zone.name: z for z, zone in enumerate(zones)}
+    # Per feature, in module preference order: (module, {zone: rank}, {zone: option index})
+    groups: List[List[Tuple[Module, Dict[int, int], Dict[int, int]]]] = []
+    for feature_options in options:
+        by_module: Dict[str, Tuple[Module, Dict[int, int], Dict[int, int]]] = {}
+        for option, (module, zone) in enumerate(feature_options):
+            _, ranks, picks = by_module.setdefault(module.id, (module, {}, {}))
+            z = zone_idx[zone.name]
+            if z not in ranks:
+                ranks[z] = len(ranks)
+                picks[z] = option
+        groups.append(list(by_module.values()))
+
+    hinted = [
+        zone_idx.get(hint) if hint is not None else None
+        for hint in (hints if hints is not None else [None] * len(options))
+    ]
+    order = sorted(
+        (f for f, g in enumerate(groups) if g),
+        key=lambda f: (hinted[f] is None, -groups[f][0][0].max_power_kw, f),
+    )
+    index = CapacityIndex(zones)
+    chosen: List[Optional[int]] = [None] * len(options)
+    for f in order:
+        choice: Optional[Tuple[float, int, int, float]] = None
+        z = hinted[f]
+        for module, ranks, picks in groups[f] if z is not None else ():
+            if z in ranks and index.residual[z] >= module.max_power_kw:
+                choice = (0.0, z, picks[z], module.max_power_kw)
+                break
+        for module, ranks, picks in groups[f] if choice is None else ():
+            z = index.best(ranks)
+            headroom = index.residual[z] - module.max_power_kw
+            if headroom >= 0:
+                choice = (headroom, z, picks[z], module.max_power_kw)
+                break
+            if choice is None or headroom > choice[0]:
+                choice = (headroom, z, picks[z], module.max_power_kw)
+        _, z, option, power = choice
+        index.take(z, power)
+        chosen[f] = option
+    return chosen
@@ -0,0 +1,340 @@
+"""
+Constraint propagation over feature placement domains.
+
+EN:
+    Before any search, rules out (module, zone) placements that can never
+    be valid and detects infeasible features early:
+
+        * the module must support the feature,
+        * the module's `max_power_kw` must fit the zone budget,
+        * a rated zone must reach the feature's ASIL level,
+        * declared `zone_hint` / `zone_candidates` must exist (unknown
+          names are reported); they stay preferences, which only order the
+          baseline placement, unless `restrict_zones` is set, in which case
+          the feature may use those zones only,
+        * modules must fit the power left in a zone after the placements
+          that are already forced (single-zone domains), repeated until
+          nothing changes.
+
+    Each feature's domain is stored as a compact boolean matrix
+    (modules x zones, one byte per cell).
+
+TR:
+    Herhangi bir aramadan önce asla geçerli olamayacak (modül, zon)
+    yerleşimlerini eler ve uygulanamaz özellikleri erkenden tespit eder:
+
+        * modül özelliği desteklemelidir,
+        * modülün `max_power_kw` değeri zon bütçesine sığmalıdır,
+        * güvenlik seviyesi tanımlı bir zon, özelliğin ASIL seviyesine
+          ulaşmalıdır,
+        * belirtilen `zone_hint` / `zone_candidates` var olmalıdır
+          (bilinmeyen adlar raporlanır); bunlar yalnızca başlangıç
+          yerleşimini sıralayan tercihler olarak kalır, `restrict_zones`
+          verilirse özellik yalnızca bu zonları kullanabilir,
+        * modüller, zorunlu yerleşimlerden (tek zonlu alanlar) sonra zonda
+          kalan güce sığmalıdır; bu adım değişiklik kalmayana kadar
+          tekrarlanır.
+
+    Her özelliğin alanı kompakt bir boolean matris (modül x zon, hücre
+    başına bir bayt) olarak tutulur.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .model import Feature, Module, ModuleLibrary, RequirementSet, Zone
+
+_ASIL_RANKS = {"QM": 0, "A": 1, "B": 2, "C": 3, "D": 4}
+
+
+def asil_rank(level: Optional[str]) -> Optional[int]:
+    """
+    EN:
+        Rank an ASIL label ("QM", "ASIL-B", "B", ...) from 0 (QM) to 4 (D).
+        Returns None when no level is given.
+
+    TR:
+        Bir ASIL etiketini ("QM", "ASIL-B", "B", ...) 0 (QM) ile 4 (D)
+        arasında sıralar. Seviye verilmemişse None döndürür.
+    """
+    if level is None:
+        return None
+    key = str(level).strip().upper().replace("ASIL", "").strip(" -_")
+    if key not in _ASIL_RANKS:
+        raise ValueError(f"Unknown safety level '{level}'.")
+    return _ASIL_RANKS[key]
+
+
+@dataclass
+class DomainMatrix:
+    """
+    EN:
+        Feasible (module, zone) domain per feature after propagation.
+        `rows[f][m * len(zones) + z]` is 1 when feature `f` may use module
+        `m` in zone `z`. Features with an empty row are listed in
+        `unsatisfiable` together with the reasons that emptied them.
+
+    TR:
+        Yayılım sonrası her özellik için uygulanabilir (modül, zon) alanı.
+        `rows[f][m * len(zones) + z]`, `f` özelliği `z` zonunda `m` modülünü
+        kullanabiliyorsa 1'dir. Satırı boş kalan özellikler, onları
+        boşaltan nedenlerle birlikte `unsatisfiable` içinde listelenir.
+    """
+
+    features: List[Feature]
+    modules: List[Module]
+    zones: List[Zone]
+    rows: List[bytearray]
+    unsatisfiable: Dict[str, List[str]] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+    initial_sizes: List[int] = field(default_factory=list)
+    restrict_zones: bool = False  # declared zones are a hard restriction, not a preference
+
+    def options(self, feature_idx: int) -> List[Tuple[int, int]]:
+        """
+        EN:
+            Feasible (module index, zone index) pairs of a feature.
+
+        TR:
+            Bir özelliğin uygulanabilir (modül indeksi, zon indeksi) çiftleri.
+        """
+        n_zones = len(self.zones)
+        row = self.rows[feature_idx]
+        return [divmod(cell, n_zones) for cell, ok in enumerate(row) if ok]
+
+    def is_feasible(self, feature_idx: int, module_idx: int, zone_idx: int) -> bool:
+        return bool(self.rows[feature_idx][module_idx * len(self.zones) + zone_idx])
+
+    def domain_sizes(self) -> List[int]:
+        return [sum(row) for row in self.rows]
+
+    def log10_space(self, sizes: Optional[List[int]] = None) -> float:
+        """
+        EN:
+            log10 of the number of complete assignments over satisfiable
+            features (defaults to the propagated domains).
+
+        TR:
+            Karşılanabilir özellikler üzerindeki tam atama sayısının log10
+            değeri (varsayılan olarak yayılım sonrası alanlar).
+        """
+        sizes = self.domain_sizes() if sizes is None else sizes
+        return sum(math.log10(s) for s in sizes if s > 0)
+
+    def summary(self) -> str:
+        before = self.log10_space(self.initial_sizes)
+        after = self.log10_space()
+        return (
+            f"Propagation: {sum(self.initial_sizes)} -> {sum(self.domain_sizes())} placement options, "
+            f"search space 1e{before:.1f} -> 1e{after:.1f}, "
+            f"{len(self.unsatisfiable)} unsatisfiable feature(s)."
+        )
+
+
+def _declared_zones(feature: Feature) -> List[str]:
+    names: List[str] = []
+    for name in ([feature.zone_hint] if feature.zone_hint else []) + feature.zone_candidates:
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def propagate(
+    requirements: RequirementSet,
+    modules: ModuleLibrary,
+    restrict_zones: bool = False,
+) -> DomainMatrix:
+    """
+    EN:
+        Compute the reduced domain matrix for every feature of the
+        requirement set and collect precise infeasibility reasons. With
+        `restrict_zones`, a feature that declares zones may only use the
+        existing ones among them.
+
+    TR:
+        Gereksinim setindeki her özellik için daraltılmış alan matrisini
+        hesaplar ve kesin uygulanamazlık nedenlerini toplar.
+        `restrict_zones` ile zon belirten bir özellik yalnızca bunlardan
+        var olanları kullanabilir.
+    """
+    zones = requirements.zones
+    if not zones:
+        raise ValueError("At least one zone is required.")
+    library = modules.modules
+    n_zones = len(zones)
+    zone_index = {z.name: i for i, z in enumerate(zones)}
+    zone_ranks = [asil_rank(z.safety_level) for z in zones]
+
+    result = DomainMatrix(
+        features=list(requirements.features),
+        modules=library,
+        zones=zones,
+        rows=[],
+        restrict_zones=restrict_zones,
+    )
+
+    for feature in requirements.features:
+        row = bytearray(len(library) * n_zones)
+        reasons: List[str] = []
+        supporting = [i for i, m in enumerate(library) if feature.id in m.supported_features]
+        if not supporting:
+            reasons.append("no module in the library supports it")
+
+        allowed = set(range(n_zones))
+        declared = _declared_zones(feature)
+        if declared:
+            missing = [name for name in declared if name not in zone_index]
+            if missing:
+                result.warnings.append(
+                    f"Feature '{feature.id}' declares unknown zone(s): {', '.join(missing)}."
+                )
+            if restrict_zones:
+                allowed = {zone_index[name] for name in declared if name in zone_index}
+            if not allowed:
+                reasons.append(f"none of its declared zones exist ({', '.join(declared)})")
+
+        required = asil_rank(feature.safety_level)
+        unsafe = [
+            z for z in sorted(allowed)
+            if required is not None and zone_ranks[z] is not None and zone_ranks[z] < required
+        ]
+        if allowed and len(unsafe) == len(allowed):
+            reasons.append(
+                f"candidate zones {', '.join(f'{zones[z].name} ({zones[z].safety_level})' for z in unsafe)} "
+                f"are rated below {feature.safety_level}"
+            )
+        allowed -= set(unsafe)
+
+        too_big = []
+        for m in supporting:
+            fits = [z for z in allowed if library[m].max_power_kw <= zones[z].max_power_kw]
+            if allowed and not fits:
+                too_big.append(m)
+            for z in fits:
+                row[m * n_zones + z] = 1
+        if supporting and allowed and len(too_big) == len(supporting):
+            reasons.append(
+                "power: "
+                + ", ".join(f"{library[m].id} ({library[m].max_power_kw} kW)" for m in too_big)
+                + " exceed every candidate zone budget"
+            )
+
+        result.initial_sizes.append(len(supporting) * n_zones)
+        result.rows.append(row)
+        if not any(row):
+            result.unsatisfiable[feature.id] = reasons or ["no feasible placement"]
+
+    _propagate_forced_power(result)
+    return result
+
+
+def relax(
+    requirements: RequirementSet,
+    modules: ModuleLibrary,
+    feature: Feature,
+    restrict_zones: bool = False,
+) -> Tuple[List[Tuple[Module, Zone]], List[str]]:
+    """
+    EN:
+        Fallback domain of a supported feature whose propagated domain is
+        empty: drop only the constraints that emptied it. With
+        `restrict_zones`, declared zones are kept unless none of them
+        exists (otherwise every zone is considered); the ASIL rating is
+        dropped only when no kept zone reaches it, and the power budget
+        last, only if no module fits a kept zone or residual budgets
+        (after forced placements) were the cause. Power overruns are penalized by the
+        scorer; zone and ASIL violations are not. Returns the (module,
+        zone) options and the names of the dropped constraints ("zones",
+        "asil", "power").
+
+    TR:
+        Desteklenen ama yayılım sonrası alanı boş kalan bir özelliğin yedek
+        alanı: yalnızca alanı boşaltan kısıtlar bırakılır.
+        `restrict_zones` ile belirtilen zonlar, hiçbiri yoksa bırakılır
+        (aksi halde tüm zonlar değerlendirilir); ASIL seviyesi yalnızca
+        tutulan hiçbir zon ona ulaşmıyorsa, güç bütçesi ise en son ve yalnızca
+        hiçbir modül tutulan bir zona sığmıyorsa veya neden kalan bütçeler
+        (zorunlu yerleşimlerden sonra) ise bırakılır. Güç aşımları
+        skorlayıcı tarafından cezalandırılır; zon ve ASIL ihlalleri
+        cezalandırılmaz. (modül, zon) seçeneklerini ve bırakılan kısıtların
+        adlarını ("zones", "asil", "power") döndürür.
+    """
+    supporting = modules.find_supporting_modules(feature.id)
+    if not supporting:
+        return [], []
+    dropped: List[str] = []
+    declared = set(_declared_zones(feature)) if restrict_zones else set()
+    zones = [z for z in requirements.zones if z.name in declared]
+    if not zones:
+        zones = list(requirements.zones)
+        if declared:
+            dropped.append("zones")
+    required = asil_rank(feature.safety_level)
+    safe = [
+        z for z in zones
+        if required is None or asil_rank(z.safety_level) is None or asil_rank(z.safety_level) >= required
+    ]
+    if safe:
+        zones = safe
+    else:
+        dropped.append("asil")
+    fits = [(m, z) for m in supporting for z in zones if m.max_power_kw <= z.max_power_kw]
+    if fits and dropped:
+        return fits, dropped
+    return fits or [(m, z) for m in supporting for z in zones], dropped + ["power"]
+
+
+def _propagate_forced_power(result: DomainMatrix) -> None:
+    """
+    EN:
+        Features whose domain is a single (module, zone) pair are forced;
+        remove other features' options that no longer fit the zone's
+        residual power. Repeats until a fixpoint. A zone already overloaded
+        by forced placements alone is reported and left untouched.
+
+    TR:
+        Alanı tek bir (modül, zon) çiftinden oluşan özellikler zorunludur;
+        diğer özelliklerin zonun kalan gücüne artık sığmayan seçenekleri
+        kaldırılır. Sabit noktaya kadar tekrarlanır. Yalnızca zorunlu
+        yerleşimlerle aşırı yüklenen bir zon raporlanır ve dokunulmaz.
+    """
+    n_zones = len(result.zones)
+    reported = set()
+    changed = True
+    while changed:
+        changed = False
+        forced: Dict[int, int] = {}
+        load = [0.0] * n_zones
+        for f, row in enumerate(result.rows):
+            cells = [cell for cell, ok in enumerate(row) if ok]
+            if len(cells) == 1:
+                m, z = divmod(cells[0], n_zones)
+                forced[f] = cells[0]
+                load[z] += result.modules[m].max_power_kw
+
+        for z, zone in enumerate(result.zones):
+            residual = zone.max_power_kw - load[z]
+            if residual < 0:
+                if z not in reported:
+                    reported.add(z)
+                    result.warnings.append(
+                        f"Zone '{zone.name}' is overloaded by forced placements "
+                        f"({load[z]:.2f} kW > {zone.max_power_kw} kW)."
+                    )
+                continue
+            for f, row in enumerate(result.rows):
+                if f in forced:
+                    continue
+                for m, module in enumerate(result.modules):
+                    cell = m * n_zones + z
+                    if row[cell] and module.max_power_kw > residual:
+                        row[cell] = 0
+                        changed = True
+                        if not any(row):
+                            result.unsatisfiable[result.features[f].id] = [
+                                f"power: no zone has enough residual budget after forced placements "
+                                f"(last removed {module.id} from {zone.name}, {residual:.2f} kW left)"
+                            ]
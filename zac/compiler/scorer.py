@@ -12,12 +12,36 @@ TR:
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .model import ArchitectureCandidate, PlacedModule
 
 
-def _power_penalty(candidate: ArchitectureCandidate) -> Tuple[float, Dict[str, float]]:
+@dataclass(frozen=True)
+class PenaltyWeights:
+    """
+    EN:
+        Multipliers applied to each penalty component.
+
+    TR:
+        Her ceza bileşenine uygulanan çarpanlar.
+    """
+
+    power: float = 100.0  # per kW over a zone budget
+    harness: float = 0.5  # per meter of harness
+    latency: float = 5.0  # per ms over a latency budget
+    redundancy: float = 25.0  # per missing redundant instance
+    bandwidth: float = 20.0  # per Mbps over a network segment's usable capacity
+
+
+DEFAULT_WEIGHTS = PenaltyWeights()
+
+
+def _power_penalty(
+    candidate: ArchitectureCandidate,
+    weights: PenaltyWeights = DEFAULT_WEIGHTS,
+) -> Tuple[float, Dict[str, float]]:
     power_by_zone: Dict[str, float] = {}
     for pm in candidate.modules:
         power_by_zone[pm.zone.name] = power_by_zone.get(pm.zone.name, 0.0) + pm.module.max_power_kw
@@ -26,14 +50,17 @@ def _power_penalty(candidate: ArchitectureCandidate) -> Tuple[float, Dict[str, f
     for zone in candidate.zones:
         over = power_by_zone.get(zone.name, 0.0) - zone.max_power_kw
         if over > 0:
-            penalty += over * 100.0  # harsh penalty to enforce limits
+            penalty += over * weights.power  # harsh penalty to enforce limits
     return penalty, power_by_zone
 
 
-def _harness_penalty(candidate: ArchitectureCandidate) -> float:
+def _harness_penalty(
+    candidate: ArchitectureCandidate,
+    weights: PenaltyWeights = DEFAULT_WEIGHTS,
+) -> float:
     if not candidate.links:
         return 0.0
-    return candidate.harness_length_m * 0.5
+    return candidate.harness_length_m * weights.harness
 
 
 def _estimate_latency_ms(link_latency_ms: float | None, length_m: float | None, medium: str) -> float:
@@ -47,7 +74,10 @@ def _estimate_latency_ms(link_latency_ms: float | None, length_m: float | None,
     return estimated
 
 
-def _latency_penalty(candidate: ArchitectureCandidate) -> float:
+def _latency_penalty(
+    candidate: ArchitectureCandidate,
+    weights: PenaltyWeights = DEFAULT_WEIGHTS,
+) -> float:
     penalty = 0.0
     for link in candidate.links:
         estimated = _estimate_latency_ms(link.latency_ms, link.length_m, link.medium)
@@ -56,49 +86,69 @@ def _latency_penalty(candidate: ArchitectureCandidate) -> float:
         if budgets:
             budget = min(budgets)
             if estimated > budget:
-                penalty += (estimated - budget) * 5.0
+                penalty += (estimated - budget) * weights.latency
         link.latency_ms = estimated
     return penalty
 
 
-def _redundancy_penalty(candidate: ArchitectureCandidate) -> float:
+def _redundancy_penalty(
+    candidate: ArchitectureCandidate,
+    weights: PenaltyWeights = DEFAULT_WEIGHTS,
+) -> float:
     penalty = 0.0
     for pm in candidate.modules:
         if pm.module.redundancy > 1:
             # Placeholder: penalize missing redundant instances.
             shortfall = pm.module.redundancy - 1
-            penalty += shortfall * 25.0
+            penalty += shortfall * weights.redundancy
     return penalty
 
 
+def _bandwidth_penalty(
+    candidate: ArchitectureCandidate,
+    weights: PenaltyWeights = DEFAULT_WEIGHTS,
+) -> float:
+    if candidate.network is None:
+        return 0.0
+    return candidate.network.overload_mbps * weights.bandwidth
+
+
 def score_candidates(
     candidates: Iterable[ArchitectureCandidate],
+    weights: Optional[PenaltyWeights] = None,
 ) -> List[ArchitectureCandidate]:
     """
     EN:
         Compute score for each candidate architecture.
+        `weights` overrides the default penalty multipliers.
 
         Current scoring:
             * Base score = - total_cost
             * Penalize power limit violations
             * Penalize long harness length (rough)
             * Placeholder penalties for latency and redundancy gaps
+            * Penalize overloaded network segments (only when the
+              candidate has a synthesized network)
 
     TR:
         Her mimari adayı için skor hesaplar.
+        `weights`, varsayılan ceza çarpanlarını geçersiz kılar.
 
         Güncel skor:
             * Baz skor = - toplam maliyet
             * Güç limit ihlalleri cezalandırılır
             * Kablo uzunluğu yaklaşık cezası
             * Gecikme ve yedeklilik için placeholder cezalar
+            * Aşırı yüklü ağ segmentleri cezalandırılır (yalnızca adayın
+              sentezlenmiş bir ağı varsa)
     """
+    weights = weights or DEFAULT_WEIGHTS
     scored: List[ArchitectureCandidate] = []
     for cand in candidates:
-        power_penalty, power_by_zone = _power_penalty(cand)
-        harness_penalty = _harness_penalty(cand)
-        latency_penalty = _latency_penalty(cand)
-        redundancy_penalty = _redundancy_penalty(cand)
+        power_penalty, power_by_zone = _power_penalty(cand, weights)
+        harness_penalty = _harness_penalty(cand, weights)
+        latency_penalty = _latency_penalty(cand, weights)
+        redundancy_penalty = _redundancy_penalty(cand, weights)
 
         cand.penalties = {
             "power": power_penalty,
@@ -106,6 +156,8 @@ def score_candidates(
             "latency": latency_penalty,
             "redundancy": redundancy_penalty,
         }
+        if cand.network is not None:
+            cand.penalties["bandwidth"] = _bandwidth_penalty(cand, weights)
         cand.metrics = {
             "total_cost": cand.total_cost,
             "total_power_kw": cand.total_power_kw,
@@ -0,0 +1,1299 @@
+"""
+Time-budgeted anytime search over feature placements.
+
+EN:
+    Runs a portfolio of search strategies (greedy, anneal, ga) concurrently,
+    starting from the `generate_candidates` baseline. Strategies share one
+    incumbent (best score so far), prune moves that cannot beat their
+    acceptance threshold and stop cleanly at the wall-clock deadline, so
+    the best architecture found so far is always available.
+
+TR:
+    `generate_candidates` başlangıç çözümünden yola çıkarak bir arama
+    stratejisi portföyünü (greedy, anneal, ga) eşzamanlı çalıştırır.
+    Stratejiler tek bir en iyi çözümü (incumbent) paylaşır, kabul eşiğini
+    geçemeyecek hamleleri budar ve süre dolduğunda düzgünce durur; böylece
+    o ana kadar bulunan en iyi mimari her zaman elde edilebilir.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import heapq
+import importlib
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+
+from . import generator, network, scorer
+from .bounds import Bounder, optimality_gap
+from .propagation import DomainMatrix, propagate, relax
+from .symmetry import SymmetryInfo, detect as detect_symmetry
+from .model import (
+    ArchitectureCandidate,
+    Feature,
+    Module,
+    ModuleLibrary,
+    RequirementSet,
+    Zone,
+)
+
+if TYPE_CHECKING:
+    from .surrogate import Surrogate
+
+# Option index per searchable feature / Her aranabilir özellik için seçenek indeksi
+Assignment = List[int]
+
+EXHAUSTIVE_LIMIT = 1 << 16  # spaces up to this many assignments are tracked for exhaustion
+IDLE_BACKOFF_S = 0.05  # longest pause of a strategy whose steps find nothing new
+
+
+def parse_duration(text: str) -> float:
+    """
+    EN:
+        Parse a duration such as "30s", "1.5m", "500ms", "2h" or a bare
+        number of seconds.
+
+    TR:
+        "30s", "1.5m", "500ms", "2h" gibi bir süreyi veya yalın saniye
+        değerini ayrıştırır.
+    """
+    value = text.strip().lower()
+    units = (("ms", 0.001), ("s", 1.0), ("m", 60.0), ("h", 3600.0))
+    for suffix, factor in units:
+        if value.endswith(suffix):
+            number = value[: -len(suffix)]
+            break
+    else:
+        number, factor = value, 1.0
+    try:
+        seconds = float(number) * factor
+    except ValueError as exc:
+        raise ValueError(f"Invalid duration '{text}'.") from exc
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive, got '{text}'.")
+    return seconds
+
+
+# ---------- Search space / Arama uzayı ----------
+
+
+@dataclass
+class SearchSpace:
+    """
+    EN:
+        Discrete search space: every searchable feature has a domain of
+        (module, zone) options and an assignment picks one option each.
+
+    TR:
+        Ayrık arama uzayı: her aranabilir özelliğin (modül, zon)
+        seçeneklerinden oluşan bir alanı vardır ve bir atama her biri için
+        bir seçenek belirler.
+    """
+
+    requirements: RequirementSet
+    features: List[Feature]
+    domains: List[List[Tuple[Module, Zone]]]
+    propagation: Optional[DomainMatrix] = None
+    relaxed: Dict[str, List[str]] = field(default_factory=dict)  # feature id -> dropped constraints
+    weights: Optional[scorer.PenaltyWeights] = None
+    symmetry: Optional[SymmetryInfo] = None
+    demands: Dict[Tuple[str, str], float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _bounder: Optional[Bounder] = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint: Optional[Tuple[Optional[scorer.PenaltyWeights], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Traffic aggregated once per space (`network.aggregate_demands`), shared by every build
+        self.demands = network.aggregate_demands(self.requirements.traffic)
+
+    @classmethod
+    def from_problem(
+        cls,
+        requirements: RequirementSet,
+        modules: ModuleLibrary,
+        matrix: Optional[DomainMatrix] = None,
+        break_symmetry: bool = True,
+    ) -> "SearchSpace":
+        """
+        EN:
+            Build the space from the propagated (reduced) domains.
+            Features without a supporting module are left out, exactly as
+            `generate_candidates` skips them. Supported features whose
+            domain propagates to empty get a fallback domain from
+            `propagation.relax`, which drops the power budget first and the
+            ASIL rating of the declared zones only if still needed; they are
+            listed in `relaxed` with the dropped constraints. Only power
+            overruns are penalized by the scorer.
+            Pass `matrix` to reuse an existing propagation result.
+            With `break_symmetry`, zone/module symmetries are detected and
+            symmetric duplicates are removed from the domains.
+
+        TR:
+            Alanı yayılım sonrası (daraltılmış) alanlardan kurar.
+            Destekleyen modülü olmayan özellikler, tıpkı
+            `generate_candidates` gibi dışarıda bırakılır. Alanı yayılımla
+            boşalan desteklenen özellikler
+            `propagation.relax` ile bir yedek alan alır; bu önce güç
+            bütçesini, yalnızca hâlâ gerekirse belirtilen zonların ASIL
+            seviyesini bırakır. Bu özellikler bırakılan kısıtlarla birlikte
+            `relaxed` içinde listelenir; skorlayıcı yalnızca güç aşımlarını
+            cezalandırır. Mevcut bir yayılım sonucunu kullanmak için `matrix`
+            verilebilir. `break_symmetry` ile zon/modül simetrileri tespit
+            edilir ve simetrik kopyalar alanlardan çıkarılır.
+        """
+        if matrix is None:
+            matrix = propagate(requirements, modules)
+
+        features: List[Feature] = []
+        domains: List[List[Tuple[Module, Zone]]] = []
+        relaxed: Dict[str, List[str]] = {}
+        for idx, feature in enumerate(matrix.features):
+            domain = [(matrix.modules[m], matrix.zones[z]) for m, z in matrix.options(idx)]
+            if not domain:
+                domain, dropped = relax(requirements, modules, feature, restrict_zones=matrix.restrict_zones)
+                if not domain:
+                    continue
+                relaxed[feature.id] = dropped
+            features.append(feature)
+            domains.append(domain)
+
+        info = None
+        if break_symmetry:
+            info, domains = detect_symmetry(
+                requirements.zones, [f.id for f in features], domains, traffic=bool(requirements.traffic)
+            )
+        return cls(
+            requirements=requirements,
+            features=features,
+            domains=domains,
+            propagation=matrix,
+            relaxed=relaxed,
+            symmetry=info,
+        )
+
+    def build(self, assignment: Sequence[int]) -> ArchitectureCandidate:
+        """
+        EN:
+            Materialize an assignment as an (unscored) candidate.
+
+        TR:
+            Bir atamayı (skorlanmamış) bir adaya dönüştürür.
+        """
+        placements = [
+            (feature, *domain[option])
+            for feature, domain, option in zip(self.features, self.domains, assignment)
+        ]
+        return generator.build_candidate(self.requirements, placements, self.demands)
+
+    def score(self, assignment: Sequence[int]) -> ArchitectureCandidate:
+        """
+        EN:
+            Build and score an assignment with the space's penalty weights.
+
+        TR:
+            Bir atamayı alanın ceza ağırlıklarıyla oluşturur ve skorlar.
+        """
+        return scorer.score_candidates([self.build(assignment)], weights=self.weights)[0]
+
+    def size(self) -> int:
+        """
+        EN:
+            Number of assignments in the space.
+
+        TR:
+            Uzaydaki atama sayısı.
+        """
+        return math.prod(len(domain) for domain in self.domains)
+
+    def cost(self, assignment: Sequence[int]) -> float:
+        """
+        EN:
+            Hardware cost of an assignment. Penalties are never negative, so
+            `-cost` is an upper bound on the score; `bounds()` gives a
+            tighter one.
+
+        TR:
+            Bir atamanın donanım maliyeti. Cezalar asla negatif olmadığından
+            `-cost` skor için bir üst sınırdır; `bounds()` daha sıkı bir
+            sınır verir.
+        """
+        return sum(domain[option][0].cost for domain, option in zip(self.domains, assignment))
+
+    def bounds(self) -> Bounder:
+        """
+        EN:
+            Admissible bounds for this space (`bounds.Bounder`), rebuilt
+            when the weights change.
+
+        TR:
+            Bu uzay için kabul edilebilir sınırlar (`bounds.Bounder`);
+            ağırlıklar değişince yeniden kurulur.
+        """
+        if self._bounder is None or self._bounder.weights is not self.weights:
+            self._bounder = Bounder(self.requirements, self.domains, self.weights)
+        return self._bounder
+
+    def fingerprint(self) -> str:
+        """
+        EN:
+            Digest of everything an assignment's option indices depend on:
+            requirements, searchable features, domains (with the full
+            module records) and penalty weights, hashed from canonical
+            JSON. Cached on the space and recomputed when the weights
+            change.
+
+        TR:
+            Bir atamanın seçenek indekslerinin bağlı olduğu her şeyin
+            özeti: gereksinimler, aranabilir özellikler, alanlar (modül
+            kayıtlarının tamamıyla) ve ceza ağırlıkları; kanonik JSON'dan
+            hash'lenir. Alanda önbelleğe alınır, ağırlıklar değişince
+            yeniden hesaplanır.
+        """
+        if self._fingerprint is None or self._fingerprint[0] is not self.weights:
+            modules = {m.id: asdict(m) for domain in self.domains for m, _ in domain}
+            problem = {
+                "requirements": asdict(self.requirements),
+                "features": [f.id for f in self.features],
+                "domains": [[[m.id, z.name] for m, z in domain] for domain in self.domains],
+                "modules": modules,
+                "weights": asdict(self.weights) if self.weights is not None else None,
+            }
+            text = json.dumps(problem, sort_keys=True, separators=(",", ":"))
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+            self._fingerprint = (self.weights, digest)
+        return self._fingerprint[1]
+
+    def project(self, candidate: ArchitectureCandidate) -> Assignment:
+        """
+        EN:
+            Map a candidate (e.g. the `generate_candidates` baseline) onto
+            option indices. When symmetry breaking removed the exact
+            placements, a symmetric image of the candidate is used instead.
+            Placements outside a domain fall back to option 0.
+
+        TR:
+            Bir adayı (örn. `generate_candidates` başlangıcı) seçenek
+            indekslerine eşler. Simetri kırma tam yerleşimleri kaldırdıysa
+            adayın simetrik bir görüntüsü kullanılır. Alan dışındaki
+            yerleşimler 0. seçeneğe düşer.
+        """
+        if self.symmetry is not None:
+            image = self._project_symmetric(candidate)
+            if image is not None:
+                return image
+
+        by_feature = {
+            fid: (pm.module.id, pm.zone.name)
+            for pm in candidate.modules
+            for fid in pm.provided_features
+        }
+        assignment: Assignment = []
+        for feature, domain in zip(self.features, self.domains):
+            wanted = by_feature.get(feature.id)
+            option = 0
+            for idx, (module, zone) in enumerate(domain):
+                if (module.id, zone.name) == wanted:
+                    option = idx
+                    break
+            assignment.append(option)
+        return assignment
+
+    def _project_symmetric(self, candidate: ArchitectureCandidate) -> Optional[Assignment]:
+        info = self.symmetry
+        zone_idx = {z.name: i for i, z in enumerate(self.requirements.zones)}
+        by_feature = {
+            fid: (info.module_class.get(pm.module.id), zone_idx.get(pm.zone.name))
+            for pm in candidate.modules
+            for fid in pm.provided_features
+        }
+        wanted = [by_feature.get(f.id) for f in self.features]
+        if any(w is None or None in w for w in wanted):
+            return None
+        lookups = [{key: o for o, key in enumerate(keys)} for keys in info.option_keys]
+        perms = [tuple(range(len(self.requirements.zones)))]
+        broken = next((f for f, feature in enumerate(self.features) if feature.id == info.broken_feature), None)
+        if broken is not None:
+            perms.append(info.to_representative(wanted[broken][1]))
+        for perm in perms:
+            image = [lookup.get((m, perm[z])) for lookup, (m, z) in zip(lookups, wanted)]
+            if None not in image:
+                return image
+        return None
+
+    def key(self, assignment: Sequence[int]) -> Hashable:
+        """
+        EN:
+            Deduplication key: the canonical structural hash when symmetry
+            is known, otherwise the assignment itself.
+
+        TR:
+            Tekilleştirme anahtarı: simetri biliniyorsa kanonik yapısal
+            hash, değilse atamanın kendisi.
+        """
+        if self.symmetry is not None:
+            return self.symmetry.canonical_key(assignment)
+        return tuple(assignment)
+
+
+# ---------- Shared incumbent / Paylaşılan en iyi çözüm ----------
+
+
+class Incumbent:
+    """
+    EN:
+        Thread-safe best-so-far shared by all strategies of a portfolio.
+        With `archive_size > 0` it also keeps the top distinct assignments.
+
+    TR:
+        Portföydeki tüm stratejilerin paylaştığı, thread-safe en iyi çözüm.
+        `archive_size > 0` ise en iyi farklı atamaları da saklar.
+    """
+
+    def __init__(self, archive_size: int = 0) -> None:
+        self._lock = threading.Lock()
+        self.archive_size = archive_size
+        self._archive: List[Tuple[float, Tuple[int, ...]]] = []  # min-heap
+        self._archived: set = set()
+        self.score = -math.inf
+        self.assignment: Optional[Tuple[int, ...]] = None
+        self.owner: Optional[str] = None
+        self.version = 0
+        self.evaluations = 0
+        self.pruned = 0
+        self.duplicates = 0
+        self.memo_size = 1 << 18
+        self._memo: Dict[Hashable, float] = {}
+        self.target = math.inf
+        self.reached = threading.Event()  # set once the score reaches `target`
+        self._settled: Optional[set] = None  # see `track`
+        self._sizes: List[int] = []
+        self._space_size = 0
+        self._cursor = 0
+        self.exhausted = threading.Event()  # set once every tracked assignment is settled
+
+    def aim(self, target: float) -> None:
+        """
+        EN:
+            Set the score at which `reached` fires (e.g. an optimality gap).
+
+        TR:
+            `reached` olayının tetikleneceği skoru belirler (örn. bir
+            optimallik açığı).
+        """
+        self.target = target
+        if self.score >= target:
+            self.reached.set()
+
+    def track(self, domain_sizes: Sequence[int]) -> None:
+        """
+        EN:
+            Start exhaustion tracking for a space with these domain sizes
+            (only up to `EXHAUSTIVE_LIMIT` assignments): `exhausted` fires
+            once every assignment is settled, i.e. scored or unable to beat
+            the incumbent. `unsettled` hands out the rest in order.
+
+        TR:
+            Bu alan boyutlarına sahip bir uzay için tükenme takibini başlatır
+            (yalnızca `EXHAUSTIVE_LIMIT` atamaya kadar): her atama
+            sonuçlandığında, yani skorlandığında veya en iyi çözümü
+            geçemeyeceği bilindiğinde `exhausted` tetiklenir. `unsettled`
+            kalanları sırayla verir.
+        """
+        size = math.prod(domain_sizes)
+        with self._lock:
+            self._settled = set() if size <= EXHAUSTIVE_LIMIT else None
+            self._sizes = list(domain_sizes)
+            self._space_size = size
+            self._cursor = 0
+            self.exhausted.clear()
+
+    def settle(self, assignment: Sequence[int]) -> bool:
+        """
+        EN:
+            Mark an assignment settled; False if it already was (or
+            nothing is tracked, in which case every call counts as new).
+
+        TR:
+            Bir atamayı sonuçlanmış olarak işaretler; zaten öyleyse False
+            döndürür (takip yoksa her çağrı yeni sayılır).
+        """
+        if self._settled is None:
+            return True
+        key = tuple(assignment)
+        with self._lock:
+            if key in self._settled:
+                return False
+            self._settled.add(key)
+            if len(self._settled) >= self._space_size:
+                self.exhausted.set()
+            return True
+
+    def unsettled(self) -> Optional[Assignment]:
+        """
+        EN:
+            Next assignment (in mixed-radix order) that is not settled yet,
+            or None when nothing is tracked or left.
+
+        TR:
+            Henüz sonuçlanmamış sıradaki atama (karışık tabanlı sırayla);
+            takip yoksa veya kalmadıysa None.
+        """
+        if self._settled is None:
+            return None
+        with self._lock:
+            while self._cursor < self._space_size:
+                index, self._cursor = self._cursor, self._cursor + 1
+                assignment = []
+                for size in reversed(self._sizes):
+                    index, digit = divmod(index, size)
+                    assignment.append(digit)
+                assignment.reverse()
+                if tuple(assignment) not in self._settled:
+                    return assignment
+            return None
+
+    def offer(self, score: float, assignment: Sequence[int], owner: str) -> bool:
+        """
+        EN:
+            Record the assignment if it beats the incumbent.
+
+        TR:
+            Atama en iyi çözümü geçiyorsa kaydeder.
+        """
+        if self.archive_size:
+            self._keep(score, tuple(assignment))
+        if score <= self.score:
+            return False
+        with self._lock:
+            if score <= self.score:
+                return False
+            self.score = score
+            self.assignment = tuple(assignment)
+            self.owner = owner
+            self.version += 1
+            if score >= self.target:
+                self.reached.set()
+            return True
+
+    def _keep(self, score: float, key: Tuple[int, ...]) -> None:
+        with self._lock:
+            if key in self._archived:
+                return
+            if len(self._archive) < self.archive_size:
+                heapq.heappush(self._archive, (score, key))
+                self._archived.add(key)
+            elif score > self._archive[0][0]:
+                _, dropped = heapq.heapreplace(self._archive, (score, key))
+                self._archived.discard(dropped)
+                self._archived.add(key)
+
+    def archive(self) -> List[Tuple[float, Tuple[int, ...]]]:
+        """
+        EN:
+            Archived (score, assignment) pairs, best first.
+
+        TR:
+            Arşivlenmiş (skor, atama) çiftleri, en iyisi önce.
+        """
+        with self._lock:
+            return sorted(self._archive, reverse=True)
+
+    def snapshot(self) -> Tuple[float, Optional[Tuple[int, ...]], Optional[str], int]:
+        with self._lock:
+            return self.score, self.assignment, self.owner, self.version
+
+    def count(self, evaluations: int = 0, pruned: int = 0) -> None:
+        with self._lock:
+            self.evaluations += evaluations
+            self.pruned += pruned
+
+    def recall(self, key: Hashable) -> Optional[float]:
+        """
+        EN:
+            Score of an already evaluated (possibly symmetric) candidate.
+
+        TR:
+            Daha önce değerlendirilmiş (olası simetrik) bir adayın skoru.
+        """
+        score = self._memo.get(key)
+        if score is not None:
+            with self._lock:
+                self.duplicates += 1
+        return score
+
+    def remember(self, key: Hashable, score: float) -> None:
+        with self._lock:
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+            self._memo[key] = score
+
+    def state(self, memo_limit: int = 1 << 16) -> Dict[str, Any]:
+        """
+        EN:
+            Copy of the incumbent, counters, archive and the `memo_limit`
+            most recent memo entries, for checkpointing.
+
+        TR:
+            Kontrol noktası için en iyi çözümün, sayaçların, arşivin ve en
+            son `memo_limit` memo girdisinin kopyası.
+        """
+        with self._lock:
+            recent = list(self._memo.items())[-memo_limit:] if memo_limit else []
+            return {
+                "score": self.score,
+                "assignment": self.assignment,
+                "owner": self.owner,
+                "version": self.version,
+                "evaluations": self.evaluations,
+                "pruned": self.pruned,
+                "duplicates": self.duplicates,
+                "archive": list(self._archive),
+                "memo": recent,
+            }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self.score = state["score"]
+            self.assignment = state["assignment"]
+            self.owner = state["owner"]
+            self.version = state["version"]
+            self.evaluations = state["evaluations"]
+            self.pruned = state["pruned"]
+            self.duplicates = state["duplicates"]
+            self._archive = list(state["archive"])[: self.archive_size] if self.archive_size else []
+            heapq.heapify(self._archive)
+            self._archived = {key for _, key in self._archive}
+            self._memo = dict(state["memo"])
+
+
+class Evaluator:
+    """
+    EN:
+        Scores assignments with the regular scorer and feeds the incumbent.
+        A threshold lets the caller skip candidates whose score bound
+        (`SearchSpace.bounds`: exact cost, power, harness and redundancy
+        terms) already rules them out. Every scored candidate is passed to
+        the optional `spill` sink (e.g. a `CandidateStore`) and, with a
+        `surrogate`, trains it (`Surrogate.learn`; `evaluate(features=...)`
+        passes an already computed feature vector).
+
+    TR:
+        Atamaları normal skorlayıcı ile puanlar ve en iyi çözümü besler.
+        Eşik değeri, skor sınırı (`SearchSpace.bounds`: tam maliyet, güç,
+        kablo ve yedeklilik terimleri) nedeniyle elenen adayların
+        puanlanmadan atlanmasını sağlar. Skorlanan her aday isteğe bağlı
+        `spill` hedefine (örn. bir `CandidateStore`) aktarılır ve bir
+        `surrogate` verildiğinde onu eğitir (`Surrogate.learn`;
+        `evaluate(features=...)` önceden hesaplanmış bir özellik vektörünü
+        iletir).
+    """
+
+    def __init__(
+        self,
+        space: SearchSpace,
+        incumbent: Incumbent,
+        owner: str,
+        spill: Optional[Callable[[ArchitectureCandidate], None]] = None,
+        surrogate: Optional["Surrogate"] = None,
+    ) -> None:
+        self.space = space
+        self.incumbent = incumbent
+        self.owner = owner
+        self.spill = spill
+        self.surrogate = surrogate
+        self.work = 0  # exact scores and prunes, i.e. candidates not answered by the memo
+
+    def prune(self, assignment: Sequence[int], threshold: float) -> bool:
+        """
+        EN:
+            True (and counted as pruned) when the score bound of the
+            assignment cannot beat `threshold`.
+
+        TR:
+            Atamanın skor sınırı `threshold` değerini geçemiyorsa True
+            döndürür (ve budanmış sayılır).
+        """
+        if threshold > -math.inf:
+            bound = self._bound(assignment)
+            if bound <= threshold:
+                self.incumbent.count(pruned=1)
+                # Re-pruning a settled candidate is no progress
+                if bound > self.incumbent.score or self.incumbent.settle(assignment):
+                    self.work += 1
+                return True
+        return False
+
+    def evaluate(
+        self,
+        assignment: Sequence[int],
+        threshold: float = -math.inf,
+        features: Optional[Sequence[float]] = None,
+    ) -> Optional[float]:
+        if self.prune(assignment, threshold):
+            return None
+        key = self.space.key(assignment)
+        known = self.incumbent.recall(key)
+        if known is not None:
+            self.incumbent.settle(assignment)
+            return known
+        self.work += 1
+        candidate = self.space.score(assignment)
+        if self.spill is not None:
+            self.spill(candidate)
+        score = candidate.score if candidate.score is not None else -math.inf
+        if self.surrogate is not None:
+            self.surrogate.learn(assignment, score, features)
+        self.incumbent.count(evaluations=1)
+        self.incumbent.remember(key, score)
+        self.incumbent.offer(score, assignment, self.owner)
+        self.incumbent.settle(assignment)
+        return score
+
+    def _bound(self, assignment: Sequence[int]) -> float:
+        # Score bound with a little slack for summation-order rounding.
+        bound = self.space.bounds().score_bound(assignment)
+        return bound + 1e-9 * (1.0 + abs(bound))
+
+
+# ---------- Strategies / Stratejiler ----------
+
+
+class SearchStrategy:
+    """
+    EN:
+        Base class for portfolio members. `step` performs a short, bounded
+        amount of work so the runner can honour the deadline. A step that
+        neither scores nor prunes anything new (`Evaluator.work`) makes
+        the runner back off.
+
+    TR:
+        Portföy üyeleri için temel sınıf. `step`, çalıştırıcının süre
+        sınırına uyabilmesi için kısa ve sınırlı miktarda iş yapar. Yeni
+        hiçbir şey skorlamayan veya budamayan (`Evaluator.work`) bir adım
+        çalıştırıcının beklemesine yol açar.
+    """
+
+    name = "base"
+    batch = 32
+    state_fields: Tuple[str, ...] = ()  # attributes saved in checkpoints
+    screens = False  # uses the portfolio surrogate to skip candidates
+
+    def __init__(
+        self,
+        space: SearchSpace,
+        incumbent: Incumbent,
+        seed: int,
+        spill: Optional[Callable[[ArchitectureCandidate], None]] = None,
+    ) -> None:
+        self.space = space
+        self.incumbent = incumbent
+        self.evaluator = Evaluator(space, incumbent, self.name, spill=spill)
+        self.rng = random.Random(seed)
+        self.iterations = 0
+        self._movable = [i for i, d in enumerate(space.domains) if len(d) > 1]
+        self.lock = threading.Lock()  # held by the runner around each step
+        self.surrogate: Optional["Surrogate"] = None  # set by the runner for `screens` strategies
+
+    def start(self, initial: Assignment) -> None:
+        raise NotImplementedError
+
+    def step(self) -> None:
+        raise NotImplementedError
+
+    def state(self) -> Dict[str, Any]:
+        """
+        EN:
+            Checkpointable state: RNG, iteration counter and `state_fields`.
+            Call with `lock` held so no step is half done.
+
+        TR:
+            Kontrol noktasına yazılabilir durum: RNG, iterasyon sayacı ve
+            `state_fields`. Yarım kalmış adım olmaması için `lock` tutularak
+            çağrılmalıdır.
+        """
+        state = {"rng": self.rng.getstate(), "iterations": self.iterations}
+        for name in self.state_fields:
+            state[name] = copy.deepcopy(getattr(self, name))
+        return state
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        EN:
+            Resume from `state` instead of calling `start`.
+
+        TR:
+            `start` yerine `state` durumundan devam eder.
+        """
+        self.rng.setstate(state["rng"])
+        self.iterations = state["iterations"]
+        for name in self.state_fields:
+            setattr(self, name, state[name])
+
+    def _neighbor(self, assignment: Sequence[int]) -> Optional[Assignment]:
+        if not self._movable:
+            return None
+        neighbor = list(assignment)
+        idx = self.rng.choice(self._movable)
+        choice = self.rng.randrange(len(self.space.domains[idx]) - 1)
+        neighbor[idx] = choice if choice < neighbor[idx] else choice + 1
+        return neighbor
+
+    def _perturb(self, assignment: Sequence[int], moves: int) -> Assignment:
+        perturbed = list(assignment)
+        for _ in range(moves):
+            perturbed = self._neighbor(perturbed) or perturbed
+        return perturbed
+
+    def _incumbent_or(self, fallback: Sequence[int]) -> Assignment:
+        _, assignment, _, _ = self.incumbent.snapshot()
+        return list(assignment if assignment is not None else fallback)
+
+
+class GreedyStrategy(SearchStrategy):
+    """
+    EN:
+        Iterated first-improvement hill climbing. When stuck it restarts
+        from a perturbed copy of the shared incumbent.
+
+    TR:
+        Yinelenen ilk-iyileşme tepe tırmanışı. Takıldığında paylaşılan en
+        iyi çözümün bozulmuş bir kopyasından yeniden başlar.
+    """
+
+    name = "greedy"
+    state_fields = ("current", "current_score", "stall", "patience")
+
+    def start(self, initial: Assignment) -> None:
+        self.current = list(initial)
+        self.current_score = self.evaluator.evaluate(self.current)
+        self.stall = 0
+        self.patience = max(8, 2 * sum(len(self.space.domains[i]) for i in self._movable))
+
+    def step(self) -> None:
+        for _ in range(self.batch):
+            self.iterations += 1
+            neighbor = self._neighbor(self.current)
+            if neighbor is None:
+                return
+            score = self.evaluator.evaluate(neighbor, threshold=self.current_score)
+            if score is not None and score > self.current_score:
+                self.current, self.current_score = neighbor, score
+                self.stall = 0
+                continue
+            self.stall += 1
+            if self.stall >= self.patience:
+                moves = 1 + self.rng.randrange(max(1, len(self._movable) // 4 + 1))
+                self.current = self._perturb(self._incumbent_or(self.current), moves)
+                self.current_score = self.evaluator.evaluate(self.current)
+                self.stall = 0
+
+
+class AnnealStrategy(SearchStrategy):
+    """
+    EN:
+        Simulated annealing with geometric cooling. The Metropolis
+        threshold is drawn before evaluation so hopeless moves are pruned;
+        once frozen it reheats from the shared incumbent.
+
+    TR:
+        Geometrik soğutmalı benzetilmiş tavlama. Metropolis eşiği
+        değerlendirmeden önce çekilir, böylece umutsuz hamleler budanır;
+        donduğunda paylaşılan en iyi çözümden yeniden ısıtılır.
+    """
+
+    name = "anneal"
+    cooling = 0.995
+    state_fields = ("current", "current_score", "t_start", "t_min", "temperature")
+
+    def start(self, initial: Assignment) -> None:
+        self.current = list(initial)
+        self.current_score = self.evaluator.evaluate(self.current)
+        self.t_start = 0.05 * abs(self.current_score or 0.0) + 1.0
+        self.t_min = self.t_start * 1e-3
+        self.temperature = self.t_start
+
+    def step(self) -> None:
+        for _ in range(self.batch):
+            self.iterations += 1
+            neighbor = self._neighbor(self.current)
+            if neighbor is None:
+                return
+            # Accept iff score > current + T*ln(u)  <=>  u < exp(delta / T)
+            threshold = self.current_score + self.temperature * math.log(1.0 - self.rng.random())
+            score = self.evaluator.evaluate(neighbor, threshold=threshold)
+            if score is not None and score > threshold:
+                self.current, self.current_score = neighbor, score
+            self.temperature *= self.cooling
+            if self.temperature < self.t_min:
+                self.current = self._incumbent_or(self.current)
+                self.current_score = self.incumbent.score
+                self.temperature = self.t_start
+
+
+class GAStrategy(SearchStrategy):
+    """
+    EN:
+        Steady-state genetic algorithm: tournament selection, uniform
+        crossover and point mutation. Offspring only enter the population
+        by beating its worst member, which is also the pruning threshold.
+        The shared incumbent migrates in when it is not yet a member.
+        Once a trusted surrogate is attached, each step breeds the whole
+        batch first, drops the children the score bound already rules out
+        and only scores the survivors the surrogate selects.
+
+    TR:
+        Kararlı durum genetik algoritması: turnuva seçimi, düzgün çaprazlama
+        ve nokta mutasyonu. Yavrular popülasyona ancak en kötü üyeyi
+        geçerek girer; bu değer aynı zamanda budama eşiğidir. Paylaşılan en
+        iyi çözüm henüz üye değilse popülasyona göç eder. Güvenilir bir
+        vekil model bağlandığında her adım önce tüm yığını üretir, skor
+        sınırının zaten elediği yavruları atar ve yalnızca kalanlardan
+        vekil modelin seçtiklerini skorlar.
+    """
+
+    name = "ga"
+    population_size = 24
+    state_fields = ("population",)
+    screens = True
+
+    def start(self, initial: Assignment) -> None:
+        self.population: List[Tuple[float, Assignment]] = []
+        seen = set()
+        first = self.evaluator.evaluate(initial)
+        self.population.append((first, list(initial)))
+        seen.add(tuple(initial))
+        attempts = 0
+        while len(self.population) < self.population_size and attempts < 4 * self.population_size:
+            attempts += 1
+            member = self._perturb(initial, 1 + self.rng.randrange(max(1, len(self._movable))))
+            if tuple(member) in seen:
+                continue
+            seen.add(tuple(member))
+            self.population.append((self.evaluator.evaluate(member), member))
+
+    def _tournament(self) -> Assignment:
+        a = self.rng.choice(self.population)
+        b = self.rng.choice(self.population)
+        return a[1] if a[0] >= b[0] else b[1]
+
+    def step(self) -> None:
+        members = {tuple(a) for _, a in self.population}
+        _, best, _, _ = self.incumbent.snapshot()
+        if best is not None and best not in members:
+            self._replace_worst(self.incumbent.score, list(best))
+            members.add(best)
+
+        rate = 1.0 / max(1, len(self.space.domains))
+        if self.surrogate is not None and self.surrogate.trusted:
+            self._screened_step(members, rate)
+            return
+        for _ in range(self.batch):
+            self.iterations += 1
+            child = self._offspring(rate)
+            key = tuple(child)
+            if key in members:
+                continue
+            worst = min(score for score, _ in self.population)
+            score = self.evaluator.evaluate(child, threshold=worst)
+            if score is not None and score > worst:
+                self._replace_worst(score, child)
+                members.add(key)
+
+    def _offspring(self, rate: float) -> Assignment:
+        mother, father = self._tournament(), self._tournament()
+        child = [m if self.rng.random() < 0.5 else f for m, f in zip(mother, father)]
+        for idx in self._movable:
+            if self.rng.random() < rate:
+                child[idx] = self.rng.randrange(len(self.space.domains[idx]))
+        return child
+
+    def _screened_step(self, members: set, rate: float) -> None:
+        children: List[Assignment] = []
+        bred = set()
+        for _ in range(self.batch):
+            self.iterations += 1
+            child = self._offspring(rate)
+            key = tuple(child)
+            if key in members or key in bred:
+                continue
+            bred.add(key)
+            children.append(child)
+
+        # The bound is cheaper than the surrogate's features: screen only what it lets through
+        worst = min(score for score, _ in self.population)
+        children = [c for c in children if not self.evaluator.prune(c, worst)]
+        xs = [self.surrogate.features(c) for c in children]
+        keep, audit = self.surrogate.select(xs, worst)
+        audited = set(audit)
+        for idx in keep + audit:
+            worst = min(score for score, _ in self.population)
+            score = self.evaluator.evaluate(children[idx], features=xs[idx])
+            if idx in audited:
+                self.surrogate.audited(score, worst)
+            if score is not None and score > worst:
+                self._replace_worst(score, children[idx])
+                members.add(tuple(children[idx]))
+
+    def _replace_worst(self, score: float, member: Assignment) -> None:
+        worst_idx = min(range(len(self.population)), key=lambda i: self.population[i][0])
+        self.population[worst_idx] = (score, member)
+
+
+STRATEGIES: Dict[str, Type[SearchStrategy]] = {
+    GreedyStrategy.name: GreedyStrategy,
+    AnnealStrategy.name: AnnealStrategy,
+    GAStrategy.name: GAStrategy,
+}
+
+# Strategies defined outside this package; their module registers them on import.
+LAZY_STRATEGIES: Dict[str, str] = {
+    "native": "zac.optimizer.local_search",
+}
+
+
+def _register_lazy(names: Sequence[str]) -> None:
+    for name in names:
+        if name not in STRATEGIES and name in LAZY_STRATEGIES:
+            importlib.import_module(LAZY_STRATEGIES[name])
+
+
+# ---------- Portfolio runner / Portföy çalıştırıcı ----------
+
+
+@dataclass
+class SearchProgress:
+    """
+    EN:
+        Periodic progress report of a running portfolio.
+
+    TR:
+        Çalışan bir portföyün periyodik ilerleme raporu.
+    """
+
+    elapsed_s: float
+    best_score: float
+    evaluations: int
+    pruned: int
+    duplicates: int
+    candidates_per_s: float
+    owner: Optional[str]
+    optimality_gap: Optional[float] = None
+
+
+@dataclass
+class SearchResult:
+    """
+    EN:
+        Outcome of a portfolio run: the scored best candidate and counters.
+
+    TR:
+        Portföy çalışmasının sonucu: skorlanmış en iyi aday ve sayaçlar.
+    """
+
+    best: ArchitectureCandidate
+    assignment: Tuple[int, ...]
+    owner: Optional[str]
+    evaluations: int
+    pruned: int
+    elapsed_s: float
+    duplicates: int = 0
+    iterations: Dict[str, int] = field(default_factory=dict)
+    archive: List[Tuple[float, Tuple[int, ...]]] = field(default_factory=list)
+    lower_bound: Optional[float] = None  # admissible bound on -score, see `bounds`
+    optimality_gap: Optional[float] = None
+    exhausted: bool = False  # every assignment was settled, so `best` is optimal
+
+
+@dataclass
+class PortfolioState:
+    """
+    EN:
+        Resumable snapshot of a running portfolio: configuration, elapsed
+        time, the shared incumbent and every strategy's state.
+
+    TR:
+        Çalışan bir portföyün devam ettirilebilir anlık görüntüsü:
+        yapılandırma, geçen süre, paylaşılan en iyi çözüm ve her
+        stratejinin durumu.
+    """
+
+    strategies: List[str]
+    seed: int
+    time_limit_s: float
+    elapsed_s: float
+    initial: Assignment
+    archive_size: int
+    incumbent: Dict[str, Any]
+    workers: List[Dict[str, Any]]
+
+
+def run_portfolio(
+    space: SearchSpace,
+    baseline: ArchitectureCandidate,
+    strategies: Sequence[str],
+    time_limit_s: float,
+    seed: int = 0,
+    progress: Optional[Callable[[SearchProgress], None]] = None,
+    progress_interval_s: float = 1.0,
+    on_improve: Optional[Callable[[ArchitectureCandidate], None]] = None,
+    archive_size: int = 0,
+    spill: Optional[Callable[[ArchitectureCandidate], None]] = None,
+    checkpoint: Optional[Callable[[PortfolioState], None]] = None,
+    checkpoint_interval_s: float = 5.0,
+    resume: Optional[PortfolioState] = None,
+    incumbent: Optional[Incumbent] = None,
+    surrogate: Optional["Surrogate"] = None,
+    gap: Optional[float] = None,
+) -> SearchResult:
+    """
+    EN:
+        Run the given strategies concurrently until `time_limit_s` elapses.
+
+        * Every strategy starts from the projected `baseline` candidate.
+        * `progress` is called every `progress_interval_s` seconds.
+        * `on_improve` receives the scored best-so-far candidate whenever
+          the incumbent changed since the previous report, so callers can
+          persist it (e.g. through `dump_architecture`).
+        * `archive_size > 0` keeps that many top distinct assignments in
+          `SearchResult.archive`.
+        * `spill` receives every scored candidate (e.g. `CandidateStore.append`).
+        * `checkpoint` receives a `PortfolioState` every
+          `checkpoint_interval_s` seconds and once at the end.
+        * `resume` continues from such a state: strategies, RNGs, counters
+          and the incumbent are restored and its elapsed time counts
+          against `time_limit_s`.
+        * `incumbent` lets the caller share (and feed) the incumbent,
+          e.g. with bounds received from other machines; its own
+          `archive_size` then applies.
+        * `surrogate` is trained on the exact scores of the strategies
+          that support it (ga) and lets them skip unpromising candidates
+          once trusted. It is not saved in checkpoints; `resume`
+          starts it untrained.
+        * `gap` stops the run early once the incumbent is within that
+          relative optimality gap of the space's lower bound
+          (`SearchSpace.bounds`); the bound and the final gap are
+          reported in the result either way.
+        * Spaces of up to `EXHAUSTIVE_LIMIT` assignments stop as soon as
+          every assignment is settled (`Incumbent.track`); after each
+          step a strategy also scores the next unsettled assignment. The
+          best is then optimal and
+          `SearchResult.exhausted` is set. In larger spaces such a
+          strategy pauses for up to `IDLE_BACKOFF_S` between steps
+          instead of spinning.
+
+    TR:
+        Verilen stratejileri `time_limit_s` süresi dolana kadar eşzamanlı
+        çalıştırır.
+
+        * Her strateji izdüşürülmüş `baseline` adayından başlar.
+        * `progress` her `progress_interval_s` saniyede bir çağrılır.
+        * `on_improve`, bir önceki rapordan beri en iyi çözüm değiştiyse
+          skorlanmış en iyi adayı alır; böylece çağıran taraf onu
+          (örn. `dump_architecture` ile) kalıcı hale getirebilir.
+        * `archive_size > 0`, bu sayıda en iyi farklı atamayı
+          `SearchResult.archive` içinde saklar.
+        * `spill`, skorlanan her adayı alır (örn. `CandidateStore.append`).
+        * `checkpoint`, her `checkpoint_interval_s` saniyede bir ve sonda
+          bir kez `PortfolioState` alır.
+        * `resume`, böyle bir durumdan devam eder: stratejiler, RNG'ler,
+          sayaçlar ve en iyi çözüm geri yüklenir; geçen süre
+          `time_limit_s` bütçesinden düşülür.
+        * `incumbent`, çağıranın en iyi çözümü paylaşmasını (ve örneğin
+          başka makinelerden gelen sınırlarla beslemesini) sağlar; bu
+          durumda onun `archive_size` değeri geçerlidir.
+        * `surrogate`, onu destekleyen stratejilerin (ga) tam skorlarıyla
+          eğitilir ve güvenilir olduğunda bu stratejilerin umut vaat
+          etmeyen adayları atlamasını sağlar. Kontrol noktalarına
+          kaydedilmez; `resume` onu eğitilmemiş başlatır.
+        * `gap`, en iyi çözüm uzayın alt sınırına (`SearchSpace.bounds`)
+          bu göreli optimallik açığı kadar yaklaştığında çalışmayı erken
+          durdurur; sınır ve son açık her durumda sonuçta raporlanır.
+        * En fazla `EXHAUSTIVE_LIMIT` atamalı uzaylarda her atama
+          sonuçlanır sonuçlanmaz (`Incumbent.track`) çalışma durur; her
+          adımdan sonra bir strateji sıradaki sonuçlanmamış atamayı da
+          skorlar. En iyi çözüm bu durumda optimaldir
+          ve `SearchResult.exhausted` ayarlanır. Daha büyük uzaylarda böyle
+          bir strateji boşa dönmek yerine adımlar arasında en fazla
+          `IDLE_BACKOFF_S` bekler.
+    """
+    _register_lazy(strategies)
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(
+            f"Unknown search strategies: {', '.join(unknown)} "
+            f"(available: {', '.join(sorted(set(STRATEGIES) | set(LAZY_STRATEGIES)))})."
+        )
+    if not strategies:
+        raise ValueError("At least one search strategy is required.")
+    if gap is not None and gap < 0:
+        raise ValueError("Optimality gap must not be negative.")
+
+    if resume is not None and list(resume.strategies) != list(strategies):
+        raise ValueError(
+            f"Checkpoint was taken with strategies {','.join(resume.strategies)}, "
+            f"not {','.join(strategies)}."
+        )
+
+    started = time.monotonic() - (resume.elapsed_s if resume is not None else 0.0)
+    deadline = started + time_limit_s
+    if incumbent is None:
+        incumbent = Incumbent(archive_size=archive_size)
+    archive_size = incumbent.archive_size
+    initial = space.project(baseline) if resume is None else list(resume.initial)
+
+    workers = [
+        STRATEGIES[name](space, incumbent, seed=seed * 1000 + idx, spill=spill)
+        for idx, name in enumerate(strategies)
+    ]
+    for worker in workers:
+        if worker.screens:
+            worker.surrogate = surrogate
+            worker.evaluator.surrogate = surrogate
+    if resume is None:
+        for worker in workers:
+            worker.start(initial)
+    else:
+        incumbent.restore(resume.incumbent)
+        for worker, state in zip(workers, resume.workers):
+            worker.restore(state)
+    incumbent.track([len(domain) for domain in space.domains])
+    lower_bound = space.bounds().root().total
+    if gap is not None:
+        # Smallest score whose objective is within `gap` of the bound
+        incumbent.aim(-math.inf if gap >= 1.0 else -lower_bound / (1.0 - gap))
+
+    stop = threading.Event()
+
+    def _run(worker: SearchStrategy) -> None:
+        # Leave once the space is exhausted; back off while steps find nothing new
+        idle = 0.0
+        while not stop.is_set() and not incumbent.exhausted.is_set() and time.monotonic() < deadline:
+            with worker.lock:
+                work = worker.evaluator.work
+                worker.step()
+                busy = worker.evaluator.work > work
+            pending = incumbent.unsettled()
+            if pending is not None:
+                # Small space: also settle one assignment in order, so it is exhausted in `size` steps
+                with worker.lock:
+                    worker.evaluator.evaluate(pending, threshold=incumbent.score)
+                continue
+            if busy:
+                idle = 0.0
+                continue
+            idle = min(IDLE_BACKOFF_S, max(2 * idle, 0.001))
+            stop.wait(idle)
+
+    def _capture() -> PortfolioState:
+        states = []
+        for worker in workers:
+            with worker.lock:
+                states.append(worker.state())
+        return PortfolioState(
+            strategies=list(strategies),
+            seed=seed,
+            time_limit_s=time_limit_s,
+            elapsed_s=min(time.monotonic() - started, time_limit_s),
+            initial=list(initial),
+            archive_size=archive_size,
+            incumbent=incumbent.state(),
+            workers=states,
+        )
+
+    threads = [
+        threading.Thread(target=_run, args=(w,), name=f"zac-{w.name}", daemon=True)
+        for w in workers
+    ]
+    for thread in threads:
+        thread.start()
+
+    reported_version = -1
+
+    def _report() -> None:
+        nonlocal reported_version
+        score, assignment, owner, version = incumbent.snapshot()
+        elapsed = time.monotonic() - started
+        if progress is not None:
+            progress(
+                SearchProgress(
+                    elapsed_s=elapsed,
+                    best_score=score,
+                    evaluations=incumbent.evaluations,
+                    pruned=incumbent.pruned,
+                    duplicates=incumbent.duplicates,
+                    candidates_per_s=incumbent.evaluations / elapsed if elapsed > 0 else 0.0,
+                    owner=owner,
+                    optimality_gap=optimality_gap(score, lower_bound) if assignment is not None else None,
+                )
+            )
+        if on_improve is not None and assignment is not None and version != reported_version:
+            on_improve(space.score(assignment))
+        reported_version = version
+
+    next_report = time.monotonic() + progress_interval_s
+    next_checkpoint = time.monotonic() + checkpoint_interval_s if checkpoint is not None else math.inf
+    try:
+        while (
+            any(t.is_alive() for t in threads)
+            and not incumbent.reached.is_set()
+            and not incumbent.exhausted.is_set()
+        ):
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            timeout = min(next_report, next_checkpoint, deadline) - now
+            if gap is None:
+                threads[0].join(timeout=timeout)
+            elif incumbent.reached.wait(timeout=min(timeout, IDLE_BACKOFF_S)):  # short, to notice exhaustion
+                break
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if now >= next_report:
+                _report()
+                next_report = now + progress_interval_s
+            if now >= next_checkpoint:
+                checkpoint(_capture())
+                next_checkpoint = time.monotonic() + checkpoint_interval_s
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    if checkpoint is not None:
+        checkpoint(_capture())
+
+    score, assignment, owner, _ = incumbent.snapshot()
+    if assignment is None:
+        assignment = tuple(initial)
+    best = space.score(assignment)
+    exhausted = incumbent.exhausted.is_set()
+    if exhausted and best.score is not None:
+        lower_bound = max(lower_bound, -best.score)  # the best is proven optimal
+    return SearchResult(
+        best=best,
+        assignment=tuple(assignment),
+        owner=owner,
+        evaluations=incumbent.evaluations,
+        pruned=incumbent.pruned,
+        elapsed_s=time.monotonic() - started,
+        duplicates=incumbent.duplicates,
+        iterations=_iterations_by_strategy(workers),
+        archive=incumbent.archive(),
+        lower_bound=lower_bound,
+        optimality_gap=optimality_gap(best.score, lower_bound) if best.score is not None else None,
+        exhausted=exhausted,
+    )
+
+
+def _iterations_by_strategy(workers: Sequence[SearchStrategy]) -> Dict[str, int]:
+    totals: Dict[str, int] = {}
+    for worker in workers:
+        totals[worker.name] = totals.get(worker.name, 0) + worker.iterations
+    return totals
@@ -0,0 +1,153 @@
+"""
+Spatial index over zone positions.
+
+EN:
+    A static 2-D KD-tree over the zones that declare a `position`. Every
+    node also stores the largest remaining power budget in its subtree,
+    so "k nearest zones with at least P kW left" prunes both by distance
+    and by capacity: a query touches O(log Z + k) nodes on typical layouts
+    instead of scanning every zone, and consuming power updates the
+    subtree maxima along one root path in O(log Z). Built for vehicles
+    with hundreds of fine-grained zones, where the generator places
+    positioned features into the nearest zone that still has room.
+
+TR:
+    `position` tanımlayan zonlar üzerinde statik bir 2-B KD-ağacı. Her
+    düğüm ayrıca alt ağacındaki en büyük kalan güç bütçesini tutar; böylece
+    "en az P kW'ı kalan en yakın k zon" sorgusu hem mesafeye hem kapasiteye
+    göre budanır: tipik yerleşimlerde sorgu her zonu taramak yerine
+    O(log Z + k) düğüme dokunur ve güç tüketimi alt ağaç maksimumlarını tek
+    bir kök yolu boyunca O(log Z) sürede günceller. Yüzlerce ince taneli
+    zona sahip araçlar için tasarlanmıştır; üretici, konumu verilen
+    özellikleri hâlâ yeri olan en yakın zona yerleştirir.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Collection, List, Optional, Sequence, Tuple
+
+from .model import Zone
+
+_EPS = 1e-9
+
+
+class ZoneIndex:
+    """
+    EN:
+        KD-tree over positioned zones, augmented with remaining power.
+        Zone indices refer to the `zones` list it was built from; zones
+        without a position are never returned.
+
+    TR:
+        Konumlu zonlar üzerinde, kalan güçle zenginleştirilmiş KD-ağacı.
+        Zon indeksleri ağacın kurulduğu `zones` listesine aittir; konumu
+        olmayan zonlar asla döndürülmez.
+    """
+
+    def __init__(self, zones: Sequence[Zone]) -> None:
+        self.zones = list(zones)
+        self.residual = [zone.max_power_kw for zone in self.zones]
+        positioned = [z for z, zone in enumerate(self.zones) if zone.position is not None]
+        self._zone: List[int] = []
+        self._axis: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._parent: List[int] = []
+        self._max: List[float] = []
+        self._node_of = [-1] * len(self.zones)
+        self._root = self._build(positioned, 0, -1)
+
+    def __len__(self) -> int:
+        return len(self._zone)
+
+    def _build(self, members: List[int], depth: int, parent: int) -> int:
+        if not members:
+            return -1
+        axis = depth % 2
+        members = sorted(members, key=lambda z: (self.zones[z].position[axis], z))
+        mid = len(members) // 2
+        node = len(self._zone)
+        self._zone.append(members[mid])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parent.append(parent)
+        self._max.append(self.residual[members[mid]])
+        self._node_of[members[mid]] = node
+        self._left[node] = self._build(members[:mid], depth + 1, node)
+        self._right[node] = self._build(members[mid + 1:], depth + 1, node)
+        self._max[node] = max(
+            [self._max[node]] + [self._max[child] for child in (self._left[node], self._right[node]) if child >= 0]
+        )
+        return node
+
+    def nearest(
+        self,
+        point: Tuple[float, float],
+        k: int = 1,
+        min_power_kw: float = 0.0,
+        allowed: Optional[Collection[int]] = None,
+    ) -> List[int]:
+        """
+        EN:
+            Up to `k` zone indices nearest to `point`, closest first, among
+            zones with at least `min_power_kw` remaining (and in `allowed`
+            when given). Equal distances are broken by zone index.
+
+        TR:
+            `point` noktasına en yakın en fazla `k` zon indeksi (en yakın
+            önce); en az `min_power_kw` gücü kalan (ve verilmişse `allowed`
+            içindeki) zonlar arasından seçilir. Eşit mesafelerde zon
+            indeksi belirleyicidir.
+        """
+        if k <= 0 or self._root < 0:
+            return []
+        need = min_power_kw - _EPS
+        px, py = point
+        if k >= len(self._zone):
+            # Every qualifying zone is returned: the tree cannot prune, a sort is cheaper
+            hits = [
+                ((px - self.zones[z].position[0]) ** 2 + (py - self.zones[z].position[1]) ** 2, z)
+                for z in self._zone
+                if self.residual[z] >= need and (allowed is None or z in allowed)
+            ]
+            return [z for _, z in sorted(hits)]
+        best: List[Tuple[float, int]] = []  # max-heap of (-distance², -zone)
+
+        def _visit(node: int) -> None:
+            if node < 0 or self._max[node] < need:
+                return
+            z = self._zone[node]
+            x, y = self.zones[z].position
+            d = (px - x) ** 2 + (py - y) ** 2
+            if self.residual[z] >= need and (allowed is None or z in allowed):
+                if len(best) < k:
+                    heapq.heappush(best, (-d, -z))
+                elif (d, z) < (-best[0][0], -best[0][1]):
+                    heapq.heapreplace(best, (-d, -z))
+            diff = (px, py)[self._axis[node]] - (x, y)[self._axis[node]]
+            near, far = (self._left[node], self._right[node]) if diff < 0 else (self._right[node], self._left[node])
+            _visit(near)
+            if len(best) < k or diff * diff <= -best[0][0]:
+                _visit(far)
+
+        _visit(self._root)
+        return [-z for _, z in sorted(best, key=lambda item: (-item[0], -item[1]))]
+
+    def take(self, zone: int, power_kw: float) -> None:
+        """
+        EN:
+            Consume `power_kw` of a zone's remaining budget and refresh the
+            subtree maxima on its root path.
+
+        TR:
+            Bir zonun kalan bütçesinden `power_kw` tüketir ve kök yolu
+            üzerindeki alt ağaç maksimumlarını yeniler.
+        """
+        self.residual[zone] -= power_kw
+        node = self._node_of[zone]
+        while node >= 0:
+            children = [self._max[c] for c in (self._left[node], self._right[node]) if c >= 0]
+            self._max[node] = max([self.residual[self._zone[node]]] + children)
+            node = self._parent[node]
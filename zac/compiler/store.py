@@ -0,0 +1,401 @@
+"""
+Append-only columnar candidate store.
+
+EN:
+    Keeps very large explorations on disk instead of in RAM. Each column
+    is a fixed-width binary file (module ids, zone ids, link lengths,
+    penalty components, cost, score); a `meta.json` describes the layout.
+    Readers memory-map the columns, so top-k queries, filters and
+    histograms stream over the data without loading the population.
+
+TR:
+    Çok büyük aramaları RAM yerine diskte tutar. Her sütun sabit genişlikli
+    bir ikili dosyadır (modül kimlikleri, zon kimlikleri, bağlantı
+    uzunlukları, ceza bileşenleri, maliyet, skor); düzeni `meta.json`
+    tanımlar. Okuyucular sütunları belleğe eşler (mmap); böylece top-k
+    sorguları, filtreler ve histogramlar popülasyonu yüklemeden veri
+    üzerinde akar.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import mmap
+import operator
+import re
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .model import ArchitectureCandidate
+
+STORE_VERSION = 3
+PENALTY_KEYS = ("power", "harness", "latency", "redundancy", "bandwidth")
+SCALAR_METRICS = ("score", "cost", "harness_length_m") + PENALTY_KEYS
+
+_OPS: Dict[str, Callable[[float, float], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+
+def _layout(n_features: int) -> Dict[str, Tuple[str, int]]:
+    """
+    EN:
+        Column name -> (array typecode, values per row).
+
+    TR:
+        Sütun adı -> (array tip kodu, satır başına değer sayısı).
+    """
+    return {
+        "module_ids": ("i", n_features),
+        "zone_ids": ("h", n_features),
+        "link_lengths": ("d", max(n_features - 1, 0)),
+        "penalties": ("d", len(PENALTY_KEYS)),
+        "cost": ("d", 1),
+        "score": ("d", 1),
+    }
+
+
+class CandidateStore:
+    """
+    EN:
+        Append-only writer and memory-mapped reader for one store directory.
+        `append` is thread-safe and buffers rows; `flush` appends them to
+        the column files. Each column is mapped once and remapped only when
+        its file has grown; `close` (or leaving a `with` block) flushes and
+        unmaps them.
+
+    TR:
+        Tek bir depo dizini için yalnızca-ekleme yazıcı ve mmap okuyucu.
+        `append` thread-safe'tir ve satırları tamponlar; `flush` onları
+        sütun dosyalarının sonuna ekler. Her sütun bir kez eşlenir ve
+        yalnızca dosyası büyüdüğünde yeniden eşlenir; `close` (veya `with`
+        bloğundan çıkmak) tamponu yazar ve eşlemeleri kapatır.
+    """
+
+    def __init__(self, path: Path, meta: Dict) -> None:
+        self.path = path
+        self.meta = meta
+        self.columns: Dict[str, Tuple[str, int]] = {
+            name: (spec["type"], spec["width"]) for name, spec in meta["columns"].items()
+        }
+        self._module_idx = {mid: i for i, mid in enumerate(meta["module_ids"])}
+        self._zone_idx = {name: i for i, name in enumerate(meta["zone_names"])}
+        self._feature_idx = {fid: i for i, fid in enumerate(meta["feature_ids"])}
+        self._lock = threading.Lock()
+        self._buffer = {name: array(code) for name, (code, _) in self.columns.items()}
+        self._buffered = 0
+        self.flush_every = 4096
+        self._maps: Dict[str, Tuple[int, Optional[mmap.mmap], memoryview]] = {}  # name -> (size, map, view)
+
+    # ----- creation / opening -----
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        feature_ids: Sequence[str],
+        module_ids: Sequence[str],
+        zone_names: Sequence[str],
+    ) -> "CandidateStore":
+        """
+        EN:
+            Create a new store, or reopen it for appending when the layout
+            matches.
+
+        TR:
+            Yeni bir depo oluşturur; düzen eşleşiyorsa ekleme için yeniden
+            açar.
+        """
+        meta = {
+            "version": STORE_VERSION,
+            "byteorder": sys.byteorder,
+            "feature_ids": list(feature_ids),
+            "module_ids": list(module_ids),
+            "zone_names": list(zone_names),
+            "penalty_keys": list(PENALTY_KEYS),
+            "columns": {
+                name: {"type": code, "width": width}
+                for name, (code, width) in _layout(len(feature_ids)).items()
+            },
+        }
+        meta_path = path / "meta.json"
+        if meta_path.exists():
+            existing = json.loads(meta_path.read_text(encoding="utf-8"))
+            if existing != meta:
+                raise ValueError(f"Store '{path}' exists with a different layout.")
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        for name in meta["columns"]:
+            (path / f"{name}.bin").touch()
+        return cls(path, meta)
+
+    @classmethod
+    def open(cls, path: Path) -> "CandidateStore":
+        """
+        EN:
+            Open an existing store for reading (and appending).
+
+        TR:
+            Mevcut bir depoyu okuma (ve ekleme) için açar.
+        """
+        meta_path = path / "meta.json"
+        if not meta_path.exists():
+            raise ValueError(f"'{path}' is not a candidate store (missing meta.json).")
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported store version {meta.get('version')}.")
+        if meta.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Store '{path}' was written with {meta.get('byteorder')}-endian columns.")
+        return cls(path, meta)
+
+    # ----- writing -----
+
+    def append(self, candidate: ArchitectureCandidate) -> None:
+        """
+        EN:
+            Buffer one scored candidate. Modules are stored in feature order
+            so every row has the same width.
+
+        TR:
+            Skorlanmış bir adayı tamponlar. Modüller özellik sırasına göre
+            saklanır; böylece her satır aynı genişliktedir.
+        """
+        n = len(self._feature_idx)
+        modules = [-1] * n
+        zones = [-1] * n
+        for pm in candidate.modules:
+            for fid in pm.provided_features:
+                f = self._feature_idx[fid]
+                modules[f] = self._module_idx[pm.module.id]
+                zones[f] = self._zone_idx[pm.zone.name]
+        lengths = [link.length_m or 0.0 for link in candidate.links][: max(n - 1, 0)]
+        lengths += [0.0] * (max(n - 1, 0) - len(lengths))
+        penalties = [candidate.penalties.get(key, 0.0) for key in PENALTY_KEYS]
+
+        with self._lock:
+            buf = self._buffer
+            buf["module_ids"].extend(modules)
+            buf["zone_ids"].extend(zones)
+            buf["link_lengths"].extend(lengths)
+            buf["penalties"].extend(penalties)
+            buf["cost"].append(candidate.total_cost)
+            buf["score"].append(candidate.score if candidate.score is not None else float("-inf"))
+            self._buffered += 1
+            if self._buffered >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffered:
+            return
+        for name, values in self._buffer.items():
+            with (self.path / f"{name}.bin").open("ab") as fh:
+                values.tofile(fh)
+            del values[:]
+        self._buffered = 0
+
+    def close(self) -> None:
+        """
+        EN:
+            Flush buffered rows and unmap every column. Views handed out
+            by `metric` must no longer be in use.
+
+        TR:
+            Tampondaki satırları yazar ve tüm sütun eşlemelerini kapatır.
+            `metric`in verdiği görünümler artık kullanılmıyor olmalıdır.
+        """
+        self.flush()
+        for name in list(self._maps):
+            self._unmap(name)
+
+    def __enter__(self) -> "CandidateStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ----- reading -----
+
+    def __len__(self) -> int:
+        code, width = self.columns["score"]
+        size = (self.path / "score.bin").stat().st_size
+        return size // (array(code).itemsize * width)
+
+    def _column(self, name: str) -> memoryview:
+        code, _ = self.columns[name]
+        file_path = self.path / f"{name}.bin"
+        size = file_path.stat().st_size
+        cached = self._maps.get(name)
+        if cached is not None and cached[0] == size:
+            return cached[2]
+        if cached is not None:
+            # The file grew: drop the old map; it is unmapped once its last view is gone
+            del self._maps[name]
+        if size == 0:
+            mm, view = None, memoryview(array(code))
+        else:
+            with file_path.open("rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mm).cast(code)
+        self._maps[name] = (size, mm, view)
+        return view
+
+    def _unmap(self, name: str) -> None:
+        _, mm, view = self._maps.pop(name)
+        view.release()
+        if mm is not None:
+            mm.close()
+
+    def metric(self, name: str) -> Iterator[float]:
+        """
+        EN:
+            Stream one scalar metric over all rows.
+
+        TR:
+            Tek bir skaler metriği tüm satırlar üzerinde akış olarak verir.
+        """
+        if name in ("score", "cost"):
+            yield from self._column(name)
+        elif name in PENALTY_KEYS:
+            column = self._column("penalties")
+            yield from column[PENALTY_KEYS.index(name)::len(PENALTY_KEYS)]
+        elif name == "harness_length_m":
+            _, width = self.columns["link_lengths"]
+            column = self._column("link_lengths")
+            if not width:
+                yield from (0.0 for _ in range(len(self)))
+                return
+            for row in range(len(column) // width):
+                yield sum(column[row * width:(row + 1) * width])
+        else:
+            raise ValueError(f"Unknown metric '{name}' (available: {', '.join(SCALAR_METRICS)}).")
+
+    def matching_rows(self, filters: Sequence[str] = ()) -> Iterator[int]:
+        """
+        EN:
+            Row indices satisfying every filter such as "power==0" or
+            "cost<300".
+
+        TR:
+            "power==0" veya "cost<300" gibi tüm filtreleri sağlayan satır
+            indeksleri.
+        """
+        parsed = [_parse_filter(text) for text in filters]
+        if not parsed:
+            yield from range(len(self))
+            return
+        streams = [self.metric(name) for name, _, _ in parsed]
+        for row, values in enumerate(zip(*streams)):
+            if all(op(value, limit) for value, (_, op, limit) in zip(values, parsed)):
+                yield row
+
+    def top_k(
+        self,
+        k: int,
+        by: str = "score",
+        descending: bool = True,
+        filters: Sequence[str] = (),
+    ) -> List[Tuple[int, float]]:
+        """
+        EN:
+            The k best (row, value) pairs by `by`, after filtering.
+
+        TR:
+            Filtreleme sonrası `by` metriğine göre en iyi k (satır, değer)
+            çifti.
+        """
+        pairs = self._filtered(by, filters)
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(k, pairs, key=lambda item: item[1])
+
+    def histogram(
+        self,
+        metric: str,
+        bins: int = 10,
+        filters: Sequence[str] = (),
+    ) -> List[Tuple[float, float, int]]:
+        """
+        EN:
+            Equal-width histogram (low, high, count) of a metric, computed
+            in two streaming passes.
+
+        TR:
+            Bir metriğin eşit genişlikli histogramı (alt, üst, adet); iki
+            akış geçişinde hesaplanır.
+        """
+        low, high = float("inf"), float("-inf")
+        for _, value in self._filtered(metric, filters):
+            low, high = min(low, value), max(high, value)
+        if low > high:
+            return []
+        width = (high - low) / bins or 1.0
+        counts = [0] * bins
+        for _, value in self._filtered(metric, filters):
+            counts[min(int((value - low) / width), bins - 1)] += 1
+        return [(low + i * width, low + (i + 1) * width, c) for i, c in enumerate(counts)]
+
+    def _filtered(self, metric: str, filters: Sequence[str]) -> Iterator[Tuple[int, float]]:
+        values = enumerate(self.metric(metric))
+        if not filters:
+            yield from values
+            return
+        rows = self.matching_rows(filters)
+        wanted = next(rows, None)
+        for row, value in values:
+            if wanted is None:
+                return
+            if row == wanted:
+                yield row, value
+                wanted = next(rows, None)
+
+    def placements(self, row: int) -> List[Tuple[str, str, str]]:
+        """
+        EN:
+            Decode one row into (feature, module, zone) triples.
+
+        TR:
+            Bir satırı (özellik, modül, zon) üçlülerine çözer.
+        """
+        width = self.columns["module_ids"][1]
+        modules = self._column("module_ids")[row * width:(row + 1) * width]
+        zones = self._column("zone_ids")[row * width:(row + 1) * width]
+        return [
+            (fid, self.meta["module_ids"][m], self.meta["zone_names"][z])
+            for fid, m, z in zip(self.meta["feature_ids"], modules, zones)
+            if m >= 0
+        ]
+
+    def row_metrics(self, row: int) -> Dict[str, float]:
+        penalties = self._column("penalties")[row * len(PENALTY_KEYS):(row + 1) * len(PENALTY_KEYS)]
+        _, width = self.columns["link_lengths"]
+        lengths = self._column("link_lengths")[row * width:(row + 1) * width]
+        values = {
+            "score": self._column("score")[row],
+            "cost": self._column("cost")[row],
+            "harness_length_m": sum(lengths),
+        }
+        values.update(zip(PENALTY_KEYS, penalties))
+        return values
+
+
+def _parse_filter(text: str) -> Tuple[str, Callable[[float, float], bool], float]:
+    match = re.fullmatch(r"\s*([\w.]+)\s*(<=|>=|==|!=|<|>)\s*(-?[\d.eE+-]+)\s*", text)
+    if not match:
+        raise ValueError(f"Invalid filter '{text}' (expected e.g. 'cost<300').")
+    name, op, value = match.groups()
+    if name not in SCALAR_METRICS:
+        raise ValueError(f"Unknown metric '{name}' (available: {', '.join(SCALAR_METRICS)}).")
+    return name, _OPS[op], float(value)
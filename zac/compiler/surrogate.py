@@ -0,0 +1,477 @@
+"""
+Learned surrogate scorer.
+
+EN:
+    An online ridge regression that predicts a candidate's score from cheap
+    features of its assignment (hardware cost, distinct module count, zone
+    power overruns, summed harness distance, cross-zone hops, redundancy
+    shortfall, cross-zone traffic and how far a zone's cross-zone traffic
+    exceeds usable Ethernet capacity), so the search can skip the exact
+    `score_candidates` path (candidate build, network synthesis, latency
+    and redundancy checks) for unpromising candidates.
+
+    The model is trained on the exactly scored candidates of the screening
+    strategy (all of them until it is trusted, a `train_rate` sample
+    afterwards) and refitted every `refit_every` samples. Before each sample is learned it is
+    predicted, so accuracy (MAE, R², Spearman rank correlation) is always
+    measured out of sample over a sliding window. The surrogate only
+    screens once it is trusted (`warmup` checked samples and a rank
+    correlation of at least `min_rank_corr`); until then, or when accuracy
+    drops, everything is scored exactly.
+
+    Screening keeps the top `fraction` of a batch by prediction, widened
+    by a calibrated margin (a quantile of recent absolute errors), and
+    drops candidates whose optimistic prediction cannot beat the caller's
+    threshold. A small random share of rejected candidates is scored anyway
+    (`audit_rate`); audited rejects that would have been accepted are
+    reported as misses.
+
+    The surrogate is opt-in (`zac compile --surrogate`), which prints its
+    `report` after the search: the admissible score bound already rejects
+    most children before any features are computed, and on the benchmark
+    fixtures screening did not improve the best score in a fixed time
+    budget. It is not part of `PortfolioState`, so a resumed search trains
+    a fresh model.
+
+TR:
+    Bir adayın skorunu atamasının ucuz özelliklerinden (donanım maliyeti,
+    farklı modül sayısı, zon güç aşımları, toplam kablo mesafesi, zonlar
+    arası geçişler, yedeklilik eksiği, zonlar arası trafik ve bir zonun
+    zonlar arası trafiğinin kullanılabilir Ethernet kapasitesini ne kadar
+    aştığı) tahmin eden çevrimiçi bir ridge regresyonu; böylece arama,
+    umut vaat etmeyen adaylar için tam `score_candidates` yolunu (aday
+    kurulumu, ağ sentezi, gecikme ve yedeklilik kontrolleri) atlayabilir.
+
+    Model, eleme yapan stratejinin tam skorlanan adaylarıyla (güvenilir
+    olana kadar hepsiyle, sonrasında `train_rate` oranında bir örneklemle)
+    eğitilir ve her `refit_every` örnekte yeniden oturtulur. Her örnek
+    öğrenilmeden önce tahmin edilir; böylece
+    doğruluk (MAE, R², Spearman sıra korelasyonu) kayan bir pencerede her
+    zaman örneklem dışı ölçülür. Vekil model ancak güvenilir olduğunda
+    (`warmup` kontrol edilmiş örnek ve en az `min_rank_corr` sıra
+    korelasyonu) eleme yapar; o zamana kadar veya doğruluk düştüğünde her
+    şey tam skorlanır.
+
+    Eleme, bir yığının tahmine göre en iyi `fraction` kısmını, kalibre
+    edilmiş bir pay (son mutlak hataların bir yüzdeliği) kadar genişleterek
+    tutar ve iyimser tahmini çağıranın eşiğini geçemeyecek adayları atar.
+    Reddedilen adayların küçük rastgele bir kısmı yine de skorlanır
+    (`audit_rate`); kabul edilecek olan denetlenmiş retler kaçırma olarak
+    raporlanır.
+
+    Vekil model isteğe bağlıdır (`zac compile --surrogate`) ve aramadan
+    sonra `report` çıktısını yazdırır: kabul edilebilir skor sınırı
+    çocukların çoğunu özellikler hesaplanmadan önce reddeder ve kıyaslama
+    girdilerinde eleme sabit bir süre bütçesinde en iyi skoru
+    iyileştirmedi. `PortfolioState`'in bir parçası değildir; sürdürülen
+    bir arama yeni bir model eğitir.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from . import generator, network
+from .search import SearchSpace
+
+MAX_ZONE_FEATURES = 16  # per-zone overrun features only for this many zones or fewer
+
+
+@dataclass
+class SurrogateReport:
+    """
+    EN:
+        Accuracy and screening statistics of a surrogate.
+
+    TR:
+        Bir vekil modelin doğruluk ve eleme istatistikleri.
+    """
+
+    samples: int
+    checked: int
+    mae: float
+    r2: float
+    rank_corr: float
+    margin: float
+    trusted: bool
+    screened: int
+    skipped: int
+    audits: int
+    misses: int
+
+    def summary(self) -> str:
+        skipped = 100.0 * self.skipped / self.screened if self.screened else 0.0
+        return (
+            f"Surrogate: {self.samples} sample(s), {'trusted' if self.trusted else 'not trusted'} "
+            f"(window {self.checked}: MAE={self.mae:.2f} R²={self.r2:.3f} rank={self.rank_corr:.3f} "
+            f"margin={self.margin:.2f}); screened {self.screened}, skipped {self.skipped} ({skipped:.0f}%), "
+            f"{self.misses}/{self.audits} audited rejects would have been kept."
+        )
+
+
+def _solve(matrix: List[List[float]], rhs: List[float]) -> List[float]:
+    """
+    EN:
+        Solve a symmetric positive definite system by Cholesky decomposition.
+
+    TR:
+        Simetrik pozitif tanımlı bir sistemi Cholesky ayrışımıyla çözer.
+    """
+    n = len(rhs)
+    lower = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1):
+            s = matrix[i][j] - sum(lower[i][k] * lower[j][k] for k in range(j))
+            if i == j:
+                lower[i][i] = math.sqrt(max(s, 1e-12))
+            else:
+                lower[i][j] = s / lower[j][j]
+    y = [0.0] * n
+    for i in range(n):
+        y[i] = (rhs[i] - sum(lower[i][k] * y[k] for k in range(i))) / lower[i][i]
+    x = [0.0] * n
+    for i in reversed(range(n)):
+        x[i] = (y[i] - sum(lower[k][i] * x[k] for k in range(i + 1, n))) / lower[i][i]
+    return x
+
+
+def _ranks(values: Sequence[float]) -> List[float]:
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2.0
+        i = j + 1
+    return ranks
+
+
+def _pearson(a: Sequence[float], b: Sequence[float]) -> float:
+    n = len(a)
+    ma, mb = sum(a) / n, sum(b) / n
+    cov = sum((x - ma) * (y - mb) for x, y in zip(a, b))
+    va = sum((x - ma) ** 2 for x in a)
+    vb = sum((y - mb) ** 2 for y in b)
+    if va <= 0.0 or vb <= 0.0:
+        return 0.0
+    return cov / math.sqrt(va * vb)
+
+
+class Surrogate:
+    """
+    EN:
+        Thread-safe online ridge regression over assignment features,
+        shared by all strategies of a portfolio.
+
+    TR:
+        Atama özellikleri üzerinde iş parçacığı güvenli, çevrimiçi ridge
+        regresyonu; bir portföyün tüm stratejileri tarafından paylaşılır.
+    """
+
+    def __init__(
+        self,
+        space: SearchSpace,
+        fraction: float = 0.25,
+        ridge: float = 1.0,
+        warmup: int = 64,
+        refit_every: int = 64,
+        window: int = 512,
+        min_rank_corr: float = 0.8,
+        quantile: float = 0.9,
+        audit_rate: float = 0.05,
+        train_rate: float = 0.25,
+        seed: int = 0,
+    ) -> None:
+        if not 0.0 < fraction <= 1.0:
+            raise ValueError("Surrogate fraction must be in (0, 1].")
+        self.space = space
+        self.fraction = fraction
+        self.ridge = ridge
+        self.warmup = warmup
+        self.refit_every = refit_every
+        self.min_rank_corr = min_rank_corr
+        self.quantile = quantile
+        self.audit_rate = audit_rate
+        self.train_rate = train_rate
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        zones = space.requirements.zones
+        zone_idx = {z.name: i for i, z in enumerate(zones)}
+        self._zones = zones
+        self._budget = [z.max_power_kw for z in zones]
+        self._per_zone = len(zones) <= MAX_ZONE_FEATURES
+        module_idx: Dict[str, int] = {}
+        # Per feature and option: (cost, power, zone, module, redundancy shortfall)
+        self._options: List[List[Tuple[float, float, int, int, int]]] = [
+            [
+                (
+                    module.cost,
+                    module.max_power_kw,
+                    zone_idx[zone.name],
+                    module_idx.setdefault(module.id, len(module_idx)),
+                    max(0, module.redundancy - 1),
+                )
+                for module, zone in domain
+            ]
+            for domain in space.domains
+        ]
+        self._rows: List[Optional[List[float]]] = [None] * len(zones)  # link lengths, filled per zone
+        position = {f.id: i for i, f in enumerate(space.features)}
+        self._traffic = [
+            (position[src], position[dst], mbps)
+            for (src, dst), mbps in space.demands.items()
+            if src in position and dst in position
+        ]
+
+        self._usable = network.MEDIA[-1][1] * network.DEFAULT_UTILIZATION
+        self.dims = 9 + (len(zones) if self._per_zone else 0)
+        self.samples = 0
+        self._sx = [0.0] * self.dims
+        self._sxx = [[0.0] * self.dims for _ in range(self.dims)]
+        self._sxy = [0.0] * self.dims
+        self._sy = 0.0
+        self._weights: Optional[List[float]] = None
+        self._intercept = 0.0
+        self._checks: Deque[Tuple[float, float]] = deque(maxlen=window)
+        self._pending = 0
+        self.trusted = False
+        self.margin = math.inf
+        self.rank_corr = 0.0
+        self.screened = 0
+        self.skipped = 0
+        self.audits = 0
+        self.misses = 0
+
+    def _row(self, a: int) -> List[float]:
+        row = self._rows[a]
+        if row is None:
+            row = self._rows[a] = [generator._estimate_link_length(self._zones[a], zone) for zone in self._zones]
+        return row
+
+    def features(self, assignment: Sequence[int]) -> List[float]:
+        """
+        EN:
+            Cheap feature vector of an assignment, O(features + traffic pairs).
+
+        TR:
+            Bir atamanın ucuz özellik vektörü, O(özellik + trafik çifti).
+        """
+        cost = 0.0
+        redundancy = 0
+        load = [0.0] * len(self._budget)
+        zones: List[int] = []
+        modules = set()
+        for options, option in zip(self._options, assignment):
+            c, p, z, m, r = options[option]
+            cost += c
+            load[z] += p
+            redundancy += r
+            modules.add(m)
+            zones.append(z)
+        over = [max(0.0, l - b) for l, b in zip(load, self._budget)]
+        distance = 0.0
+        hops = 0
+        rows = self._rows
+        for a, b in zip(zones, zones[1:]):
+            distance += (rows[a] or self._row(a))[b]
+            hops += a != b
+        cross = 0.0
+        through = [0.0] * len(self._budget)
+        for i, j, mbps in self._traffic:
+            if zones[i] != zones[j]:
+                cross += mbps
+                through[zones[i]] += mbps
+                through[zones[j]] += mbps
+        congestion = sum(max(0.0, t - self._usable) for t in through)
+        x = [
+            cost,
+            float(len(modules)),
+            sum(over),
+            max(over, default=0.0),
+            distance,
+            float(hops),
+            float(redundancy),
+            cross,
+            congestion,
+        ]
+        if self._per_zone:
+            x.extend(over)
+        return x
+
+    def _predict(self, x: Sequence[float]) -> float:
+        return self._intercept + sum(w * v for w, v in zip(self._weights, x))
+
+    def predict(self, x: Sequence[float]) -> Optional[float]:
+        """
+        EN:
+            Predicted score, or None before the first fit.
+
+        TR:
+            Tahmin edilen skor; ilk oturtmadan önce None.
+        """
+        with self._lock:
+            return self._predict(x) if self._weights is not None else None
+
+    def learn(self, assignment: Sequence[int], score: float, x: Optional[Sequence[float]] = None) -> None:
+        """
+        EN:
+            Training hook of the evaluator: observe every exact score until
+            the surrogate is trusted, then only a `train_rate` sample of
+            them (enough to keep checking accuracy). `x` reuses features
+            computed for screening.
+
+        TR:
+            Değerlendiricinin eğitim kancası: vekil model güvenilir olana
+            kadar her tam skoru, sonrasında yalnızca `train_rate` oranında
+            bir örneklemini (doğruluğu izlemeye yetecek kadar) gözlemler.
+            `x`, eleme için hesaplanmış özellikleri yeniden kullanır.
+        """
+        with self._lock:
+            if self.trusted and self.rng.random() >= self.train_rate:
+                return
+        self.observe(self.features(assignment) if x is None else x, score)
+
+    def observe(self, x: Sequence[float], score: float) -> None:
+        """
+        EN:
+            Learn one exactly scored sample (after checking the current
+            prediction against it).
+
+        TR:
+            Tam skorlanmış bir örneği öğrenir (önce mevcut tahmini onunla
+            karşılaştırır).
+        """
+        if not math.isfinite(score):
+            return
+        with self._lock:
+            if self._weights is not None:
+                self._checks.append((self._predict(x), score))
+            self.samples += 1
+            self._sy += score
+            for i, xi in enumerate(x):
+                self._sx[i] += xi
+                self._sxy[i] += xi * score
+                row = self._sxx[i]
+                for j in range(i + 1):
+                    row[j] += xi * x[j]
+            self._pending += 1
+            if self._pending >= self.refit_every:
+                self._pending = 0
+                self._fit()
+                self._calibrate()
+
+    def _fit(self) -> None:
+        # Ridge on standardized features with an unpenalized intercept.
+        n = float(self.samples)
+        mean = [s / n for s in self._sx]
+        y_mean = self._sy / n
+        scale = [math.sqrt(max(self._sxx[i][i] / n - mean[i] ** 2, 0.0)) for i in range(self.dims)]
+        active = [i for i in range(self.dims) if scale[i] > 1e-9]
+        matrix = [
+            [
+                (self._sxx[max(i, j)][min(i, j)] / n - mean[i] * mean[j]) / (scale[i] * scale[j])
+                + (self.ridge / n if i == j else 0.0)
+                for j in active
+            ]
+            for i in active
+        ]
+        rhs = [(self._sxy[i] / n - mean[i] * y_mean) / scale[i] for i in active]
+        beta = _solve(matrix, rhs) if active else []
+        weights = [0.0] * self.dims
+        for i, b in zip(active, beta):
+            weights[i] = b / scale[i]
+        self._weights = weights
+        self._intercept = y_mean - sum(w * m for w, m in zip(weights, mean))
+
+    def _calibrate(self) -> None:
+        if len(self._checks) < 2:
+            return
+        predicted = [p for p, _ in self._checks]
+        actual = [a for _, a in self._checks]
+        errors = sorted(abs(p - a) for p, a in self._checks)
+        self.margin = errors[min(len(errors) - 1, int(self.quantile * len(errors)))]
+        self.rank_corr = _pearson(_ranks(predicted), _ranks(actual))
+        self.trusted = len(self._checks) >= self.warmup and self.rank_corr >= self.min_rank_corr
+
+    def select(self, xs: Sequence[Sequence[float]], threshold: float = -math.inf) -> Tuple[List[int], List[int]]:
+        """
+        EN:
+            Split a batch into (indices to score, indices to audit). Kept
+            indices come best prediction first; everything is kept while
+            the surrogate is not trusted.
+
+        TR:
+            Bir yığını (skorlanacak indeksler, denetlenecek indeksler)
+            olarak ayırır. Tutulan indeksler en iyi tahminden başlayarak
+            sıralanır; vekil model güvenilir değilken hepsi tutulur.
+        """
+        with self._lock:
+            self.screened += len(xs)
+            if not self.trusted or not xs:
+                return list(range(len(xs))), []
+            predicted = [self._predict(x) for x in xs]
+            order = sorted(range(len(xs)), key=lambda i: -predicted[i])
+            top = max(1, math.ceil(self.fraction * len(xs)))
+            cutoff = predicted[order[top - 1]] - self.margin
+            keep: List[int] = []
+            audit: List[int] = []
+            for i in order:
+                if predicted[i] >= cutoff and predicted[i] + self.margin > threshold:
+                    keep.append(i)
+                elif self.rng.random() < self.audit_rate:
+                    audit.append(i)
+            self.skipped += len(xs) - len(keep) - len(audit)
+            return keep, audit
+
+    def audited(self, score: Optional[float], threshold: float) -> None:
+        """
+        EN:
+            Record the exact score of an audited reject.
+
+        TR:
+            Denetlenen bir retin tam skorunu kaydeder.
+        """
+        with self._lock:
+            self.audits += 1
+            if score is not None and score > threshold:
+                self.misses += 1
+
+    def report(self) -> SurrogateReport:
+        """
+        EN:
+            Current accuracy over the check window and screening counters.
+
+        TR:
+            Kontrol penceresindeki güncel doğruluk ve eleme sayaçları.
+        """
+        with self._lock:
+            checks = list(self._checks)
+            mae = r2 = 0.0
+            if checks:
+                mae = sum(abs(p - a) for p, a in checks) / len(checks)
+                mean = sum(a for _, a in checks) / len(checks)
+                total = sum((a - mean) ** 2 for _, a in checks)
+                residual = sum((p - a) ** 2 for p, a in checks)
+                r2 = 1.0 - residual / total if total > 0 else 0.0
+            return SurrogateReport(
+                samples=self.samples,
+                checked=len(checks),
+                mae=mae,
+                r2=r2,
+                rank_corr=self.rank_corr,
+                margin=self.margin,
+                trusted=self.trusted,
+                screened=self.screened,
+                skipped=self.skipped,
+                audits=self.audits,
+                misses=self.misses,
+            )
@@ -0,0 +1,413 @@
+"""
+What-if sweep engine.
+
+EN:
+    Generates a candidate population once, caches each candidate's penalty
+    components (module counts, per-zone power, harness length, link
+    latency estimates, redundancy shortfall) and re-scores the whole
+    population for every scenario from those cached terms instead of
+    recompiling. Only scenarios that change which candidates are
+    power-feasible, or that price apart modules the search treats as
+    interchangeable (see `symmetry`), are searched again.
+
+TR:
+    Aday popülasyonunu bir kez üretir, her adayın ceza bileşenlerini
+    (modül sayıları, zon başına güç, kablo uzunluğu, bağlantı gecikme
+    tahminleri, yedeklilik eksiği) önbelleğe alır ve her senaryo için tüm
+    popülasyonu yeniden derlemek yerine bu terimlerden yeniden skorlar.
+    Yalnızca güç açısından uygulanabilir aday kümesini değiştiren veya
+    aramanın birbirinin yerine geçebilir saydığı modüllerin fiyatlarını
+    ayıran (bkz. `symmetry`) senaryolar yeniden aranır.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import generator, scorer, search
+from .symmetry import _module_signature
+from .model import (
+    ArchitectureCandidate,
+    ModuleLibrary,
+    RequirementSet,
+    Scenario,
+)
+
+
+@dataclass
+class ScenarioParams:
+    """
+    EN:
+        Resolved per-scenario parameter vectors, aligned with the cache's
+        module and zone order.
+
+    TR:
+        Önbelleğin modül ve zon sırasına hizalanmış, senaryoya özgü
+        parametre vektörleri.
+    """
+
+    module_cost: List[float]
+    zone_power: List[float]
+    zone_latency: List[Optional[float]]
+    weights: scorer.PenaltyWeights
+
+
+@dataclass
+class ScenarioResult:
+    """
+    EN:
+        Best candidate of one scenario and how it was obtained.
+
+    TR:
+        Bir senaryonun en iyi adayı ve nasıl elde edildiği.
+    """
+
+    scenario: Scenario
+    score: float
+    total_cost: float
+    penalties: Dict[str, float]
+    feasible: int
+    researched: bool
+    placements: List[Tuple[str, str, str]] = field(default_factory=list)
+
+
+class CandidateCache:
+    """
+    EN:
+        Column-oriented cache of the scenario-independent terms of a
+        candidate population. Cost is a (candidates x modules) count matrix
+        times the scenario cost vector; penalties are recomputed from the
+        cached per-zone loads, harness lengths and link latency estimates.
+
+    TR:
+        Bir aday popülasyonunun senaryodan bağımsız terimlerinin sütun
+        odaklı önbelleği. Maliyet, (aday x modül) sayı matrisi ile senaryo
+        maliyet vektörünün çarpımıdır; cezalar önbellekteki zon yükleri,
+        kablo uzunlukları ve bağlantı gecikme tahminlerinden yeniden
+        hesaplanır.
+    """
+
+    def __init__(
+        self,
+        requirements: RequirementSet,
+        modules: ModuleLibrary,
+        candidates: Sequence[ArchitectureCandidate],
+    ) -> None:
+        self.requirements = requirements
+        self.modules = modules
+        self.candidates = list(candidates)
+        self.module_ids = [m.id for m in modules.modules]
+        self.zone_names = [z.name for z in requirements.zones]
+        module_idx = {mid: i for i, mid in enumerate(self.module_ids)}
+        zone_idx = {name: i for i, name in enumerate(self.zone_names)}
+        classes: Dict[Tuple, List[int]] = {}
+        for m, module in enumerate(modules.modules):
+            classes.setdefault(_module_signature(module), []).append(m)
+        self.module_classes = [group for group in classes.values() if len(group) > 1]
+
+        self.counts: List[List[Tuple[int, int]]] = []  # sparse rows (module, count)
+        self.loads: List[List[float]] = []
+        self.harness: List[float] = []
+        self.shortfall: List[float] = []
+        self.latency: List[List[Tuple[float, int, int]]] = []  # (estimate, src zone, dst zone)
+        self.overload: List[float] = []  # network overload in Mbps
+
+        for cand in self.candidates:
+            counts: Dict[int, int] = {}
+            loads = [0.0] * len(self.zone_names)
+            shortfall = 0.0
+            for pm in cand.modules:
+                m = module_idx[pm.module.id]
+                counts[m] = counts.get(m, 0) + 1
+                loads[zone_idx[pm.zone.name]] += pm.module.max_power_kw
+                if pm.module.redundancy > 1:
+                    shortfall += pm.module.redundancy - 1
+            self.counts.append(sorted(counts.items()))
+            self.loads.append(loads)
+            self.harness.append(cand.harness_length_m if cand.links else 0.0)
+            self.shortfall.append(shortfall)
+            self.overload.append(cand.network.overload_mbps if cand.network is not None else 0.0)
+            self.latency.append([
+                (
+                    scorer._estimate_latency_ms(None, link.length_m, link.medium),
+                    zone_idx[link.src.zone.name],
+                    zone_idx[link.dst.zone.name],
+                )
+                for link in cand.links
+            ])
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def params(self, scenario: Scenario) -> ScenarioParams:
+        """
+        EN:
+            Resolve a scenario's overrides against the base problem.
+
+        TR:
+            Bir senaryonun geçersiz kılmalarını temel probleme göre çözer.
+        """
+        cost = [m.cost for m in self.modules.modules]
+        power = [z.max_power_kw for z in self.requirements.zones]
+        latency = [z.latency_budget_ms for z in self.requirements.zones]
+        weights: Dict[str, float] = {}
+        module_idx = {mid: i for i, mid in enumerate(self.module_ids)}
+        zone_idx = {name: i for i, name in enumerate(self.zone_names)}
+
+        for key, value in scenario.overrides.items():
+            kind, _, rest = key.partition(".")
+            target, _, attr = rest.rpartition(".")
+            if kind == "weights" and not target and attr in scorer.PenaltyWeights.__dataclass_fields__:
+                weights[attr] = value
+            elif kind == "module" and target in module_idx and attr in ("cost", "cost_scale"):
+                m = module_idx[target]
+                cost[m] = value if attr == "cost" else self.modules.modules[m].cost * value
+            elif kind == "zone" and target in zone_idx and attr in ("max_power_kw", "latency_budget_ms"):
+                (power if attr == "max_power_kw" else latency)[zone_idx[target]] = value
+            else:
+                raise ValueError(f"Scenario '{scenario.name}' has unsupported override '{key}'.")
+
+        return ScenarioParams(
+            module_cost=cost,
+            zone_power=power,
+            zone_latency=latency,
+            weights=replace(scorer.DEFAULT_WEIGHTS, **weights),
+        )
+
+    def splits_symmetry(self, params: ScenarioParams) -> bool:
+        """
+        EN:
+            Whether `params` gives different costs to modules that are
+            interchangeable in the base problem. Symmetry breaking keeps
+            only one module of such a class, so the cached population may
+            lack the one that is now cheaper.
+
+        TR:
+            `params`'ın temel problemde birbirinin yerine geçebilen
+            modüllere farklı maliyet verip vermediği. Simetri kırma böyle
+            bir sınıftan yalnızca bir modül tuttuğundan, önbellekteki
+            popülasyonda artık daha ucuz olan modül bulunmayabilir.
+        """
+        return any(len({params.module_cost[m] for m in group}) > 1 for group in self.module_classes)
+
+    def rescore(self, params: ScenarioParams) -> Tuple[List[float], List[bool]]:
+        """
+        EN:
+            Scores of every cached candidate under `params`, plus a
+            power-feasibility mask.
+
+        TR:
+            `params` altında önbellekteki her adayın skoru ve güç
+            uygulanabilirlik maskesi.
+        """
+        cost = params.module_cost
+        caps = params.zone_power
+        w = params.weights
+        budgets = params.zone_latency
+        pair_budget: Dict[Tuple[int, int], Optional[float]] = {}
+
+        scores: List[float] = []
+        feasible: List[bool] = []
+        for c in range(len(self.candidates)):
+            total_cost = sum(cost[m] * n for m, n in self.counts[c])
+            over = sum(max(0.0, load - cap) for load, cap in zip(self.loads[c], caps))
+            late = 0.0
+            for estimate, src, dst in self.latency[c]:
+                key = (src, dst)
+                if key not in pair_budget:
+                    defined = [b for b in (budgets[src], budgets[dst]) if b is not None]
+                    pair_budget[key] = min(defined) if defined else None
+                budget = pair_budget[key]
+                if budget is not None and estimate > budget:
+                    late += estimate - budget
+            penalty = (
+                over * w.power
+                + self.harness[c] * w.harness
+                + late * w.latency
+                + self.shortfall[c] * w.redundancy
+                + self.overload[c] * w.bandwidth
+            )
+            scores.append(-total_cost - penalty)
+            feasible.append(over <= 0.0)
+        return scores, feasible
+
+    def apply(self, scenario: Scenario) -> Tuple[RequirementSet, ModuleLibrary, scorer.PenaltyWeights]:
+        """
+        EN:
+            Copies of the base problem with the scenario's overrides applied,
+            used when a scenario has to be searched again.
+
+        TR:
+            Senaryonun yeniden aranması gerektiğinde kullanılan, geçersiz
+            kılmaları uygulanmış temel problem kopyaları.
+        """
+        params = self.params(scenario)
+        requirements = copy.deepcopy(self.requirements)
+        modules = copy.deepcopy(self.modules)
+        for module, cost in zip(modules.modules, params.module_cost):
+            module.cost = cost
+        for zone, power, latency in zip(requirements.zones, params.zone_power, params.zone_latency):
+            zone.max_power_kw = power
+            zone.latency_budget_ms = latency
+        return requirements, modules, params.weights
+
+
+def build_population(
+    requirements: RequirementSet,
+    modules: ModuleLibrary,
+    baseline: ArchitectureCandidate,
+    size: int,
+    time_limit_s: float,
+    strategies: Sequence[str],
+    seed: int = 0,
+) -> List[ArchitectureCandidate]:
+    """
+    EN:
+        Run the search portfolio once and keep its `size` best distinct
+        candidates (plus the baseline) as the sweep population. Symmetries
+        are not broken: scenarios may treat equivalent modules and zones
+        differently.
+
+    TR:
+        Arama portföyünü bir kez çalıştırır ve en iyi `size` farklı adayı
+        (başlangıç çözümüyle birlikte) tarama popülasyonu olarak tutar.
+        Simetriler kırılmaz: senaryolar eşdeğer modül ve zonlara farklı
+        davranabilir.
+    """
+    space = search.SearchSpace.from_problem(requirements, modules, break_symmetry=False)
+    result = search.run_portfolio(
+        space,
+        baseline=baseline,
+        strategies=strategies,
+        time_limit_s=time_limit_s,
+        seed=seed,
+        archive_size=size,
+    )
+    return [baseline] + [space.build(assignment) for _, assignment in result.archive]
+
+
+def run_sweep(
+    cache: CandidateCache,
+    scenarios: Sequence[Scenario],
+    research_time_s: float = 0.0,
+    strategies: Sequence[str] = ("greedy", "anneal", "ga"),
+    seed: int = 0,
+) -> List[ScenarioResult]:
+    """
+    EN:
+        Re-score the cached population for each scenario. When a scenario
+        changes the power-feasible set or splits a class of interchangeable
+        modules (`CandidateCache.splits_symmetry`) and `research_time_s > 0`,
+        it is searched again from its best cached candidate and the better
+        of the two answers is kept.
+
+    TR:
+        Önbellekteki popülasyonu her senaryo için yeniden skorlar. Bir
+        senaryo güç açısından uygulanabilir kümeyi değiştirir veya birbirinin
+        yerine geçebilen modüllerden oluşan bir sınıfı bölerse
+        (`CandidateCache.splits_symmetry`) ve `research_time_s > 0` ise, en
+        iyi önbellek adayından yeniden aranır ve iki cevaptan daha iyisi
+        tutulur.
+    """
+    if not len(cache):
+        raise ValueError("Candidate cache is empty.")
+    _, base_feasible = cache.rescore(cache.params(Scenario(name="base")))
+
+    results: List[ScenarioResult] = []
+    for scenario in scenarios:
+        params = cache.params(scenario)
+        scores, feasible = cache.rescore(params)
+        best_idx = max(range(len(scores)), key=scores.__getitem__)
+        best = cache.candidates[best_idx]
+        best_score = scores[best_idx]
+        researched = False
+        requirements, modules, weights = cache.apply(scenario)
+
+        if research_time_s > 0 and (feasible != base_feasible or cache.splits_symmetry(params)):
+            space = search.SearchSpace.from_problem(requirements, modules)
+            space.weights = weights
+            found = search.run_portfolio(
+                space,
+                baseline=best,
+                strategies=strategies,
+                time_limit_s=research_time_s,
+                seed=seed,
+            )
+            researched = True
+            if found.best.score is not None and found.best.score > best_score:
+                best, best_score = found.best, found.best.score
+
+        rescored = scorer.score_candidates(
+            [_rebind(best, requirements, modules)], weights=weights
+        )[0]
+        results.append(
+            ScenarioResult(
+                scenario=scenario,
+                score=rescored.score if rescored.score is not None else best_score,
+                total_cost=rescored.total_cost,
+                penalties=dict(rescored.penalties),
+                feasible=sum(feasible),
+                researched=researched,
+                placements=[
+                    (fid, pm.module.id, pm.zone.name)
+                    for pm in rescored.modules
+                    for fid in pm.provided_features
+                ],
+            )
+        )
+    return results
+
+
+def _rebind(
+    candidate: ArchitectureCandidate,
+    requirements: RequirementSet,
+    modules: ModuleLibrary,
+) -> ArchitectureCandidate:
+    """
+    EN:
+        Rebuild a candidate on top of (overridden) problem objects.
+
+    TR:
+        Bir adayı (geçersiz kılınmış) problem nesneleri üzerinde yeniden
+        oluşturur.
+    """
+    features = {f.id: f for f in requirements.features}
+    module_by_id = {m.id: m for m in modules.modules}
+    zone_by_name = {z.name: z for z in requirements.zones}
+    placements = [
+        (features[fid], module_by_id[pm.module.id], zone_by_name[pm.zone.name])
+        for pm in candidate.modules
+        for fid in pm.provided_features
+    ]
+    return generator.build_candidate(requirements, placements)
+
+
+def results_to_json(results: Sequence[ScenarioResult], population: int) -> Dict[str, Any]:
+    """
+    EN:
+        JSON-ready sweep report.
+
+    TR:
+        JSON'a hazır tarama raporu.
+    """
+    return {
+        "population": population,
+        "scenarios": [
+            {
+                "name": r.scenario.name,
+                "overrides": r.scenario.overrides,
+                "score": r.score,
+                "total_cost": r.total_cost,
+                "penalties": r.penalties,
+                "feasible_candidates": r.feasible,
+                "researched": r.researched,
+                "placements": [
+                    {"feature": fid, "module": mid, "zone": zone}
+                    for fid, mid, zone in r.placements
+                ],
+            }
+            for r in results
+        ],
+    }
@@ -0,0 +1,376 @@
+"""
+Symmetry detection and canonical candidate hashing.
+
+EN:
+    Vehicles are full of mirror-image zones (e.g. Front-Left/Front-Right)
+    and interchangeable modules, which make many candidates score exactly
+    the same. This module detects
+
+        * zone permutations that preserve power budgets, safety levels,
+          latency budgets and every pairwise harness length (mirrors across
+          the x/y axes and swaps of identical zones), kept as classes of
+          interchangeable zones plus a mirror subgroup of at most four
+          elements rather than as the (factorially large) full group,
+        * module classes with identical cost, power, latency class and
+          redundancy,
+
+    and uses them to break symmetry in search domains and to compute a
+    canonical structural hash so symmetric duplicates are evaluated once.
+
+TR:
+    Araçlar ayna simetrik zonlar (örn. Front-Left/Front-Right) ve birbirinin
+    yerine geçebilen modüllerle doludur; bu da birçok adayın tamamen aynı
+    skoru almasına yol açar. Bu modül şunları tespit eder:
+
+        * güç bütçelerini, güvenlik seviyelerini, gecikme bütçelerini ve
+          tüm ikili kablo uzunluklarını koruyan zon permütasyonları (x/y
+          eksenlerine göre aynalar ve özdeş zonların yer değiştirmesi);
+          bunlar (faktöriyel büyüklükteki) tam grup yerine birbirinin
+          yerine geçebilen zon sınıfları ve en fazla dört elemanlı bir ayna
+          alt grubu olarak tutulur,
+        * maliyeti, gücü, gecikme sınıfı ve yedekliliği aynı olan modül
+          sınıfları.
+
+    Bunları arama alanlarında simetri kırmak ve simetrik kopyaların yalnızca
+    bir kez değerlendirilmesi için kanonik yapısal hash hesaplamak üzere
+    kullanır.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .generator import _estimate_link_length
+from .model import Module, Zone
+
+Permutation = Tuple[int, ...]
+
+MAX_SYMMETRY_ZONES = 512  # above this, the O(Z²) mirror checks are skipped and nothing is deduplicated
+
+
+def _zone_signature(zone: Zone) -> Tuple:
+    return (zone.max_power_kw, zone.safety_level, zone.latency_budget_ms)
+
+
+def _module_signature(module: Module) -> Tuple:
+    return (module.cost, module.max_power_kw, module.latency_class, module.redundancy)
+
+
+def _mirror(zones: Sequence[Zone], axis: int) -> Optional[Permutation]:
+    """
+    EN:
+        Permutation mapping each positioned zone onto its mirror image
+        across the given axis (0: x -> -x, 1: y -> -y), or None.
+
+    TR:
+        Konumu olan her zonu verilen eksene göre (0: x -> -x, 1: y -> -y)
+        ayna görüntüsüne eşleyen permütasyon; yoksa None.
+    """
+    perm = list(range(len(zones)))
+    for i, zone in enumerate(zones):
+        if zone.position is None:
+            continue
+        target = list(zone.position)
+        target[axis] = -target[axis]
+        match = [
+            j for j, other in enumerate(zones)
+            if other.position is not None
+            and abs(other.position[0] - target[0]) < 1e-9
+            and abs(other.position[1] - target[1]) < 1e-9
+        ]
+        if not match:
+            return None
+        perm[i] = match[0]
+    return tuple(perm)
+
+
+def _is_automorphism(zones: Sequence[Zone], perm: Permutation) -> bool:
+    if sorted(perm) != list(range(len(zones))):
+        return False
+    for i, j in enumerate(perm):
+        if _zone_signature(zones[i]) != _zone_signature(zones[j]):
+            return False
+    for a in range(len(zones)):
+        for b in range(a, len(zones)):
+            length = _estimate_link_length(zones[a], zones[b])
+            if length != _estimate_link_length(zones[perm[a]], zones[perm[b]]):
+                return False
+    return True
+
+
+def _compose(outer: Permutation, inner: Permutation) -> Permutation:
+    return tuple(outer[i] for i in inner)
+
+
+def zone_classes(zones: Sequence[Zone]) -> List[List[int]]:
+    """
+    EN:
+        Classes of interchangeable zones (same budgets, safety level,
+        latency budget and position), each sorted and with at least two
+        members. Any permutation within a class keeps every harness length,
+        so the classes stand for the whole group of swaps without listing
+        it.
+
+    TR:
+        Birbirinin yerine geçebilen zon sınıfları (aynı bütçe, güvenlik
+        seviyesi, gecikme bütçesi ve konum); her biri sıralıdır ve en az iki
+        üyelidir. Bir sınıf içindeki her permütasyon tüm kablo uzunluklarını
+        korur; böylece sınıflar, grubu listelemeden tüm yer değiştirmeleri
+        temsil eder.
+    """
+    groups: Dict[Tuple, List[int]] = {}
+    for z, zone in enumerate(zones):
+        groups.setdefault((_zone_signature(zone), zone.position), []).append(z)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def mirror_group(zones: Sequence[Zone]) -> List[Permutation]:
+    """
+    EN:
+        The (at most four) zone permutations generated by the x/y mirrors
+        that leave every zone attribute and harness length unchanged,
+        identity first.
+
+    TR:
+        Her zon özelliğini ve kablo uzunluğunu değiştirmeyen x/y
+        aynalarının ürettiği (en fazla dört) zon permütasyonu; ilk eleman
+        birim permütasyondur.
+    """
+    identity = tuple(range(len(zones)))
+    group = [identity]
+    for axis in (0, 1):
+        perm = _mirror(zones, axis)
+        if perm is None or perm in group or not _is_automorphism(zones, perm):
+            continue
+        group += [_compose(perm, g) for g in group if _compose(perm, g) not in group]
+    return group
+
+
+@dataclass
+class SymmetryInfo:
+    """
+    EN:
+        Detected symmetries of a search space. `option_keys[f][o]` is the
+        (module class, zone index) pair of option `o` of feature `f`. The
+        zone group is kept as generators: `zone_classes` (any permutation
+        within a class) and the `mirrors` subgroup, both checked to map
+        every feature domain onto itself. Its order grows factorially with
+        the class sizes, so it is never enumerated.
+
+    TR:
+        Bir arama uzayında tespit edilen simetriler. `option_keys[f][o]`,
+        `f` özelliğinin `o` seçeneğinin (modül sınıfı, zon indeksi) çiftidir.
+        Zon grubu üreteçleriyle tutulur: `zone_classes` (bir sınıf içindeki
+        her permütasyon) ve `mirrors` alt grubu; ikisinin de her özellik
+        alanını kendisine eşlediği doğrulanmıştır. Grubun mertebesi sınıf
+        boyutlarıyla faktöriyel büyüdüğünden asla listelenmez.
+    """
+
+    zone_classes: List[List[int]]
+    mirrors: List[Permutation]
+    module_class: Dict[str, int]
+    option_keys: List[List[Tuple[int, int]]] = field(default_factory=list)
+    merged_modules: int = 0
+    removed_options: int = 0
+    broken_feature: Optional[str] = None
+    _class_of: Dict[int, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._class_of = {z: members for members in self.zone_classes for z in members}
+
+    @property
+    def order(self) -> int:
+        """
+        EN:
+            Number of zone permutations in the group.
+
+        TR:
+            Gruptaki zon permütasyonlarının sayısı.
+        """
+        return len(self.mirrors) * math.prod(math.factorial(len(c)) for c in self.zone_classes)
+
+    def representative(self, zone: int) -> int:
+        """
+        EN:
+            Smallest zone index in the orbit of `zone`.
+
+        TR:
+            `zone` yörüngesindeki en küçük zon indeksi.
+        """
+        return min(self._class_of.get(perm[zone], (perm[zone],))[0] for perm in self.mirrors)
+
+    def to_representative(self, zone: int) -> Permutation:
+        """
+        EN:
+            A group element mapping `zone` onto `representative(zone)`:
+            a mirror followed by a swap within a class.
+
+        TR:
+            `zone`u `representative(zone)` zonuna eşleyen bir grup elemanı:
+            bir aynayı izleyen, sınıf içi bir yer değiştirme.
+        """
+        target = self.representative(zone)
+        for perm in self.mirrors:
+            image = perm[zone]
+            if image == target or target in self._class_of.get(image, ()):
+                swap = list(range(len(perm)))
+                swap[image], swap[target] = target, image
+                return _compose(tuple(swap), perm)
+        raise ValueError(f"Zone {zone} has no representative.")  # unreachable
+
+    def canonical_key(self, assignment: Sequence[int]) -> bytes:
+        """
+        EN:
+            Canonical structural hash of an assignment with modules replaced
+            by their class: per mirror image, the zones of each class are
+            relabeled to the class members in order of first appearance,
+            and the smallest result is hashed. This is O(n) per mirror
+            (at most four), and symmetric duplicates share the same key.
+
+        TR:
+            Modülleri sınıflarıyla değiştirilmiş bir atamanın kanonik yapısal
+            hash'i: her ayna görüntüsünde her sınıfın zonları, ilk görülme
+            sırasına göre sınıf üyeleriyle yeniden etiketlenir ve en küçük
+            sonuç hash'lenir. Ayna başına (en fazla dört) O(n) sürer;
+            simetrik kopyalar aynı anahtarı paylaşır.
+        """
+        pairs = [keys[o] for keys, o in zip(self.option_keys, assignment)]
+        best: Optional[List[int]] = None
+        for perm in self.mirrors:
+            label: Dict[int, int] = {}
+            used: Dict[int, int] = {}
+            image: List[int] = []
+            for m, z in pairs:
+                z = perm[z]
+                members = self._class_of.get(z)
+                if members is not None:
+                    if z not in label:
+                        label[z] = members[used.get(members[0], 0)]
+                        used[members[0]] = used.get(members[0], 0) + 1
+                    z = label[z]
+                image += (m, z)
+            if best is None or image < best:
+                best = image
+        return hashlib.blake2b(array("i", best or []).tobytes(), digest_size=8).digest()
+
+    def summary(self) -> str:
+        return (
+            f"Symmetry: {len(self.zone_classes)} class(es) of interchangeable zones "
+            f"({sum(len(c) for c in self.zone_classes)} zone(s)), {len(self.mirrors) - 1} mirror(s), "
+            f"{self.merged_modules} interchangeable module(s) merged, "
+            f"{self.removed_options} option(s) removed"
+            + (f", zone orbit fixed for '{self.broken_feature}'." if self.broken_feature else ".")
+        )
+
+
+def detect(
+    zones: Sequence[Zone],
+    feature_ids: Sequence[str],
+    domains: List[List[Tuple[Module, Zone]]],
+    traffic: bool = False,
+) -> Tuple[SymmetryInfo, List[List[Tuple[Module, Zone]]]]:
+    """
+    EN:
+        Detect symmetries and return symmetry-reduced domains:
+
+        * options using a module equivalent to an earlier one in the same
+          zone are dropped (identical score),
+        * one feature is restricted to a single representative zone per
+          orbit of the zone group (lex-leader style symmetry breaking).
+
+        Both reductions keep at least one optimal assignment reachable.
+        With `traffic`, the zone group is trivial: network routing breaks
+        ties by zone index, so zone-permuted images may score differently.
+
+    TR:
+        Simetrileri tespit eder ve simetrisi azaltılmış alanları döndürür:
+
+        * aynı zonda daha önceki bir modüle eşdeğer modül kullanan
+          seçenekler atılır (skor aynıdır),
+        * bir özellik, zon grubunun her yörüngesi için tek bir temsilci
+          zonla sınırlanır (lex-leader tarzı simetri kırma).
+
+        Her iki indirgeme de en az bir optimal atamayı erişilebilir tutar.
+        `traffic` ile zon grubu yalnızca birim permütasyondur: ağ
+        yönlendirmesi eşitlikleri zon indeksiyle bozduğundan zonları
+        permüte edilmiş görüntüler farklı skor alabilir.
+    """
+    zone_idx = {id(z): i for i, z in enumerate(zones)}
+
+    modules: List[Module] = []
+    for domain in domains:
+        for module, _ in domain:
+            if all(module is not m for m in modules):
+                modules.append(module)
+    representative: Dict[Tuple, int] = {}
+    module_class: Dict[str, int] = {}
+    for module in modules:
+        module_class[module.id] = representative.setdefault(_module_signature(module), len(representative))
+    merged = len(modules) - len(representative)
+
+    reduced: List[List[Tuple[Module, Zone]]] = []
+    removed = 0
+    for domain in domains:
+        kept: List[Tuple[Module, Zone]] = []
+        taken = set()
+        for module, zone in domain:
+            key = (module_class[module.id], zone_idx[id(zone)])
+            if key in taken:
+                removed += 1
+                continue
+            taken.add(key)
+            kept.append((module, zone))
+        reduced.append(kept)
+
+    option_sets = [
+        {(module_class[m.id], zone_idx[id(z)]) for m, z in domain} for domain in reduced
+    ]
+    # Zones are only interchangeable if every domain offers the same module classes in them
+    profile: List[List[Tuple[int, int]]] = [[] for _ in zones]
+    for f, options in enumerate(option_sets):
+        for m, z in sorted(options):
+            profile[z].append((f, m))
+    classes: List[List[int]] = []
+    if not traffic and len(zones) <= MAX_SYMMETRY_ZONES:
+        for members in zone_classes(zones):
+            split: Dict[Tuple, List[int]] = {}
+            for z in members:
+                split.setdefault(tuple(profile[z]), []).append(z)
+            classes += [c for c in split.values() if len(c) > 1]
+        mirrors = [
+            perm for perm in mirror_group(zones)
+            if all({(m, perm[z]) for m, z in options} == options for options in option_sets)
+        ]
+    else:
+        mirrors = [tuple(range(len(zones)))]
+    info = SymmetryInfo(zone_classes=classes, mirrors=mirrors, module_class=module_class)
+
+    broken: Optional[str] = None
+    if info.order > 1:
+        best_gain, best_f = 0, None
+        for f, domain in enumerate(reduced):
+            zones_used = {zone_idx[id(z)] for _, z in domain}
+            reps = {info.representative(z) for z in zones_used}
+            gain = len(zones_used) - len(reps)
+            if gain > best_gain:
+                best_gain, best_f = gain, f
+        if best_f is not None:
+            before = len(reduced[best_f])
+            reduced[best_f] = [
+                (m, z) for m, z in reduced[best_f]
+                if zone_idx[id(z)] == info.representative(zone_idx[id(z)])
+            ]
+            removed += before - len(reduced[best_f])
+            broken = feature_ids[best_f]
+
+    info.option_keys = [
+        [(module_class[m.id], zone_idx[id(z)]) for m, z in domain] for domain in reduced
+    ]
+    info.merged_modules = merged
+    info.removed_options = removed
+    info.broken_feature = broken
+    return info, reduced
@@ -0,0 +1,13 @@
+"""
+Graph algorithms for ZAC.
+
+EN:
+  Interaction graphs over features, modules and zones, and the problem
+  decomposition built on top of them.
+
+TR:
+  Özellikler, modüller ve zonlar üzerindeki etkileşim grafikleri ve bunların
+  üzerine kurulan problem ayrıştırması.
+"""
+
+from . import decomposition  # noqa: F401
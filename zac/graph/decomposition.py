@@ -0,0 +1,592 @@
+"""
+Problem decomposition into independent feature clusters.
+
+EN:
+    Builds the feature–module–zone interaction graph of a search space and
+    splits the features into clusters that only interact through zone
+    power budgets. A zone couples features only when it is *contested*,
+    i.e. the features that may use it could overload it together. Large
+    components can be cut further by turning their busiest contested zones
+    into coupling zones whose budget is shared out between the clusters.
+    Clusters are solved independently (in parallel processes), then merged
+    and repaired at the zone power constraints, so solve time follows the
+    largest cluster instead of the whole vehicle.
+
+    Module types are not capacity-limited in this model, so sharing a
+    module type does not couple features unless `couple_modules` is set.
+    The sequential harness links between consecutive features are ignored
+    while solving clusters; the merged candidate is scored exactly.
+
+TR:
+    Bir arama uzayının özellik–modül–zon etkileşim grafiğini kurar ve
+    özellikleri yalnızca zon güç bütçeleri üzerinden etkileşen kümelere
+    ayırır. Bir zon, özellikleri yalnızca *çekişmeli* ise, yani onu
+    kullanabilecek özellikler birlikte aşırı yükleyebiliyorsa bağlar.
+    Büyük bileşenler, en yoğun çekişmeli zonları bütçesi kümeler arasında
+    paylaştırılan bağlayıcı zonlara çevrilerek daha da bölünebilir.
+    Kümeler bağımsız olarak (paralel süreçlerde) çözülür, ardından
+    birleştirilip zon güç kısıtlarında onarılır; böylece çözüm süresi tüm
+    araca değil en büyük kümeye göre ölçeklenir.
+
+    Bu modelde modül tiplerinin kapasite sınırı yoktur; bu nedenle aynı
+    modül tipinin paylaşılması, `couple_modules` verilmedikçe özellikleri
+    bağlamaz. Kümeler çözülürken ardışık özellikler arasındaki sıralı
+    kablo bağlantıları yok sayılır; birleştirilmiş aday tam olarak
+    skorlanır.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from zac.compiler import network
+from zac.compiler.bounds import optimality_gap
+from zac.compiler.model import ArchitectureCandidate, RequirementSet
+from zac.compiler.search import Assignment, SearchProgress, SearchResult, SearchSpace, run_portfolio
+
+Node = Tuple[str, object]  # ("feature", idx) | ("module", id) | ("zone", name)
+
+_MERGE_SHARE = 0.2  # share of the time limit kept for repair and polish
+
+
+@dataclass
+class Cluster:
+    """
+    EN:
+        A group of features solved together, with the power budget granted
+        to it in each shared (coupling) zone.
+
+    TR:
+        Birlikte çözülen bir özellik grubu ve her paylaşılan (bağlayıcı)
+        zonda ona ayrılan güç bütçesi.
+    """
+
+    features: List[int]
+    zone_budgets: Dict[str, float] = field(default_factory=dict)
+
+    def log10_size(self, space: SearchSpace) -> float:
+        return sum(math.log10(len(space.domains[f])) for f in self.features)
+
+
+@dataclass
+class Decomposition:
+    """
+    EN:
+        Result of splitting a search space into clusters.
+
+    TR:
+        Bir arama uzayının kümelere bölünmesinin sonucu.
+    """
+
+    clusters: List[Cluster]
+    contested_zones: List[str]
+    coupling_zones: List[str]
+
+    def summary(self, space: SearchSpace) -> str:
+        sizes = sorted((len(c.features) for c in self.clusters), reverse=True)
+        largest = max((c.log10_size(space) for c in self.clusters), default=0.0)
+        return (
+            f"Decomposition: {len(self.clusters)} cluster(s) of sizes {sizes}, "
+            f"largest search space 1e{largest:.1f}, "
+            f"{len(self.coupling_zones)} coupling zone(s)."
+        )
+
+
+def interaction_graph(space: SearchSpace) -> Dict[Node, Set[Node]]:
+    """
+    EN:
+        Undirected feature–module–zone graph: every feature is linked to the
+        modules and zones occurring in its domain.
+
+    TR:
+        Yönsüz özellik–modül–zon grafiği: her özellik, alanında geçen
+        modüllere ve zonlara bağlanır.
+    """
+    graph: Dict[Node, Set[Node]] = {}
+    for f, domain in enumerate(space.domains):
+        node: Node = ("feature", f)
+        graph.setdefault(node, set())
+        for module, zone in domain:
+            for other in (("module", module.id), ("zone", zone.name)):
+                graph[node].add(other)
+                graph.setdefault(other, set()).add(node)
+    return graph
+
+
+def contested_zones(space: SearchSpace) -> List[str]:
+    """
+    EN:
+        Zones that the features able to use them could overload together
+        (sum of each feature's most power-hungry option in the zone exceeds
+        its budget). Other zones can never bind and do not couple anything.
+
+    TR:
+        Onu kullanabilen özelliklerin birlikte aşırı yükleyebileceği zonlar
+        (her özelliğin o zondaki en çok güç çeken seçeneklerinin toplamı
+        bütçeyi aşar). Diğer zonlar asla kısıt oluşturmaz ve hiçbir şeyi
+        bağlamaz.
+    """
+    worst: Dict[str, float] = {}
+    for domain in space.domains:
+        per_zone: Dict[str, float] = {}
+        for module, zone in domain:
+            per_zone[zone.name] = max(per_zone.get(zone.name, 0.0), module.max_power_kw)
+        for name, power in per_zone.items():
+            worst[name] = worst.get(name, 0.0) + power
+    return [
+        z.name for z in space.requirements.zones
+        if worst.get(z.name, 0.0) > z.max_power_kw
+    ]
+
+
+def _components(
+    space: SearchSpace,
+    graph: Dict[Node, Set[Node]],
+    coupling: Set[Node],
+) -> List[List[int]]:
+    parent = list(range(len(space.features)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for node in coupling:
+        members = sorted(f for kind, f in graph.get(node, ()) if kind == "feature")
+        for other in members[1:]:
+            parent[find(other)] = find(members[0])
+
+    groups: Dict[int, List[int]] = {}
+    for f in range(len(space.features)):
+        groups.setdefault(find(f), []).append(f)
+    return sorted(groups.values(), key=lambda g: g[0])
+
+
+def decompose(
+    space: SearchSpace,
+    max_cluster_size: Optional[int] = None,
+    couple_modules: bool = False,
+) -> Decomposition:
+    """
+    EN:
+        Split the space into connected components over contested zones
+        (and module types when `couple_modules`). While a component has more
+        than `max_cluster_size` features, its busiest contested zone is
+        turned into a coupling zone whose budget is split between the
+        resulting clusters in proportion to their peak demand there.
+
+    TR:
+        Uzayı çekişmeli zonlar (ve `couple_modules` ise modül tipleri)
+        üzerinden bağlı bileşenlere ayırır. Bir bileşende
+        `max_cluster_size`'dan fazla özellik oldukça, en yoğun çekişmeli
+        zonu, bütçesi ortaya çıkan kümeler arasında oradaki en yüksek
+        talepleriyle orantılı paylaştırılan bağlayıcı bir zona çevrilir.
+    """
+    graph = interaction_graph(space)
+    contested = contested_zones(space)
+    coupling: Set[Node] = {("zone", name) for name in contested}
+    if couple_modules:
+        coupling |= {node for node in graph if node[0] == "module"}
+
+    budgeted: List[str] = []
+    groups = _components(space, graph, coupling)
+    while max_cluster_size and max(len(g) for g in groups) > max_cluster_size:
+        largest = set(max(groups, key=len))
+        hubs = [
+            node for node in coupling
+            if node[0] == "zone"
+            and sum(1 for _, f in graph[node] if f in largest) > 1
+        ]
+        if not hubs:
+            break
+        hub = max(hubs, key=lambda n: (len(graph[n]), str(n[1])))
+        coupling.discard(hub)
+        budgeted.append(str(hub[1]))
+        groups = _components(space, graph, coupling)
+
+    caps = {z.name: z.max_power_kw for z in space.requirements.zones}
+    clusters = [Cluster(features=g) for g in groups]
+    for name in budgeted:
+        demand = []
+        for cluster in clusters:
+            peak = 0.0
+            for f in cluster.features:
+                peak += max(
+                    (m.max_power_kw for m, z in space.domains[f] if z.name == name),
+                    default=0.0,
+                )
+            demand.append(peak)
+        total = sum(demand)
+        for cluster, peak in zip(clusters, demand):
+            if peak > 0:
+                cluster.zone_budgets[name] = caps[name] * peak / total
+
+    return Decomposition(clusters=clusters, contested_zones=contested, coupling_zones=budgeted)
+
+
+def subspace(space: SearchSpace, cluster: Cluster) -> SearchSpace:
+    """
+    EN:
+        Search space of one cluster. Domains are shared with the parent so
+        option indices stay valid; coupling zones carry the cluster budget.
+
+    TR:
+        Tek bir kümenin arama uzayı. Alanlar ana uzayla paylaşılır, böylece
+        seçenek indeksleri geçerli kalır; bağlayıcı zonlar küme bütçesini
+        taşır.
+    """
+    zones = [
+        replace(z, max_power_kw=cluster.zone_budgets[z.name]) if z.name in cluster.zone_budgets else z
+        for z in space.requirements.zones
+    ]
+    features = [space.features[f] for f in cluster.features]
+    requirements = RequirementSet(
+        vehicle_name=space.requirements.vehicle_name,
+        zones=zones,
+        features=features,
+        traffic=network.demands_for(space.requirements, [f.id for f in features]),
+    )
+    return SearchSpace(
+        requirements=requirements,
+        features=features,
+        domains=[space.domains[f] for f in cluster.features],
+        weights=space.weights,
+    )
+
+
+def _solve_cluster(
+    sub: SearchSpace,
+    initial: Assignment,
+    time_limit_s: float,
+    strategies: Sequence[str],
+    seed: int,
+    exhaustive_limit: int,
+) -> Tuple[Assignment, int]:
+    """
+    EN:
+        Solve one cluster: exhaustive enumeration when its space is small,
+        otherwise the regular strategy portfolio. Runs in a worker process.
+
+    TR:
+        Tek bir kümeyi çözer: uzay küçükse tam sayım, değilse normal
+        strateji portföyü. Bir işçi süreçte çalışır.
+    """
+    size = math.prod(len(d) for d in sub.domains)
+    if size <= exhaustive_limit:
+        deadline = time.monotonic() + time_limit_s
+        best, best_score = list(initial), -math.inf
+        evaluations = 0
+        for assignment in itertools.product(*(range(len(d)) for d in sub.domains)):
+            if time.monotonic() >= deadline:
+                break
+            evaluations += 1
+            score = sub.score(assignment).score
+            if score is not None and score > best_score:
+                best, best_score = list(assignment), score
+        return best, evaluations
+
+    result = run_portfolio(
+        sub,
+        baseline=sub.build(initial),
+        strategies=strategies,
+        time_limit_s=time_limit_s,
+        seed=seed,
+    )
+    return list(result.assignment), result.evaluations
+
+
+def repair(space: SearchSpace, assignment: Assignment, deadline: float = math.inf) -> Assignment:
+    """
+    EN:
+        Greedily move features out of overloaded zones: at each step apply
+        the single option change that removes overload and loses the least
+        score, until no zone is overloaded, no move helps or the monotonic
+        `deadline` passes. Overload deltas are computed incrementally; only
+        the moves that remove the most overload are scored exactly.
+
+    TR:
+        Aşırı yüklenmiş zonlardan özellikleri açgözlü biçimde taşır: her
+        adımda aşırı yükü kaldıran ve en az skor kaybettiren tek seçenek
+        değişikliğini uygular; aşırı yüklü zon kalmayana, hiçbir hamle işe
+        yaramayana veya monotonik `deadline` geçene kadar sürer. Aşırı yük
+        farkları artımlı hesaplanır; yalnızca en çok aşırı yükü kaldıran
+        hamleler tam olarak skorlanır.
+    """
+    caps = {z.name: z.max_power_kw for z in space.requirements.zones}
+    current = list(assignment)
+    load = {name: 0.0 for name in caps}
+    for domain, option in zip(space.domains, current):
+        module, zone = domain[option]
+        load[zone.name] += module.max_power_kw
+
+    def over(name: str, value: float) -> float:
+        return max(0.0, value - caps[name])
+
+    excess = sum(over(name, value) for name, value in load.items())
+    while excess > 1e-9 and time.monotonic() < deadline:
+        # Cheapest overload after each single move, then the best score among those moves
+        moves: List[Tuple[int, int]] = []
+        least = excess
+        for f, domain in enumerate(space.domains):
+            old_module, old_zone = domain[current[f]]
+            for option, (module, zone) in enumerate(domain):
+                if option == current[f]:
+                    continue
+                if zone.name == old_zone.name:
+                    name = zone.name
+                    after = load[name] - old_module.max_power_kw + module.max_power_kw
+                    trial_excess = excess - over(name, load[name]) + over(name, after)
+                else:
+                    src, dst = old_zone.name, zone.name
+                    trial_excess = (
+                        excess
+                        - over(src, load[src]) + over(src, load[src] - old_module.max_power_kw)
+                        - over(dst, load[dst]) + over(dst, load[dst] + module.max_power_kw)
+                    )
+                if trial_excess < least - 1e-9:
+                    moves, least = [(f, option)], trial_excess
+                elif moves and abs(trial_excess - least) <= 1e-9:
+                    moves.append((f, option))
+        if not moves:
+            break
+        best_move, best_score = None, -math.inf
+        for f, option in moves:
+            if best_move is not None and time.monotonic() >= deadline:
+                break
+            trial = list(current)
+            trial[f] = option
+            score = _score(space.score(trial))
+            if best_move is None or score > best_score:
+                best_move, best_score = (f, option), score
+        f, option = best_move
+        old_module, old_zone = space.domains[f][current[f]]
+        module, zone = space.domains[f][option]
+        load[old_zone.name] -= old_module.max_power_kw
+        load[zone.name] += module.max_power_kw
+        current[f] = option
+        excess = sum(over(name, value) for name, value in load.items())
+    return current
+
+
+def boundary_pairs(space: SearchSpace, parts: Decomposition) -> List[Tuple[int, int]]:
+    """
+    EN:
+        Consecutive features that belong to different clusters, i.e. the
+        sequential harness links that cluster solving ignores.
+
+    TR:
+        Farklı kümelere ait ardışık özellikler, yani küme çözümünün yok
+        saydığı sıralı kablo bağlantıları.
+    """
+    owner = {f: c for c, cluster in enumerate(parts.clusters) for f in cluster.features}
+    return [(f, f + 1) for f in range(len(space.features) - 1) if owner.get(f) != owner.get(f + 1)]
+
+
+def polish(
+    space: SearchSpace,
+    assignment: Assignment,
+    max_passes: int = 3,
+    deadline: float = math.inf,
+    pairs: Sequence[Tuple[int, int]] = (),
+) -> Assignment:
+    """
+    EN:
+        Coordinate descent on the exact score: try every option of every
+        feature, then every joint move of each `pairs` feature pair, and
+        keep improvements. With the `boundary_pairs` of a decomposition
+        this restores the cross-cluster harness effects that cluster
+        solving ignores, including those that only pay off when both ends
+        of a link move. Moves whose score bound (`SearchSpace.bounds`)
+        cannot beat the current score are skipped without building them;
+        the descent stops at the monotonic `deadline`.
+
+    TR:
+        Tam skor üzerinde koordinat inişi: her özelliğin her seçeneğini,
+        ardından `pairs` içindeki her özellik çiftinin her ortak hamlesini
+        dener ve iyileşmeleri tutar. Bir ayrıştırmanın `boundary_pairs`
+        çiftleriyle, küme çözümünün yok saydığı kümeler arası kablo
+        etkilerini, yalnızca bağlantının iki ucu birlikte taşındığında
+        kazandıranlar dahil, geri kazandırır. Skor sınırı
+        (`SearchSpace.bounds`) mevcut skoru geçemeyen hamleler kurulmadan
+        atlanır; iniş monotonik `deadline` anında durur.
+    """
+    bounds = space.bounds()
+    current = list(assignment)
+    current_score = _score(space.score(current))
+
+    def _moves():
+        for f, domain in enumerate(space.domains):
+            for option in range(len(domain)):
+                if option != current[f]:
+                    yield ((f, option),)
+        for f, g in pairs:
+            for a in range(len(space.domains[f])):
+                for b in range(len(space.domains[g])):
+                    if a != current[f] and b != current[g]:
+                        yield ((f, a), (g, b))
+
+    for _ in range(max_passes):
+        improved = False
+        for move in _moves():
+            trial = list(current)
+            for f, option in move:
+                trial[f] = option
+            if bounds.score_bound(trial) <= current_score:
+                continue
+            if time.monotonic() >= deadline:
+                return current
+            score = _score(space.score(trial))
+            if score > current_score:
+                current, current_score, improved = trial, score, True
+        if not improved:
+            break
+    return current
+
+
+def _score(candidate: ArchitectureCandidate) -> float:
+    return candidate.score if candidate.score is not None else -math.inf
+
+
+def solve_decomposed(
+    space: SearchSpace,
+    baseline: ArchitectureCandidate,
+    time_limit_s: float,
+    strategies: Sequence[str] = ("greedy", "anneal", "ga"),
+    seed: int = 0,
+    workers: Optional[int] = None,
+    max_cluster_size: Optional[int] = None,
+    exhaustive_limit: int = 4096,
+    progress: Optional[Callable[[SearchProgress], None]] = None,
+    on_improve: Optional[Callable[[ArchitectureCandidate], None]] = None,
+) -> Tuple[SearchResult, Decomposition]:
+    """
+    EN:
+        Decompose, solve every cluster in parallel, merge the cluster
+        answers into one assignment, repair zone overloads, polish with
+        coordinate descent (including joint moves across cluster
+        boundaries) and return the exact-scored result. Small clusters
+        are enumerated exhaustively; the others share the wall-clock
+        budget so the whole solve stays within about `time_limit_s`:
+        clusters get 80% of it and repair and polish stop at the overall
+        deadline. The baseline is kept if it scores better.
+
+        The result is heuristic: polish only reaches optima one feature or
+        one boundary pair away. It carries the space-wide score bound
+        (`SearchSpace.bounds`) and the optimality gap instead. `progress`
+        receives one report per stage (clusters, repair, polish) and
+        `on_improve` every better merged candidate.
+
+    TR:
+        Ayrıştırır, her kümeyi paralel çözer, küme cevaplarını tek bir
+        atamada birleştirir, zon aşırı yüklerini onarır, koordinat inişiyle
+        (küme sınırları boyunca ortak hamleler dahil) iyileştirir ve tam
+        skorlanmış sonucu döndürür. Küçük kümeler tam sayımla çözülür;
+        diğerleri duvar saati bütçesini paylaşır, böylece tüm çözüm
+        yaklaşık `time_limit_s` içinde kalır: kümeler bunun %80'ini alır,
+        onarım ve iyileştirme genel bitiş anında durur. Başlangıç çözümü
+        daha iyi skor alıyorsa o korunur.
+
+        Sonuç sezgiseldir: iyileştirme yalnızca bir özellik veya bir sınır
+        çifti uzaklıktaki optimumlara ulaşır. Bunun yerine uzay genelindeki
+        skor sınırını (`SearchSpace.bounds`) ve optimallik açığını taşır.
+        `progress` her aşama (kümeler, onarım, iyileştirme) için bir rapor,
+        `on_improve` ise daha iyi her birleştirilmiş adayı alır.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("At least one worker is required.")
+    if max_cluster_size is not None and max_cluster_size < 1:
+        raise ValueError("Clusters must allow at least one feature.")
+    started = time.monotonic()
+    deadline = started + time_limit_s
+    decomposition = decompose(space, max_cluster_size=max_cluster_size)
+    initial = space.project(baseline)
+    subspaces = [subspace(space, cluster) for cluster in decomposition.clusters]
+    searched = sum(
+        1 for sub in subspaces if math.prod(len(d) for d in sub.domains) > exhaustive_limit
+    )
+    if workers is None:
+        workers = min(len(subspaces), os.cpu_count() or 1)
+    # Searched clusters run in ceil(searched / workers) waves within the budget.
+    budget = time_limit_s * (1.0 - _MERGE_SHARE) / max(1, math.ceil(searched / max(1, workers)))
+    jobs = [
+        (
+            sub,
+            [initial[f] for f in cluster.features],
+            budget,
+            list(strategies),
+            seed + idx,
+            exhaustive_limit,
+        )
+        for idx, (sub, cluster) in enumerate(zip(subspaces, decomposition.clusters))
+    ]
+
+    if workers <= 1 or len(jobs) <= 1:
+        # One after another: never run past the clusters' share of the budget
+        solve_until = started + time_limit_s * (1.0 - _MERGE_SHARE)
+        answers = [
+            _solve_cluster(sub, init, max(0.0, min(limit, solve_until - time.monotonic())), *rest)
+            for sub, init, limit, *rest in jobs
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            answers = list(pool.map(_solve_cluster, *zip(*jobs)))
+
+    merged = list(initial)
+    evaluations = 0
+    for cluster, (assignment, evals) in zip(decomposition.clusters, answers):
+        evaluations += evals
+        for f, option in zip(cluster.features, assignment):
+            merged[f] = option
+
+    reference = space.score(initial)
+    reported = _score(reference)
+
+    def _report(candidate: ArchitectureCandidate) -> None:
+        nonlocal reported
+        if on_improve is not None and _score(candidate) > reported:
+            reported = _score(candidate)
+            on_improve(candidate)
+        if progress is not None:
+            elapsed = time.monotonic() - started
+            progress(
+                SearchProgress(
+                    elapsed_s=elapsed,
+                    best_score=max(_score(candidate), _score(reference)),
+                    evaluations=evaluations,
+                    pruned=0,
+                    duplicates=0,
+                    candidates_per_s=evaluations / elapsed if elapsed > 0 else 0.0,
+                    owner="decomposition",
+                )
+            )
+
+    _report(space.score(merged))
+    merged = repair(space, merged, deadline=deadline)
+    _report(space.score(merged))
+    merged = polish(space, merged, deadline=deadline, pairs=boundary_pairs(space, decomposition))
+
+    best = space.score(merged)
+    owner = "decomposition"
+    if _score(reference) > _score(best):
+        best, merged, owner = reference, initial, None
+    _report(best)
+
+    lower_bound = space.bounds().root().total
+    result = SearchResult(
+        best=best,
+        assignment=tuple(merged),
+        owner=owner,
+        evaluations=evaluations,
+        pruned=0,
+        elapsed_s=time.monotonic() - started,
+        lower_bound=lower_bound,
+        optimality_gap=optimality_gap(best.score, lower_bound) if best.score is not None else None,
+    )
+    return result, decomposition
@@ -2,7 +2,8 @@
 ZAC optimizer Python wrapper.
 
 Buradan Rust'taki optimizer_core modülünü kullanacağız.
-Şimdilik sadece add_numbers fonksiyonunu expose ediyoruz.
+add_numbers ve local_search fonksiyonlarını expose ediyoruz; native arama
+motoru ve saf Python referansı `zac.optimizer.local_search` içindedir.
 """
 
 try:
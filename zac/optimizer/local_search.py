@@ -0,0 +1,382 @@
+"""
+Native local search and its pure-Python reference.
+
+EN:
+    Encodes a `SearchSpace` as flat tables (feature domains, module cost,
+    power and redundancy penalty, zone budgets, zone-to-zone harness
+    lengths) and runs parallel annealing chains over it. When the Rust
+    extension `optimizer_core` is built, the chains run natively with the
+    GIL released; otherwise `local_search_reference` runs the exact same
+    algorithm (same RNG, same moves, same objective) in Python, which also
+    serves as the conformance oracle for the native code.
+
+    `NativeStrategy` plugs the engine into the search portfolio as
+    `--strategies native`.
+
+TR:
+    Bir `SearchSpace`'i düz tablolar halinde kodlar (özellik alanları,
+    modül maliyeti, gücü ve yedeklilik cezası, zon bütçeleri, zonlar arası
+    kablo uzunlukları) ve üzerinde paralel tavlama zincirleri çalıştırır.
+    Rust eklentisi `optimizer_core` derlenmişse zincirler GIL bırakılarak
+    native çalışır; değilse `local_search_reference` aynı algoritmayı (aynı
+    RNG, aynı hamleler, aynı amaç fonksiyonu) Python'da çalıştırır ve
+    native kod için uygunluk referansı olarak da kullanılır.
+
+    `NativeStrategy`, motoru arama portföyüne `--strategies native` olarak
+    bağlar.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from zac.compiler import generator, scorer
+from zac.compiler.search import STRATEGIES, Assignment, SearchSpace, SearchStrategy
+
+from . import optimizer_core
+
+_MASK = (1 << 64) - 1
+_THREAD_STRIDE = 0xD1B54A32D192ED03
+
+
+@dataclass
+class EncodedProblem:
+    """
+    EN:
+        Compact, index-based problem passed to the native engine. Module
+        and zone tables are indexed by position; `zone_latency` uses NaN
+        for "no budget" and `module_penalty` already holds the weighted
+        redundancy shortfall.
+
+    TR:
+        Native motora verilen kompakt, indeks tabanlı problem. Modül ve zon
+        tabloları sıra ile indekslenir; `zone_latency` "bütçe yok" için NaN
+        kullanır, `module_penalty` ağırlıklı yedeklilik eksiğini tutar.
+    """
+
+    domains: List[List[Tuple[int, int]]]
+    module_cost: List[float]
+    module_power: List[float]
+    module_penalty: List[float]
+    module_ethernet: List[bool]
+    zone_budget: List[float]
+    zone_latency: List[float]
+    distance: List[List[float]]
+    weights: Tuple[float, float, float]  # power, harness, latency
+
+    def args(self) -> Tuple:
+        return (
+            self.domains,
+            self.module_cost,
+            self.module_power,
+            self.module_penalty,
+            self.module_ethernet,
+            self.zone_budget,
+            self.zone_latency,
+            self.distance,
+            self.weights,
+        )
+
+
+def encode(space: SearchSpace) -> EncodedProblem:
+    """
+    EN:
+        Encode a search space with the same link model as
+        `generator.build_candidate` and the same penalties as the scorer.
+        The bandwidth penalty and bus media of a synthesized network
+        (traffic demands) are not encoded; `NativeStrategy` re-scores the returned placements
+        with the full scorer.
+
+    TR:
+        Bir arama uzayını `generator.build_candidate` ile aynı bağlantı
+        modeli ve skorlayıcı ile aynı cezalarla kodlar. Sentezlenen ağın
+        bant genişliği cezası ve bus ortamları (trafik talepleri)
+        kodlanmaz; `NativeStrategy` dönen yerleşimleri tam skorlayıcıyla
+        yeniden skorlar.
+    """
+    weights = space.weights or scorer.DEFAULT_WEIGHTS
+    zones = space.requirements.zones
+    zone_idx = {id(z): i for i, z in enumerate(zones)}
+
+    module_idx: Dict[int, int] = {}
+    modules = []
+    domains: List[List[Tuple[int, int]]] = []
+    for domain in space.domains:
+        encoded = []
+        for module, zone in domain:
+            if id(module) not in module_idx:
+                module_idx[id(module)] = len(modules)
+                modules.append(module)
+            encoded.append((module_idx[id(module)], zone_idx[id(zone)]))
+        domains.append(encoded)
+
+    return EncodedProblem(
+        domains=domains,
+        module_cost=[float(m.cost) for m in modules],
+        module_power=[float(m.max_power_kw) for m in modules],
+        module_penalty=[
+            (m.redundancy - 1) * weights.redundancy if m.redundancy > 1 else 0.0 for m in modules
+        ],
+        module_ethernet=[m.latency_class == "low" for m in modules],
+        zone_budget=[float(z.max_power_kw) for z in zones],
+        zone_latency=[
+            float(z.latency_budget_ms) if z.latency_budget_ms is not None else math.nan for z in zones
+        ],
+        distance=[[generator._estimate_link_length(a, b) for b in zones] for a in zones],
+        weights=(weights.power, weights.harness, weights.latency),
+    )
+
+
+def evaluate(problem: EncodedProblem, assignment: Sequence[int]) -> float:
+    """
+    EN:
+        Score of an assignment. Without traffic demands it is identical
+        (bit for bit) to `SearchSpace.score(assignment).score`; with them
+        it leaves out the network's bandwidth penalty and bus media, so it
+        is only a search heuristic.
+
+    TR:
+        Bir atamanın skoru. Trafik talebi yoksa
+        `SearchSpace.score(assignment).score` ile (bit düzeyinde) aynıdır;
+        varsa ağın bant genişliği cezasını ve bus ortamlarını dışarıda
+        bıraktığından yalnızca bir arama sezgiselidir.
+    """
+    power_w, harness_w, latency_w = problem.weights
+    cost = 0.0
+    load = [0.0] * len(problem.zone_budget)
+    redundancy = 0.0
+    for domain, option in zip(problem.domains, assignment):
+        m, z = domain[option]
+        cost += problem.module_cost[m]
+        load[z] += problem.module_power[m]
+        redundancy += problem.module_penalty[m]
+
+    power = 0.0
+    for value, budget in zip(load, problem.zone_budget):
+        over = value - budget
+        if over > 0:
+            power += over * power_w
+
+    length = 0.0
+    latency = 0.0
+    for f in range(1, len(assignment)):
+        src = problem.domains[f - 1][assignment[f - 1]][1]
+        m, dst = problem.domains[f][assignment[f]]
+        meters = problem.distance[src][dst]
+        length += meters
+        base, per_meter = (0.5, 0.02) if problem.module_ethernet[m] else (2.0, 0.05)
+        estimated = 0.0 + base + per_meter * meters
+        budgets = [b for b in (problem.zone_latency[src], problem.zone_latency[dst]) if not math.isnan(b)]
+        if budgets and estimated > min(budgets):
+            latency += (estimated - min(budgets)) * latency_w
+    harness = length * harness_w if len(assignment) > 1 else 0.0
+
+    return -cost - (0.0 + power + harness + latency + redundancy)
+
+
+class SplitMix64:
+    """
+    EN:
+        SplitMix64 generator shared bit for bit with the native engine.
+
+    TR:
+        Native motorla bit düzeyinde ortak SplitMix64 üreteci.
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.state = seed & _MASK
+
+    def next_u64(self) -> int:
+        self.state = (self.state + 0x9E3779B97F4A7C15) & _MASK
+        z = self.state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+        return z ^ (z >> 31)
+
+    def next_float(self) -> float:
+        return (self.next_u64() >> 11) * (1.0 / 9007199254740992.0)
+
+
+def _thread_seed(seed: int, thread: int) -> int:
+    return (seed + (thread + 1) * _THREAD_STRIDE) & _MASK
+
+
+def _anneal(
+    problem: EncodedProblem,
+    initial: Sequence[int],
+    iterations: int,
+    seed: int,
+    top_k: int,
+) -> List[Tuple[float, List[int]]]:
+    rng = SplitMix64(seed)
+    movable = [f for f, domain in enumerate(problem.domains) if len(domain) > 1]
+    current = list(initial)
+    current_score = evaluate(problem, current)
+    top: List[Tuple[float, List[int]]] = []
+
+    def offer(score: float) -> None:
+        if top_k == 0 or any(a == current for _, a in top):
+            return
+        if len(top) < top_k:
+            top.append((score, list(current)))
+            return
+        worst = min(range(len(top)), key=lambda i: top[i][0])
+        if score > top[worst][0]:
+            top[worst] = (score, list(current))
+
+    offer(current_score)
+    temperature = 0.05 * abs(current_score) + 1.0
+    alpha = 0.001 ** (1.0 / iterations) if iterations > 0 else 1.0
+    if movable:
+        for _ in range(iterations):
+            f = movable[rng.next_u64() % len(movable)]
+            r = rng.next_u64() % (len(problem.domains[f]) - 1)
+            old = current[f]
+            current[f] = r + 1 if r >= old else r
+            score = evaluate(problem, current)
+            threshold = current_score + temperature * math.log(1.0 - rng.next_float())
+            if score > threshold:
+                current_score = score
+                offer(score)
+            else:
+                current[f] = old
+            temperature *= alpha
+    return top
+
+
+def _merge(results: List[Tuple[float, List[int]]], top_k: int) -> List[Tuple[float, List[int]]]:
+    merged: List[Tuple[float, List[int]]] = []
+    for score, assignment in sorted(results, key=lambda item: (-item[0], item[1])):
+        if not merged or merged[-1][1] != assignment:
+            merged.append((score, assignment))
+    return merged[:top_k]
+
+
+def local_search_reference(
+    problem: EncodedProblem,
+    initial: Sequence[int],
+    iterations: int,
+    threads: int = 1,
+    seed: int = 0,
+    top_k: int = 8,
+) -> List[Tuple[float, List[int]]]:
+    """
+    EN:
+        Pure-Python reference of `optimizer_core.local_search`: `threads`
+        independent annealing chains (run one after another), merged into
+        the best distinct (score, assignment) pairs, best first.
+
+    TR:
+        `optimizer_core.local_search`'ün saf Python referansı: `threads`
+        bağımsız tavlama zinciri (art arda çalıştırılır), en iyi farklı
+        (skor, atama) çiftleri halinde birleştirilir; en iyisi önce.
+    """
+    results: List[Tuple[float, List[int]]] = []
+    for thread in range(max(threads, 1)):
+        results.extend(_anneal(problem, initial, iterations, _thread_seed(seed, thread), top_k))
+    return _merge(results, top_k)
+
+
+def native_available() -> bool:
+    return getattr(optimizer_core, "local_search", None) is not None
+
+
+def local_search(
+    problem: EncodedProblem,
+    initial: Sequence[int],
+    iterations: int,
+    threads: int = 1,
+    seed: int = 0,
+    top_k: int = 8,
+) -> List[Tuple[float, List[int]]]:
+    """
+    EN:
+        Run the native engine when available, else the Python reference.
+        Both return the same result for the same arguments.
+
+    TR:
+        Varsa native motoru, yoksa Python referansını çalıştırır. Aynı
+        argümanlar için ikisi de aynı sonucu döndürür.
+    """
+    if len(initial) != len(problem.domains):
+        raise ValueError(
+            f"Initial assignment has {len(initial)} entries for {len(problem.domains)} features."
+        )
+    if native_available():
+        return [
+            (score, list(assignment))
+            for score, assignment in optimizer_core.local_search(
+                *problem.args(), list(initial), iterations, threads, seed & _MASK, top_k
+            )
+        ]
+    return local_search_reference(problem, initial, iterations, threads, seed, top_k)
+
+
+class NativeStrategy(SearchStrategy):
+    """
+    EN:
+        Portfolio member backed by the native engine. Each step anneals a
+        chunk of moves from the shared incumbent on every core (one chain
+        in the Python fallback) and feeds the top placements back through
+        the regular evaluator. The chunk size adapts so a step takes about
+        `step_s` seconds. Annealing moves are counted as `iterations`;
+        only the placements scored by the evaluator count as evaluations.
+
+    TR:
+        Native motorla çalışan portföy üyesi. Her adım, paylaşılan en iyi
+        çözümden başlayarak her çekirdekte (Python yedeğinde tek zincir)
+        bir hamle öbeği tavlar ve en iyi yerleşimleri normal
+        değerlendiriciye geri verir. Öbek boyutu, bir adım yaklaşık
+        `step_s` saniye sürecek şekilde uyarlanır. Tavlama hamleleri
+        `iterations` olarak sayılır; yalnızca değerlendiricinin skorladığı
+        yerleşimler değerlendirme sayılır.
+    """
+
+    name = "native"
+    step_s = 0.05
+    top_k = 8
+    state_fields = ("current", "chunk")
+
+    def start(self, initial: Assignment) -> None:
+        self._setup()
+        self.current = list(initial)
+        self.evaluator.evaluate(self.current)
+        self.chunk = 256
+
+    def restore(self, state: Dict) -> None:
+        super().restore(state)
+        self._setup()
+
+    def _setup(self) -> None:
+        self.problem = encode(self.space)
+        self.threads = (os.cpu_count() or 1) if native_available() else 1
+
+    def step(self) -> None:
+        started = time.monotonic()
+        initial = self._incumbent_or(self.current)
+        results = local_search(
+            self.problem,
+            initial,
+            self.chunk,
+            threads=self.threads,
+            seed=self.rng.getrandbits(63),
+            top_k=self.top_k,
+        )
+        self.iterations += self.chunk * self.threads
+        for _, assignment in results:
+            self.evaluator.evaluate(assignment)
+        if results:
+            self.current = results[0][1]
+
+        elapsed = time.monotonic() - started
+        if elapsed < self.step_s / 2:
+            self.chunk *= 2
+        elif elapsed > self.step_s * 2 and self.chunk > 64:
+            self.chunk //= 2
+
+
+STRATEGIES[NativeStrategy.name] = NativeStrategy
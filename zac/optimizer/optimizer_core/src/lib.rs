@@ -1,12 +1,60 @@
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
+mod search;
+
 #[pyfunction]
 fn add_numbers(a: i64, b: i64) -> PyResult<i64> {
     Ok(a + b)
 }
 
+/// Parallel annealing over an encoded problem (see `zac.optimizer.local_search.encode`).
+/// Runs `threads` chains of `iterations` moves with the GIL released and
+/// returns the best distinct `(score, assignment)` pairs, best first.
+#[pyfunction]
+#[pyo3(signature = (
+    domains, module_cost, module_power, module_penalty, module_ethernet,
+    zone_budget, zone_latency, distance, weights, initial,
+    iterations, threads, seed, top_k
+))]
+#[allow(clippy::too_many_arguments)]
+fn local_search(
+    py: Python,
+    domains: Vec<Vec<(usize, usize)>>,
+    module_cost: Vec<f64>,
+    module_power: Vec<f64>,
+    module_penalty: Vec<f64>,
+    module_ethernet: Vec<bool>,
+    zone_budget: Vec<f64>,
+    zone_latency: Vec<f64>,
+    distance: Vec<Vec<f64>>,
+    weights: (f64, f64, f64),
+    initial: Vec<usize>,
+    iterations: u64,
+    threads: usize,
+    seed: u64,
+    top_k: usize,
+) -> PyResult<Vec<(f64, Vec<usize>)>> {
+    let problem = search::Problem {
+        domains,
+        module_cost,
+        module_power,
+        module_penalty,
+        module_ethernet,
+        zone_budget,
+        zone_latency,
+        distance,
+        power_weight: weights.0,
+        harness_weight: weights.1,
+        latency_weight: weights.2,
+    };
+    problem.validate(&initial).map_err(PyValueError::new_err)?;
+    Ok(py.allow_threads(|| search::local_search(&problem, &initial, iterations, threads, seed, top_k)))
+}
+
 #[pymodule]
 fn optimizer_core(py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(add_numbers, m)?)?;
+    m.add_function(wrap_pyfunction!(local_search, m)?)?;
     Ok(())
-}
\ No newline at end of file
+}
@@ -0,0 +1,237 @@
+//! Native local search over compact placement problems.
+//!
+//! EN: Multi-threaded simulated annealing on the encoded problem built by
+//!     `zac.optimizer.local_search.encode`. The objective, RNG and move
+//!     sequence mirror the pure-Python reference move for move, so both
+//!     return the same placements for the same seed.
+//!
+//! TR: `zac.optimizer.local_search.encode` ile üretilen kompakt problem
+//!     üzerinde çok iş parçacıklı benzetilmiş tavlama. Amaç fonksiyonu,
+//!     RNG ve hamle dizisi saf Python referansıyla birebir aynıdır; aynı
+//!     tohum için ikisi de aynı yerleşimleri döndürür.
+
+/// Compact problem encoding (indices into module/zone tables).
+pub struct Problem {
+    /// Per feature: feasible (module, zone) options.
+    pub domains: Vec<Vec<(usize, usize)>>,
+    pub module_cost: Vec<f64>,
+    pub module_power: Vec<f64>,
+    /// Redundancy shortfall per module (already multiplied by its weight).
+    pub module_penalty: Vec<f64>,
+    /// `true` when links towards the module use Ethernet, `false` for CAN.
+    pub module_ethernet: Vec<bool>,
+    pub zone_budget: Vec<f64>,
+    /// Zone latency budget in ms, NaN when undefined.
+    pub zone_latency: Vec<f64>,
+    /// Zone-to-zone harness length in meters.
+    pub distance: Vec<Vec<f64>>,
+    pub power_weight: f64,
+    pub harness_weight: f64,
+    pub latency_weight: f64,
+}
+
+impl Problem {
+    /// Check table sizes and indices so the search loop can index freely.
+    pub fn validate(&self, initial: &[usize]) -> Result<(), String> {
+        let modules = self.module_cost.len();
+        let zones = self.zone_budget.len();
+        if self.module_power.len() != modules
+            || self.module_penalty.len() != modules
+            || self.module_ethernet.len() != modules
+        {
+            return Err("module tables must have the same length".into());
+        }
+        if self.zone_latency.len() != zones
+            || self.distance.len() != zones
+            || self.distance.iter().any(|row| row.len() != zones)
+        {
+            return Err("zone tables must have the same length".into());
+        }
+        if initial.len() != self.domains.len() {
+            return Err(format!(
+                "initial assignment has {} entries for {} features",
+                initial.len(),
+                self.domains.len()
+            ));
+        }
+        for (f, domain) in self.domains.iter().enumerate() {
+            if initial[f] >= domain.len() {
+                return Err(format!("initial option {} out of range for feature {}", initial[f], f));
+            }
+            if domain.iter().any(|&(m, z)| m >= modules || z >= zones) {
+                return Err(format!("domain of feature {} references an unknown module or zone", f));
+            }
+        }
+        Ok(())
+    }
+}
+
+/// SplitMix64, identical to the Python reference.
+pub struct SplitMix64 {
+    state: u64,
+}
+
+impl SplitMix64 {
+    pub fn new(seed: u64) -> Self {
+        SplitMix64 { state: seed }
+    }
+
+    pub fn next_u64(&mut self) -> u64 {
+        self.state = self.state.wrapping_add(0x9E37_79B9_7F4A_7C15);
+        let mut z = self.state;
+        z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+        z ^ (z >> 31)
+    }
+
+    /// Uniform float in [0, 1) with 53 bits of precision.
+    pub fn next_f64(&mut self) -> f64 {
+        (self.next_u64() >> 11) as f64 * (1.0 / 9_007_199_254_740_992.0)
+    }
+}
+
+pub fn thread_seed(seed: u64, thread: usize) -> u64 {
+    seed.wrapping_add((thread as u64 + 1).wrapping_mul(0xD1B5_4A32_D192_ED03))
+}
+
+/// Exact score of an assignment, summed in the same order as the Python scorer.
+pub fn evaluate(p: &Problem, assignment: &[usize]) -> f64 {
+    let mut cost = 0.0;
+    let mut load = vec![0.0; p.zone_budget.len()];
+    let mut redundancy = 0.0;
+    for (f, &option) in assignment.iter().enumerate() {
+        let (m, z) = p.domains[f][option];
+        cost += p.module_cost[m];
+        load[z] += p.module_power[m];
+        redundancy += p.module_penalty[m];
+    }
+
+    let mut power = 0.0;
+    for (z, &l) in load.iter().enumerate() {
+        let over = l - p.zone_budget[z];
+        if over > 0.0 {
+            power += over * p.power_weight;
+        }
+    }
+
+    let mut length = 0.0;
+    let mut latency = 0.0;
+    for f in 1..assignment.len() {
+        let (_, src) = p.domains[f - 1][assignment[f - 1]];
+        let (m, dst) = p.domains[f][assignment[f]];
+        let meters = p.distance[src][dst];
+        length += meters;
+        let (base, per_meter) = if p.module_ethernet[m] { (0.5, 0.02) } else { (2.0, 0.05) };
+        let estimated = 0.0 + base + per_meter * meters;
+        let (a, b) = (p.zone_latency[src], p.zone_latency[dst]);
+        let budget = match (a.is_nan(), b.is_nan()) {
+            (true, true) => f64::NAN,
+            (false, true) => a,
+            (true, false) => b,
+            (false, false) => a.min(b),
+        };
+        if !budget.is_nan() && estimated > budget {
+            latency += (estimated - budget) * p.latency_weight;
+        }
+    }
+    let harness = if assignment.len() > 1 { length * p.harness_weight } else { 0.0 };
+
+    let penalty = 0.0 + power + harness + latency + redundancy;
+    -cost - penalty
+}
+
+struct TopK {
+    k: usize,
+    items: Vec<(f64, Vec<usize>)>,
+}
+
+impl TopK {
+    fn offer(&mut self, score: f64, assignment: &[usize]) {
+        if self.k == 0 || self.items.iter().any(|(_, a)| a.as_slice() == assignment) {
+            return;
+        }
+        if self.items.len() < self.k {
+            self.items.push((score, assignment.to_vec()));
+            return;
+        }
+        let mut worst = 0;
+        for i in 1..self.items.len() {
+            if self.items[i].0 < self.items[worst].0 {
+                worst = i;
+            }
+        }
+        if score > self.items[worst].0 {
+            self.items[worst] = (score, assignment.to_vec());
+        }
+    }
+}
+
+/// One annealing run; returns its top-k distinct placements.
+pub fn anneal(
+    p: &Problem,
+    initial: &[usize],
+    iterations: u64,
+    seed: u64,
+    top_k: usize,
+) -> Vec<(f64, Vec<usize>)> {
+    let mut rng = SplitMix64::new(seed);
+    let movable: Vec<usize> = (0..p.domains.len()).filter(|&f| p.domains[f].len() > 1).collect();
+    let mut current = initial.to_vec();
+    let mut current_score = evaluate(p, &current);
+    let mut top = TopK { k: top_k, items: Vec::new() };
+    top.offer(current_score, &current);
+
+    let t_start = 0.05 * current_score.abs() + 1.0;
+    let alpha = if iterations > 0 { 0.001f64.powf(1.0 / iterations as f64) } else { 1.0 };
+    let mut temperature = t_start;
+
+    if !movable.is_empty() {
+        for _ in 0..iterations {
+            let f = movable[(rng.next_u64() % movable.len() as u64) as usize];
+            let size = p.domains[f].len() as u64;
+            let r = (rng.next_u64() % (size - 1)) as usize;
+            let old = current[f];
+            current[f] = if r >= old { r + 1 } else { r };
+            let score = evaluate(p, &current);
+            let threshold = current_score + temperature * (1.0 - rng.next_f64()).ln();
+            if score > threshold {
+                current_score = score;
+                top.offer(score, &current);
+            } else {
+                current[f] = old;
+            }
+            temperature *= alpha;
+        }
+    }
+    top.items
+}
+
+/// Merge per-thread results: best first, ties broken by assignment, deduplicated.
+pub fn merge(mut all: Vec<(f64, Vec<usize>)>, top_k: usize) -> Vec<(f64, Vec<usize>)> {
+    all.sort_by(|a, b| b.0.total_cmp(&a.0).then_with(|| a.1.cmp(&b.1)));
+    all.dedup_by(|a, b| a.1 == b.1);
+    all.truncate(top_k);
+    all
+}
+
+/// Run `threads` independent annealing chains in parallel.
+pub fn local_search(
+    p: &Problem,
+    initial: &[usize],
+    iterations: u64,
+    threads: usize,
+    seed: u64,
+    top_k: usize,
+) -> Vec<(f64, Vec<usize>)> {
+    let threads = threads.max(1);
+    let mut all = Vec::new();
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..threads)
+            .map(|t| scope.spawn(move || anneal(p, initial, iterations, thread_seed(seed, t), top_k)))
+            .collect();
+        for handle in handles {
+            all.extend(handle.join().expect("local search thread panicked"));
+        }
+    });
+    merge(all, top_k)
+}